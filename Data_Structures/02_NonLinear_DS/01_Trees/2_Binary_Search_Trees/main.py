@@ -1,19 +1,533 @@
 """
 Topic: 04_Data Structures — Trees & Hierarchical
-Subtopic: Binary Search
-Description: Generic example stub.
+Subtopic: Binary Search Trees
+Description: Bucketed sorted list / set / map, the CPython-friendly stand-in
+for a pointer-based BST, with positional access and range scans.
 
-TODO:
-- Read the README.md in this folder.
-- Run this file to see examples, then extend experiments.
+Values live in a list of sorted buckets of bounded size, plus a list of each
+bucket's maximum. Locating a value is two ``bisect`` calls (one over the
+maxima, one inside a bucket), and inserting shifts at most ``2 * load``
+pointers with a ``memmove``, which in practice beats allocating and chasing
+tree nodes. A bucket that grows past ``2 * load`` is split in half and one
+that shrinks below ``load // 2`` is merged into its neighbour, so there are
+always O(n / load) buckets.
+
+Index access (``sl[i]``, ``index``, ``pop(i)``) goes through a Fenwick tree
+over the bucket lengths: O(log(n / load)) per lookup. Inserts and deletes
+update it in place; a split or merge only marks it stale, and it is rebuilt
+in O(n / load) the next time a position is needed.
+
+``update`` sorts the incoming values once. If they are large compared to the
+current contents, everything is merged with one ``sort`` (timsort merges the
+two runs) and re-chunked; otherwise they are added one by one.
+
+``SortedSet`` and ``SortedDict`` wrap a ``SortedList`` of keys with a hash
+set / dict for O(1) membership and value lookup.
 """
 from __future__ import annotations
-from typing import *
-import sys, os, math, json, re, pathlib, itertools, collections, functools, logging, datetime
-# Optional third-party (uncomment if installed)
-# import numpy as np
-# import pandas as pd
+
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_LOAD = 500
+
+
+class SortedList:
+    """Sorted sequence of (possibly repeated) comparable values."""
+
+    def __init__(self, iterable: Iterable = (), load: int = DEFAULT_LOAD) -> None:
+        if load < 4:
+            raise ValueError("load must be at least 4")
+        self._load = load
+        self._lists: List[list] = []
+        self._maxes: list = []
+        self._len = 0
+        self._fen: Optional[List[int]] = None
+        self.update(iterable)
+
+    # ------------------------------------------------------------ index tree
+    def _build_fen(self) -> List[int]:
+        fen = [len(b) for b in self._lists]
+        for i in range(len(fen)):
+            j = i | (i + 1)
+            if j < len(fen):
+                fen[j] += fen[i]
+        self._fen = fen
+        return fen
+
+    def _fen_add(self, pos: int, delta: int) -> None:
+        fen = self._fen
+        if fen is None:
+            return
+        while pos < len(fen):
+            fen[pos] += delta
+            pos |= pos + 1
+
+    def _locate(self, idx: int) -> Tuple[int, int]:
+        """(bucket, offset) of global position ``idx`` (0 <= idx < len)."""
+        fen = self._fen if self._fen is not None else self._build_fen()
+        pos = -1
+        step = 1 << (len(fen).bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt < len(fen) and fen[nxt] <= idx:
+                idx -= fen[nxt]
+                pos = nxt
+            step >>= 1
+        return pos + 1, idx
+
+    def _offset(self, bucket: int) -> int:
+        """Number of values in buckets before ``bucket``."""
+        fen = self._fen if self._fen is not None else self._build_fen()
+        total = 0
+        i = bucket - 1
+        while i >= 0:
+            total += fen[i]
+            i = (i & (i + 1)) - 1
+        return total
+
+    # ------------------------------------------------------------ mutation
+    def _split(self, pos: int) -> None:
+        bucket = self._lists[pos]
+        half = bucket[self._load:]
+        del bucket[self._load:]
+        self._lists.insert(pos + 1, half)
+        self._maxes.insert(pos, bucket[-1])
+        self._fen = None
+
+    def _shrunk(self, pos: int) -> None:
+        lists, maxes = self._lists, self._maxes
+        bucket = lists[pos]
+        if not bucket:
+            del lists[pos], maxes[pos]
+            self._fen = None
+            return
+        maxes[pos] = bucket[-1]
+        if len(bucket) < self._load // 2 and len(lists) > 1:
+            left = pos - 1 if pos else pos
+            lists[left].extend(lists[left + 1])
+            maxes[left] = lists[left][-1]
+            del lists[left + 1], maxes[left + 1]
+            self._fen = None
+            if len(lists[left]) > 2 * self._load:
+                self._split(left)
+
+    def add(self, value: Any) -> None:
+        lists, maxes = self._lists, self._maxes
+        if not maxes:
+            lists.append([value])
+            maxes.append(value)
+            self._len = 1
+            self._fen = None
+            return
+        pos = bisect_right(maxes, value)
+        if pos == len(maxes):
+            pos -= 1
+            lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            insort(lists[pos], value)
+        self._len += 1
+        self._fen_add(pos, 1)
+        if len(lists[pos]) > 2 * self._load:
+            self._split(pos)
+
+    def discard(self, value: Any) -> bool:
+        """Remove one occurrence of ``value``; False if absent."""
+        maxes = self._maxes
+        pos = bisect_left(maxes, value)
+        if pos == len(maxes):
+            return False
+        bucket = self._lists[pos]
+        i = bisect_left(bucket, value)
+        if bucket[i] != value:
+            return False
+        del bucket[i]
+        self._len -= 1
+        self._fen_add(pos, -1)
+        self._shrunk(pos)
+        return True
+
+    def remove(self, value: Any) -> None:
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in list")
+
+    def pop(self, index: int = -1) -> Any:
+        pos, i = self._locate(self._normalize(index))
+        value = self._lists[pos].pop(i)
+        self._len -= 1
+        self._fen_add(pos, -1)
+        self._shrunk(pos)
+        return value
+
+    def update(self, iterable: Iterable) -> None:
+        values = sorted(iterable)
+        if not values:
+            return
+        if 4 * len(values) >= self._len:
+            if self._len:
+                values = list(chain.from_iterable(self._lists)) + values
+                values.sort()
+            load = self._load
+            self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+            self._maxes = [b[-1] for b in self._lists]
+            self._len = len(values)
+            self._fen = None
+        else:
+            for v in values:
+                self.add(v)
+
+    def clear(self) -> None:
+        self._lists, self._maxes, self._len, self._fen = [], [], 0, None
+
+    # ------------------------------------------------------------ queries
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def __getitem__(self, index: int) -> Any:
+        pos, i = self._locate(self._normalize(index))
+        return self._lists[pos][i]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, value: Any) -> bool:
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        return bucket[bisect_left(bucket, value)] == value
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator:
+        return chain.from_iterable(reversed(b) for b in reversed(self._lists))
+
+    def bisect_left(self, value: Any) -> int:
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value: Any) -> int:
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_right(self._lists[pos], value)
+
+    def index(self, value: Any) -> int:
+        i = self.bisect_left(value)
+        if i == self._len or self[i] != value:
+            raise ValueError(f"{value!r} not in list")
+        return i
+
+    def count(self, value: Any) -> int:
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def irange(self, lo: Any = None, hi: Any = None, inclusive: Tuple[bool, bool] = (True, True),
+               reverse: bool = False) -> Iterator:
+        """Values in ``[lo, hi]`` (bounds per ``inclusive``; None = unbounded)."""
+        lists, maxes = self._lists, self._maxes
+        if not maxes:
+            return iter(())
+        if lo is None:
+            p0, i0 = 0, 0
+        else:
+            find = bisect_left if inclusive[0] else bisect_right
+            p0 = find(maxes, lo)
+            if p0 == len(maxes):
+                return iter(())
+            i0 = find(lists[p0], lo)
+        if hi is None:
+            p1, i1 = len(maxes) - 1, len(lists[-1])
+        else:
+            find = bisect_right if inclusive[1] else bisect_left
+            p1 = find(maxes, hi)
+            if p1 == len(maxes):
+                p1, i1 = len(maxes) - 1, len(lists[-1])
+            else:
+                i1 = find(lists[p1], hi)
+        if (p0, i0) >= (p1, i1):
+            return iter(())
+        if p0 == p1:
+            parts = [lists[p0][i0:i1]]
+        else:
+            parts = [lists[p0][i0:]] + lists[p0 + 1:p1] + [lists[p1][:i1]]
+        if reverse:
+            return chain.from_iterable(reversed(b) for b in reversed(parts))
+        return chain.from_iterable(parts)
+
+    def islice(self, start: int = 0, stop: Optional[int] = None) -> Iterator:
+        """Values at positions ``start..stop-1`` without copying the list."""
+        stop = self._len if stop is None else min(stop, self._len)
+        if start >= stop:
+            return iter(())
+        p0, i0 = self._locate(start)
+        p1, i1 = self._locate(stop - 1)
+        lists = self._lists
+        if p0 == p1:
+            return iter(lists[p0][i0:i1 + 1])
+        return chain(lists[p0][i0:], chain.from_iterable(lists[p0 + 1:p1]), lists[p1][:i1 + 1])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class SortedSet:
+    """Sorted set: hash-set membership plus a ``SortedList`` for order."""
+
+    def __init__(self, iterable: Iterable = (), load: int = DEFAULT_LOAD) -> None:
+        self._set = set(iterable)
+        self._list = SortedList(self._set, load)
+
+    def add(self, value: Any) -> None:
+        if value not in self._set:
+            self._set.add(value)
+            self._list.add(value)
+
+    def discard(self, value: Any) -> None:
+        if value in self._set:
+            self._set.remove(value)
+            self._list.discard(value)
+
+    def update(self, iterable: Iterable) -> None:
+        new = {v for v in iterable if v not in self._set}
+        self._set |= new
+        self._list.update(new)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._set
+
+    def __len__(self) -> int:
+        return len(self._set)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._list)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._list[index]
+
+    def irange(self, lo: Any = None, hi: Any = None, inclusive: Tuple[bool, bool] = (True, True),
+               reverse: bool = False) -> Iterator:
+        return self._list.irange(lo, hi, inclusive, reverse)
+
+    def __repr__(self) -> str:
+        return f"SortedSet({list(self._list)!r})"
+
+
+class SortedDict:
+    """Mapping iterated in key order, with positional and range access."""
+
+    def __init__(self, items: Iterable[Tuple[Any, Any]] = (), load: int = DEFAULT_LOAD) -> None:
+        self._dict: Dict[Any, Any] = dict(items)
+        self._keys = SortedList(self._dict, load)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key not in self._dict:
+            self._keys.add(key)
+        self._dict[key] = value
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._dict[key]
+
+    def __delitem__(self, key: Any) -> None:
+        del self._dict[key]
+        self._keys.remove(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._dict.get(key, default)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self._dict:
+            self._keys.remove(key)
+            return self._dict.pop(key)
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def update(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        if isinstance(items, dict):
+            items = items.items()
+        d = self._dict
+        new = []
+        for k, v in items:
+            if k not in d:
+                new.append(k)
+            d[k] = v
+        self._keys.update(set(new))
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._dict
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._keys)
+
+    def keys(self) -> SortedList:
+        return self._keys
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        d = self._dict
+        return ((k, d[k]) for k in self._keys)
+
+    def peekitem(self, index: int = -1) -> Tuple[Any, Any]:
+        key = self._keys[index]
+        return key, self._dict[key]
+
+    def popitem(self, index: int = -1) -> Tuple[Any, Any]:
+        key = self._keys.pop(index)
+        return key, self._dict.pop(key)
+
+    def irange(self, lo: Any = None, hi: Any = None, inclusive: Tuple[bool, bool] = (True, True),
+               reverse: bool = False) -> Iterator:
+        """Keys in range; see ``SortedList.irange``."""
+        return self._keys.irange(lo, hi, inclusive, reverse)
+
+    def irange_items(self, lo: Any = None, hi: Any = None,
+                     inclusive: Tuple[bool, bool] = (True, True)) -> Iterator[Tuple[Any, Any]]:
+        d = self._dict
+        return ((k, d[k]) for k in self._keys.irange(lo, hi, inclusive))
+
+    def __repr__(self) -> str:
+        return f"SortedDict({list(self.items())!r})"
+
+
+class _Node:
+    __slots__ = ("key", "value", "left", "right")
+
+    def __init__(self, key: Any, value: Any) -> None:
+        self.key, self.value = key, value
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+
+
+class NodeBST:
+    """Plain unbalanced pointer BST (baseline)."""
+
+    def __init__(self) -> None:
+        self.root: Optional[_Node] = None
+        self.size = 0
+
+    def insert(self, key: Any, value: Any = None) -> None:
+        if self.root is None:
+            self.root = _Node(key, value)
+            self.size = 1
+            return
+        x = self.root
+        while True:
+            if key < x.key:
+                if x.left is None:
+                    x.left = _Node(key, value)
+                    break
+                x = x.left
+            elif key > x.key:
+                if x.right is None:
+                    x.right = _Node(key, value)
+                    break
+                x = x.right
+            else:
+                x.value = value
+                return
+        self.size += 1
+
+    def range(self, lo: Any, hi: Any) -> Iterator:
+        """Keys in ``[lo, hi]`` in order (iterative in-order walk)."""
+        stack = []
+        x = self.root
+        while stack or x is not None:
+            if x is not None:
+                if x.key >= lo:
+                    stack.append(x)
+                    x = x.left
+                else:
+                    x = x.right
+                continue
+            x = stack.pop()
+            if x.key > hi:
+                return
+            yield x.key
+            x = x.right
+
+
+def benchmark(n: int = 100_000, queries: int = 2_000, width: int = 1_000, seed: int = 0) -> None:
+    """Order-book style load: random inserts interleaved with range scans."""
+    rng = random.Random(seed)
+    keys = [rng.random() for _ in range(n)]
+    lows = [rng.random() for _ in range(queries)]
+    every = n // queries
+    span = width / n
+    print(f"{n} inserts, a range query of ~{width} keys every {every} inserts")
+
+    def run(name, insert, scan):
+        t0 = time.perf_counter()
+        total = 0
+        for i, k in enumerate(keys):
+            insert(k)
+            if i % every == every - 1:
+                lo = lows[i // every]
+                total += sum(1 for _ in scan(lo, lo + span))
+        print(f"  {name:<22} {time.perf_counter() - t0:7.2f} s  ({total} keys scanned)")
+        return total
+
+    sd = SortedDict()
+    ref = run("SortedDict", lambda k: sd.__setitem__(k, None), lambda a, b: sd.irange(a, b))
+    tree = NodeBST()
+    assert run("node BST", tree.insert, tree.range) == ref
+    plain: Dict[float, None] = {}
+    cache: List[Optional[list]] = [None]
+
+    def dict_insert(k):
+        plain[k] = None
+        cache[0] = None
+
+    def dict_scan(a, b):
+        if cache[0] is None:
+            cache[0] = sorted(plain)
+        ks = cache[0]
+        return ks[bisect_left(ks, a):bisect_right(ks, b)]
+
+    assert run("dict + sorted", dict_insert, dict_scan) == ref
+
+    t0 = time.perf_counter()
+    sl = SortedList()
+    sl.update(keys)
+    bulk = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for i in range(0, n, max(1, n // 100_000)):
+        sl[i]
+    print(f"  bulk update {bulk:.2f} s, {min(n, 100_000)} index lookups {time.perf_counter() - t0:.2f} s")
+
+
 def demo():
-    print("Fill in your examples here.")
+    sl = SortedList([5, 1, 4, 1, 3], load=4)
+    sl.add(2)
+    print("list:", list(sl), "sl[2] =", sl[2], "index(4) =", sl.index(4))
+    print("irange(2, 4):", list(sl.irange(2, 4)), "reverse:", list(sl.irange(2, 4, reverse=True)))
+    sl.remove(1)
+    print("after remove(1):", sl)
+    print("pop() =", sl.pop(), "->", sl)
+    book = SortedDict([(101.5, 10), (100.0, 3), (102.25, 7)])
+    book.update({99.75: 4, 100.0: 5})
+    print("book:", book)
+    print("asks 100..102:", list(book.irange_items(100, 102)), "best:", book.peekitem(0))
+    s = SortedSet([3, 1, 2, 3])
+    s.update([0, 5, 2])
+    print("set:", s, "s[-1] =", s[-1])
+
+
 if __name__ == "__main__":
-    demo()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,5 +1,506 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 04_Data Structures — Trees & Hierarchical
+Subtopic: Balanced / augmented BSTs (AVL, treaps)
+Description: Join-based treap and AVL tree over array node pools, with O(n)
+bulk build, split/join and O(m log(n/m + 1)) union, intersection and
+difference, plus pluggable subtree aggregates.
+
+Nodes are indices into parallel lists (key, value, left, right, size,
+aggregate and the balance field: a priority for treaps, a height for AVL).
+Index 0 is a shared nil sentinel with size 0 and the identity aggregate, so
+no code path needs a None check. Freed nodes go on a free list and are
+reused before the lists grow. One pool holds any number of sets; a set is
+just the root index returned by the operations.
+
+Everything is built on a single balancing primitive, ``join(l, m, r)``
+(all keys of ``l`` < key of node ``m`` < all keys of ``r``), following
+Blelloch, Ferizovic and Sun's "Just Join": split, insert and delete, and the
+divide-and-conquer set operations, which split the larger tree by the root
+of the smaller one and recurse on both halves. Only ``join`` differs between
+treaps and AVL trees.
+
+Set operations consume their arguments: nodes are relinked into the result
+or returned to the free list, never copied.
+
+An ``Augment`` is a monoid (``combine``, ``identity``) over node values;
+``SUM``, ``MIN`` and ``MAX`` are provided. Aggregates are maintained by every
+rotation and join, so ``aggregate`` and ``range_aggregate`` are O(1) and
+O(log n).
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+NIL = 0
+
+
+class Augment(NamedTuple):
+    combine: Callable[[Any, Any], Any]
+    identity: Any
+
+
+SUM = Augment(lambda a, b: a + b, 0)
+MIN = Augment(min, float("inf"))
+MAX = Augment(max, float("-inf"))
+
+
+class _JoinTree:
+    """Node pool plus the join-based algorithms shared by every balancing scheme."""
+
+    def __init__(self, augment: Augment = SUM) -> None:
+        self.augment = augment
+        self.key: List[Any] = [None]
+        self.val: List[Any] = [augment.identity]
+        self.left = [NIL]
+        self.right = [NIL]
+        self.size = [0]
+        self.agg: List[Any] = [augment.identity]
+        self._free: List[int] = []
+
+    # ------------------------------------------------------------ pool
+    def _alloc(self, key: Any, value: Any) -> int:
+        if self._free:
+            x = self._free.pop()
+            self.key[x], self.val[x] = key, value
+            self.left[x] = self.right[x] = NIL
+            self.size[x], self.agg[x] = 1, value
+        else:
+            x = len(self.key)
+            self.key.append(key)
+            self.val.append(value)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.size.append(1)
+            self.agg.append(value)
+            self._grow()
+        self._init_node(x)
+        return x
+
+    def _release(self, x: int) -> None:
+        self.key[x] = self.val[x] = self.agg[x] = None
+        self._free.append(x)
+
+    def free(self, root: int) -> None:
+        """Return every node of a tree to the pool."""
+        stack = [root]
+        while stack:
+            x = stack.pop()
+            if x != NIL:
+                stack.append(self.left[x])
+                stack.append(self.right[x])
+                self._release(x)
+
+    def _update(self, x: int) -> None:
+        l, r = self.left[x], self.right[x]
+        self.size[x] = self.size[l] + self.size[r] + 1
+        op = self.augment.combine
+        self.agg[x] = op(op(self.agg[l], self.val[x]), self.agg[r])
+
+    # Balancing hooks.
+    def _grow(self) -> None:
+        raise NotImplementedError
+
+    def _init_node(self, x: int) -> None:
+        raise NotImplementedError
+
+    def _join(self, l: int, m: int, r: int) -> int:
+        raise NotImplementedError
+
+    def build(self, keys: Sequence[Any], values: Optional[Sequence[Any]] = None) -> int:
+        raise NotImplementedError
+
+    def _check_sorted(self, keys: Sequence[Any]) -> None:
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError("build() needs strictly increasing keys")
+
+    # ------------------------------------------------------------ split / join
+    def _split(self, t: int, k: Any) -> Tuple[int, int, int]:
+        """``(l, node with key k or NIL, r)``; the found node is detached."""
+        if t == NIL:
+            return NIL, NIL, NIL
+        l, r, kt = self.left[t], self.right[t], self.key[t]
+        if k == kt:
+            self.left[t] = self.right[t] = NIL
+            self._update(t)
+            return l, t, r
+        if k < kt:
+            ll, m, lr = self._split(l, k)
+            return ll, m, self._join(lr, t, r)
+        rl, m, rr = self._split(r, k)
+        return self._join(l, t, rl), m, rr
+
+    def _split_last(self, t: int) -> Tuple[int, int]:
+        r = self.right[t]
+        if r == NIL:
+            l = self.left[t]
+            self.left[t] = NIL
+            self._update(t)
+            return l, t
+        rest, last = self._split_last(r)
+        return self._join(self.left[t], t, rest), last
+
+    def join2(self, l: int, r: int) -> int:
+        """Concatenate two trees with every key of ``l`` below every key of ``r``."""
+        if l == NIL:
+            return r
+        rest, last = self._split_last(l)
+        return self._join(rest, last, r)
+
+    def split(self, t: int, k: Any) -> Tuple[int, bool, int]:
+        """``(keys < k, k was present, keys > k)``."""
+        l, m, r = self._split(t, k)
+        if m != NIL:
+            self._release(m)
+        return l, m != NIL, r
+
+    # ------------------------------------------------------------ set algebra
+    def union(self, a: int, b: int) -> int:
+        """Keys in either set; a shared key keeps its value from ``b``."""
+        return self._union(a, b, False)
+
+    def _union(self, a: int, b: int, swapped: bool) -> int:
+        """``union`` where ``swapped`` means ``a`` holds the caller's ``b`` nodes."""
+        if a == NIL:
+            return b
+        if b == NIL:
+            return a
+        if self.size[a] < self.size[b]:
+            a, b = b, a  # split the larger tree by the smaller one's keys
+            swapped = not swapped
+        bl, br = self.left[b], self.right[b]
+        al, dup, ar = self._split(a, self.key[b])
+        if dup != NIL:
+            if swapped:
+                self.val[b] = self.val[dup]
+            self._release(dup)
+        return self._join(self._union(al, bl, swapped), b, self._union(ar, br, swapped))
+
+    def intersection(self, a: int, b: int) -> int:
+        if a == NIL or b == NIL:
+            self.free(a)
+            self.free(b)
+            return NIL
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        bl, br = self.left[b], self.right[b]
+        al, hit, ar = self._split(a, self.key[b])
+        left = self.intersection(al, bl)
+        right = self.intersection(ar, br)
+        if hit != NIL:
+            self._release(hit)
+            return self._join(left, b, right)
+        self._release(b)
+        return self.join2(left, right)
+
+    def difference(self, a: int, b: int) -> int:
+        """Keys of ``a`` that are not in ``b``."""
+        if a == NIL or b == NIL:
+            self.free(b)
+            return a
+        bl, br = self.left[b], self.right[b]
+        al, hit, ar = self._split(a, self.key[b])
+        if hit != NIL:
+            self._release(hit)
+        self._release(b)
+        return self.join2(self.difference(al, bl), self.difference(ar, br))
+
+    # ------------------------------------------------------------ single keys
+    def insert(self, t: int, k: Any, value: Any = None) -> int:
+        l, m, r = self._split(t, k)
+        if m == NIL:
+            m = self._alloc(k, k if value is None else value)
+        elif value is not None:
+            self.val[m] = value
+            self._update(m)
+        return self._join(l, m, r)
+
+    def delete(self, t: int, k: Any) -> int:
+        l, m, r = self._split(t, k)
+        if m != NIL:
+            self._release(m)
+        return self.join2(l, r)
+
+    def contains(self, t: int, k: Any) -> bool:
+        key, left, right = self.key, self.left, self.right
+        while t != NIL:
+            kt = key[t]
+            if k == kt:
+                return True
+            t = left[t] if k < kt else right[t]
+        return False
+
+    def keys(self, t: int) -> Iterator[Any]:
+        stack = []
+        while stack or t != NIL:
+            if t != NIL:
+                stack.append(t)
+                t = self.left[t]
+            else:
+                t = stack.pop()
+                yield self.key[t]
+                t = self.right[t]
+
+    def __len__(self) -> int:
+        return len(self.key) - 1 - len(self._free)
+
+    def aggregate(self, t: int) -> Any:
+        return self.agg[t]
+
+    def _agg_from(self, t: int, lo: Any) -> Any:
+        """Aggregate of keys >= lo in subtree ``t``."""
+        op, key, val, agg = self.augment.combine, self.key, self.val, self.agg
+        acc = self.augment.identity
+        while t != NIL:
+            if key[t] < lo:
+                t = self.right[t]
+            else:
+                acc = op(op(val[t], agg[self.right[t]]), acc)
+                t = self.left[t]
+        return acc
+
+    def _agg_to(self, t: int, hi: Any) -> Any:
+        """Aggregate of keys <= hi in subtree ``t``."""
+        op, key, val, agg = self.augment.combine, self.key, self.val, self.agg
+        acc = self.augment.identity
+        while t != NIL:
+            if key[t] > hi:
+                t = self.left[t]
+            else:
+                acc = op(acc, op(agg[self.left[t]], val[t]))
+                t = self.right[t]
+        return acc
+
+    def range_aggregate(self, t: int, lo: Any, hi: Any) -> Any:
+        """Aggregate of the values whose keys lie in ``[lo, hi]``."""
+        key = self.key
+        while t != NIL and not lo <= key[t] <= hi:
+            t = self.left[t] if hi < key[t] else self.right[t]
+        if t == NIL:
+            return self.augment.identity
+        op = self.augment.combine
+        return op(op(self._agg_from(self.left[t], lo), self.val[t]), self._agg_to(self.right[t], hi))
+
+
+class Treap(_JoinTree):
+    """Randomized treap: max-heap on random priorities, expected O(log n) depth."""
+
+    def __init__(self, augment: Augment = SUM, seed: Optional[int] = None) -> None:
+        super().__init__(augment)
+        self.prio = [-1.0]
+        self._rng = random.Random(seed)
+
+    def _grow(self) -> None:
+        self.prio.append(0.0)
+
+    def _init_node(self, x: int) -> None:
+        self.prio[x] = self._rng.random()
+
+    def _join(self, l: int, m: int, r: int) -> int:
+        prio, left, right = self.prio, self.left, self.right
+        if prio[m] > prio[l] and prio[m] > prio[r]:
+            left[m], right[m] = l, r
+            self._update(m)
+            return m
+        if prio[l] > prio[r]:
+            right[l] = self._join(right[l], m, r)
+            self._update(l)
+            return l
+        left[r] = self._join(l, m, left[r])
+        self._update(r)
+        return r
+
+    def build(self, keys: Sequence[Any], values: Optional[Sequence[Any]] = None) -> int:
+        """Cartesian tree of sorted keys on fresh random priorities, O(n)."""
+        self._check_sorted(keys)
+        prio, left, right = self.prio, self.left, self.right
+        spine: List[int] = []
+        for i, k in enumerate(keys):
+            x = self._alloc(k, k if values is None else values[i])
+            last = NIL
+            while spine and prio[spine[-1]] < prio[x]:
+                last = spine.pop()
+            left[x] = last
+            if spine:
+                right[spine[-1]] = x
+            spine.append(x)
+        if not spine:
+            return NIL
+        # Aggregates bottom-up: post-order from the root.
+        root = spine[0]
+        self._update_all(root)
+        return root
+
+    def _update_all(self, root: int) -> None:
+        order = []
+        stack = [root]
+        while stack:
+            x = stack.pop()
+            if x != NIL:
+                order.append(x)
+                stack.append(self.left[x])
+                stack.append(self.right[x])
+        for x in reversed(order):
+            self._update(x)
+
+
+class AVLTree(_JoinTree):
+    """AVL tree: sibling heights differ by at most one."""
+
+    def __init__(self, augment: Augment = SUM) -> None:
+        super().__init__(augment)
+        self.height = [0]
+
+    def _grow(self) -> None:
+        self.height.append(1)
+
+    def _init_node(self, x: int) -> None:
+        self.height[x] = 1
+
+    def _update(self, x: int) -> None:
+        super()._update(x)
+        h = self.height
+        a, b = h[self.left[x]], h[self.right[x]]
+        h[x] = (a if a > b else b) + 1
+
+    def _rotate_left(self, x: int) -> int:
+        y = self.right[x]
+        self.right[x] = self.left[y]
+        self.left[y] = x
+        self._update(x)
+        self._update(y)
+        return y
+
+    def _rotate_right(self, x: int) -> int:
+        y = self.left[x]
+        self.left[x] = self.right[y]
+        self.right[y] = x
+        self._update(x)
+        self._update(y)
+        return y
+
+    def _join_right(self, l: int, m: int, r: int) -> int:
+        h, left, right = self.height, self.left, self.right
+        c = right[l]
+        if h[c] <= h[r] + 1:
+            left[m], right[m] = c, r
+            self._update(m)
+            if h[m] <= h[left[l]] + 1:
+                right[l] = m
+                self._update(l)
+                return l
+            right[l] = self._rotate_right(m)
+            self._update(l)
+            return self._rotate_left(l)
+        t = self._join_right(c, m, r)
+        right[l] = t
+        self._update(l)
+        if h[t] <= h[left[l]] + 1:
+            return l
+        return self._rotate_left(l)
+
+    def _join_left(self, l: int, m: int, r: int) -> int:
+        h, left, right = self.height, self.left, self.right
+        c = left[r]
+        if h[c] <= h[l] + 1:
+            left[m], right[m] = l, c
+            self._update(m)
+            if h[m] <= h[right[r]] + 1:
+                left[r] = m
+                self._update(r)
+                return r
+            left[r] = self._rotate_left(m)
+            self._update(r)
+            return self._rotate_right(r)
+        t = self._join_left(l, m, c)
+        left[r] = t
+        self._update(r)
+        if h[t] <= h[right[r]] + 1:
+            return r
+        return self._rotate_right(r)
+
+    def _join(self, l: int, m: int, r: int) -> int:
+        h = self.height
+        if h[l] > h[r] + 1:
+            return self._join_right(l, m, r)
+        if h[r] > h[l] + 1:
+            return self._join_left(l, m, r)
+        self.left[m], self.right[m] = l, r
+        self._update(m)
+        return m
+
+    def build(self, keys: Sequence[Any], values: Optional[Sequence[Any]] = None) -> int:
+        """Perfectly balanced tree from sorted keys, O(n)."""
+        self._check_sorted(keys)
+        nodes = [self._alloc(k, k if values is None else values[i]) for i, k in enumerate(keys)]
+
+        def rec(lo: int, hi: int) -> int:  # recursion depth is log2(n)
+            if lo >= hi:
+                return NIL
+            mid = (lo + hi) // 2
+            x = nodes[mid]
+            self.left[x] = rec(lo, mid)
+            self.right[x] = rec(mid + 1, hi)
+            self._update(x)
+            return x
+
+        return rec(0, len(nodes))
+
+
+def benchmark(n: int = 200_000, small: int = 2_000, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    big = sorted(rng.sample(range(10 * n), n))
+    little = sorted(rng.sample(range(10 * n), small))
+    ref = sorted(set(big) | set(little))
+    print(f"union of sorted ID sets: |A|={n}, |B|={small}")
+    for cls in (Treap, AVLTree):
+        tree = cls()
+        t0 = time.perf_counter()
+        a = tree.build(big)
+        build = time.perf_counter() - t0
+        b = tree.build(little)
+        t0 = time.perf_counter()
+        u = tree.union(a, b)
+        join = time.perf_counter() - t0
+        assert list(tree.keys(u)) == ref
+        a = tree.build(big)
+        t0 = time.perf_counter()
+        for k in little:
+            a = tree.insert(a, k)
+        one = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        t = NIL
+        for k in big:
+            t = tree.insert(t, k)
+        naive = time.perf_counter() - t0
+        print(f"  {cls.__name__:<8} build {build * 1e3:7.1f} ms (vs {naive * 1e3:7.1f} ms by inserts), "
+              f"union {join * 1e3:6.1f} ms (vs {one * 1e3:6.1f} ms by inserts)")
+    t0 = time.perf_counter()
+    sorted(set(big) | set(little))
+    print(f"  sorted(set | set) {1e3 * (time.perf_counter() - t0):7.1f} ms")
+
+
+def demo():
+    for cls in (Treap, AVLTree):
+        tree = cls(SUM)
+        print(cls.__name__)
+        u = tree.union(tree.build([1, 3, 5, 7, 9]), tree.build([2, 3, 4, 9]))
+        print("  union:", list(tree.keys(u)))
+        i = tree.intersection(tree.build([1, 3, 5, 7, 9]), tree.build([2, 3, 4, 9]))
+        print("  intersection:", list(tree.keys(i)))
+        d = tree.difference(tree.build([1, 3, 5, 7, 9]), tree.build([3, 9, 10]))
+        print("  difference:", list(tree.keys(d)), "sum:", tree.aggregate(d),
+              "sum of [2, 6]:", tree.range_aggregate(d, 2, 6))
+    mx = AVLTree(MAX)
+    prices = mx.build([1, 2, 3, 4], values=[10.0, 12.5, 9.0, 11.0])
+    print("max price for keys 2..4:", mx.range_aggregate(prices, 2, 4))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
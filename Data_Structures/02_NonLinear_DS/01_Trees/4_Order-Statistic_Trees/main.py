@@ -1,5 +1,403 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 04_Data Structures — Trees & Hierarchical
+Subtopic: Order-Statistic Trees
+Description: Order-statistic multisets with O(log n) ``rank``, ``select`` and
+percentile queries: a Fenwick tree when the key universe is known up front,
+a size-augmented treap otherwise, plus NumPy batch queries.
+
+``FenwickMultiset`` coordinate-compresses the universe (sorted distinct
+keys) and keeps a binary indexed tree of multiplicities. ``add``/``remove``
+and ``rank`` are prefix-sum updates and queries; ``select(k)`` descends the
+implicit tree by binary lifting. Everything is O(log U) on plain lists with
+no per-element allocation, which makes a sliding window (add the newest
+sample, remove the oldest, read p50/p99) cheap enough to run per sample.
+
+``rank_many``/``select_many`` run the same prefix walk and binary lifting
+for a whole query vector at once: O(log U) NumPy passes over the batch
+instead of a Python loop per query. They take a NumPy snapshot of the
+Fenwick array, which is cached until the next update.
+
+``TreeMultiset`` handles open-ended keys: an array-backed treap whose nodes
+hold a key, its multiplicity and the subtree count, with the same rank and
+select interface (batch methods fall back to a loop).
+
+``rank(x)`` is the number of stored values ``< x``; ``select(k)`` is the
+``k``-th smallest (0-based, counting duplicates); ``percentile(p)`` uses the
+nearest-rank definition.
+"""
+from __future__ import annotations
+
+import math
+import random
+import sys
+import time
+from bisect import bisect_left
+from typing import Any, Iterable, List, Optional
+
+# Optional third-party (required by ``rank_many`` / ``select_many``).
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("batch order-statistic queries need NumPy: pip install numpy")
+
+
+class _OrderStatistic:
+    """Queries shared by both multisets; subclasses provide rank/select."""
+
+    def __len__(self) -> int:
+        return self.total
+
+    def rank(self, x: Any) -> int:
+        raise NotImplementedError
+
+    def select(self, k: int) -> Any:
+        raise NotImplementedError
+
+    @staticmethod
+    def _check_count(count: int) -> None:
+        if count <= 0:
+            raise ValueError(f"count must be positive, got {count}")
+
+    def _check_index(self, k: int) -> None:
+        if not 0 <= k < self.total:
+            raise IndexError(f"select({k}) on a multiset of {self.total} values")
+
+    def percentile(self, p: float) -> Any:
+        """Nearest-rank percentile, ``0 < p <= 100``."""
+        if not 0 < p <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        k = max(1, math.ceil(p / 100 * self.total))
+        return self.select(k - 1)
+
+    def rank_many(self, xs: Iterable[Any]) -> List[int]:
+        return [self.rank(x) for x in xs]
+
+    def select_many(self, ks: Iterable[int]) -> List[Any]:
+        return [self.select(k) for k in ks]
+
+
+class FenwickMultiset(_OrderStatistic):
+    """Multiset over a fixed, known universe of keys."""
+
+    def __init__(self, universe: Iterable[Any]) -> None:
+        self.keys = sorted(set(universe))
+        self._index = {k: i for i, k in enumerate(self.keys)}
+        self._tree = [0] * len(self.keys)
+        self._top = 1 << (len(self.keys).bit_length() - 1) if self.keys else 0
+        self._snapshot = None
+        self.total = 0
+
+    def _slot(self, x: Any) -> int:
+        try:
+            return self._index[x]
+        except KeyError:
+            raise ValueError(f"{x!r} is not in the universe") from None
+
+    def add(self, x: Any, count: int = 1) -> None:
+        self._check_count(count)
+        self._add(self._slot(x), count)
+
+    def _add(self, i: int, count: int) -> None:
+        tree, n = self._tree, len(self._tree)
+        while i < n:
+            tree[i] += count
+            i |= i + 1
+        self.total += count
+        self._snapshot = None
+
+    def remove(self, x: Any, count: int = 1) -> None:
+        self._check_count(count)
+        if self.count(x) < count:
+            raise ValueError(f"{x!r} is not present {count} time(s)")
+        self._add(self._index[x], -count)
+
+    def count(self, x: Any) -> int:
+        i = self._index.get(x)
+        if i is None:
+            return 0
+        return self._prefix(i + 1) - self._prefix(i)
+
+    def _prefix(self, i: int) -> int:
+        """Sum of multiplicities of the first ``i`` keys."""
+        tree = self._tree
+        total = 0
+        i -= 1
+        while i >= 0:
+            total += tree[i]
+            i = (i & (i + 1)) - 1
+        return total
+
+    def rank(self, x: Any) -> int:
+        return self._prefix(bisect_left(self.keys, x))
+
+    def select(self, k: int) -> Any:
+        self._check_index(k)
+        tree, n = self._tree, len(self._tree)
+        pos = -1
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt < n and tree[nxt] <= k:
+                k -= tree[nxt]
+                pos = nxt
+            step >>= 1
+        return self.keys[pos + 1]
+
+    def _arrays(self):
+        _require_numpy()
+        if self._snapshot is None:
+            self._snapshot = (np.asarray(self.keys), np.asarray(self._tree, dtype=np.int64))
+        return self._snapshot
+
+    def rank_many(self, xs: Iterable[Any]) -> "np.ndarray":
+        keys, tree = self._arrays()
+        xs = np.asarray(xs if hasattr(xs, "__len__") else list(xs))
+        idx = np.searchsorted(keys, xs, side="left").astype(np.int64) - 1
+        out = np.zeros(len(idx), dtype=np.int64)
+        live = np.flatnonzero(idx >= 0)
+        while live.size:
+            i = idx[live]
+            out[live] += tree[i]
+            i = (i & (i + 1)) - 1
+            idx[live] = i
+            live = live[i >= 0]
+        return out
+
+    def select_many(self, ks: Iterable[int]) -> "np.ndarray":
+        keys, tree = self._arrays()
+        k = np.array(ks if hasattr(ks, "__len__") else list(ks), dtype=np.int64)
+        if k.size and (k.min() < 0 or k.max() >= self.total):
+            raise IndexError(f"select_many index out of range for {self.total} values")
+        n = len(tree)
+        pos = np.full(len(k), -1, dtype=np.int64)
+        step = self._top
+        while step:
+            nxt = pos + step
+            ok = nxt < n
+            ok[ok] = tree[nxt[ok]] <= k[ok]
+            k[ok] -= tree[nxt[ok]]
+            pos[ok] = nxt[ok]
+            step >>= 1
+        return keys[pos + 1]
+
+
+class TreeMultiset(_OrderStatistic):
+    """Size-augmented treap multiset for keys not known in advance."""
+
+    def __init__(self, values: Iterable[Any] = (), seed: Optional[int] = None) -> None:
+        # Node 0 is the nil sentinel; freed nodes are reused.
+        self.key: List[Any] = [None]
+        self.mult = [0]
+        self.size = [0]
+        self.left = [0]
+        self.right = [0]
+        self.prio = [-1.0]
+        self._free: List[int] = []
+        self._rng = random.Random(seed)
+        self.root = 0
+        self.total = 0
+        for v in values:
+            self.add(v)
+
+    def _node(self, x: Any, count: int) -> int:
+        if self._free:
+            i = self._free.pop()
+            self.key[i], self.mult[i], self.size[i] = x, count, count
+            self.left[i] = self.right[i] = 0
+            self.prio[i] = self._rng.random()
+            return i
+        self.key.append(x)
+        self.mult.append(count)
+        self.size.append(count)
+        self.left.append(0)
+        self.right.append(0)
+        self.prio.append(self._rng.random())
+        return len(self.key) - 1
+
+    def _pull(self, t: int) -> None:
+        self.size[t] = self.size[self.left[t]] + self.size[self.right[t]] + self.mult[t]
+
+    def _split(self, t: int, x: Any):
+        """``(keys < x, keys >= x)``."""
+        if t == 0:
+            return 0, 0
+        if self.key[t] < x:
+            a, b = self._split(self.right[t], x)
+            self.right[t] = a
+            self._pull(t)
+            return t, b
+        a, b = self._split(self.left[t], x)
+        self.left[t] = b
+        self._pull(t)
+        return a, t
+
+    def _merge(self, a: int, b: int) -> int:
+        if a == 0 or b == 0:
+            return a or b
+        if self.prio[a] > self.prio[b]:
+            self.right[a] = self._merge(self.right[a], b)
+            self._pull(a)
+            return a
+        self.left[b] = self._merge(a, self.left[b])
+        self._pull(b)
+        return b
+
+    def _find(self, x: Any) -> List[int]:
+        """Root-to-node path ending at the node holding ``x`` (or empty)."""
+        path = []
+        t = self.root
+        key = self.key
+        while t:
+            path.append(t)
+            if x == key[t]:
+                return path
+            t = self.left[t] if x < key[t] else self.right[t]
+        return []
+
+    def add(self, x: Any, count: int = 1) -> None:
+        self._check_count(count)
+        path = self._find(x)
+        if path:
+            self.mult[path[-1]] += count
+            for t in path:
+                self.size[t] += count
+        else:
+            a, b = self._split(self.root, x)
+            self.root = self._merge(self._merge(a, self._node(x, count)), b)
+        self.total += count
+
+    def remove(self, x: Any, count: int = 1) -> None:
+        self._check_count(count)
+        path = self._find(x)
+        if not path or self.mult[path[-1]] < count:
+            raise ValueError(f"{x!r} is not present {count} time(s)")
+        node = path[-1]
+        self.total -= count
+        if self.mult[node] > count:
+            self.mult[node] -= count
+            for t in path:
+                self.size[t] -= count
+            return
+        joined = self._merge(self.left[node], self.right[node])
+        if len(path) == 1:
+            self.root = joined
+        else:
+            parent = path[-2]
+            if self.left[parent] == node:
+                self.left[parent] = joined
+            else:
+                self.right[parent] = joined
+            for t in path[:-1]:
+                self.size[t] -= count
+        self.key[node] = None
+        self._free.append(node)
+
+    def count(self, x: Any) -> int:
+        path = self._find(x)
+        return self.mult[path[-1]] if path else 0
+
+    def rank(self, x: Any) -> int:
+        t, r = self.root, 0
+        key, size, left, right, mult = self.key, self.size, self.left, self.right, self.mult
+        while t:
+            if key[t] < x:
+                r += size[left[t]] + mult[t]
+                t = right[t]
+            else:
+                t = left[t]
+        return r
+
+    def select(self, k: int) -> Any:
+        self._check_index(k)
+        t = self.root
+        size, left, right, mult = self.size, self.left, self.right, self.mult
+        while True:
+            s = size[left[t]]
+            if k < s:
+                t = left[t]
+            elif k < s + mult[t]:
+                return self.key[t]
+            else:
+                k -= s + mult[t]
+                t = right[t]
+
+
+def order_statistic_multiset(universe: Optional[Iterable[Any]] = None) -> _OrderStatistic:
+    """Fenwick-backed when the key universe is known, treap-backed otherwise."""
+    if universe is None:
+        return TreeMultiset()
+    return FenwickMultiset(universe)
+
+
+def benchmark(n: int = 200_000, window: int = 10_000, every: int = 10, seed: int = 0) -> None:
+    """Sliding-window p50/p99 over a latency stream (integer milliseconds)."""
+    rng = random.Random(seed)
+    stream = [min(5000, int(rng.lognormvariate(3, 1))) for _ in range(n)]
+    reports = (n - window) // every
+    print(f"{n} samples, window {window}, p50/p99 every {every} samples ({reports} reports)")
+
+    def run(name, ms):
+        t0 = time.perf_counter()
+        out = {}
+        for i, x in enumerate(stream):
+            ms.add(x)
+            if i >= window:
+                ms.remove(stream[i - window])
+                if i % every == 0:
+                    out[i] = (ms.percentile(50), ms.percentile(99))
+        print(f"  {name:<22} {time.perf_counter() - t0:7.2f} s")
+        return out
+
+    ref = run("Fenwick (universe)", order_statistic_multiset(range(5001)))
+    assert run("treap (open keys)", order_statistic_multiset()) == ref
+    sample = list(ref)[::50]
+    t0 = time.perf_counter()
+    for i in sample:
+        s = sorted(stream[i - window + 1:i + 1])
+        assert (s[math.ceil(0.5 * window) - 1], s[math.ceil(0.99 * window) - 1]) == ref[i]
+    per = (time.perf_counter() - t0) / len(sample)
+    print(f"  sort every window      {per * reports:7.2f} s (extrapolated from {len(sample)} windows)")
+
+    if np is None:
+        return
+    fw = FenwickMultiset(range(5001))
+    for x in stream:
+        fw.add(x)
+    qs = np.asarray([rng.randrange(5001) for _ in range(200_000)])
+    ks = np.asarray([rng.randrange(n) for _ in range(200_000)])
+    t0 = time.perf_counter()
+    loop = [fw.rank(int(q)) for q in qs], [fw.select(int(k)) for k in ks]
+    t1 = time.perf_counter()
+    vec = fw.rank_many(qs), fw.select_many(ks)
+    t2 = time.perf_counter()
+    assert vec[0].tolist() == loop[0] and vec[1].tolist() == loop[1]
+    print(f"  200k rank + 200k select: loop {t1 - t0:.2f} s, NumPy batch {t2 - t1:.3f} s")
+
+
+def demo():
+    ms = order_statistic_multiset(range(0, 101, 5))
+    for x in (10, 20, 20, 35, 50, 95):
+        ms.add(x)
+    print("rank(20):", ms.rank(20), "rank(21):", ms.rank(21), "select(2):", ms.select(2))
+    print("p50:", ms.percentile(50), "p99:", ms.percentile(99))
+    ms.remove(20)
+    print("after remove(20): count(20) =", ms.count(20), "select(2):", ms.select(2))
+    tree = order_statistic_multiset()
+    for x in (3.5, -1.0, 7.25, 3.5):
+        tree.add(x)
+    print("treap ranks of [0, 3.5, 10]:", tree.rank_many([0, 3.5, 10]), "select_many:", tree.select_many([0, 3]))
+    if np is not None:
+        print("Fenwick batch ranks:", ms.rank_many([0, 20, 100]).tolist(),
+              "selects:", ms.select_many([0, 1, 4]).tolist())
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
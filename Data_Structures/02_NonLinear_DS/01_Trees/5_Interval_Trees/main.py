@@ -1,5 +1,385 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 04_Data Structures — Trees & Hierarchical
+Subtopic: Interval Trees
+Description: Static centered interval tree over NumPy arrays with vectorized
+batch overlap queries, and a max-end treap for online insert/delete.
+
+Intervals are closed, ``[start, end]`` with ``start <= end``, and carry an
+integer id (their position by default).
+
+``StaticIntervalIndex`` builds a centered interval tree whose node contents
+are flattened into a few NumPy arrays: each node stores the intervals that
+contain its center twice, sorted by start and by descending end, so a
+stabbing query does one ``searchsorted`` per level and reports whole slices.
+Small sets become leaf buckets scanned with a vectorized mask. An
+``overlaps(lo, hi)`` query is the stabbing query at ``lo`` plus the
+intervals starting in ``(lo, hi]`` from a start-sorted array: disjoint
+cases, so no deduplication. Both are O(log n + k) NumPy calls.
+
+The batch methods never loop over queries. ``count_many`` is
+``#(start <= hi) - #(end < lo)`` with two ``searchsorted`` calls.
+``overlaps_many`` sorts the queries; the queries whose ``lo`` falls in an
+interval then form a contiguous run for every interval (and the intervals
+starting in ``(lo, hi]`` a contiguous run for every query), so all result
+pairs come out of ``np.repeat`` expansions in O((n + q) log + k).
+
+``IntervalTreap`` is the dynamic structure: a treap keyed by ``(start, id)``
+in parallel lists, each node augmented with the maximum end in its subtree,
+so a query prunes every subtree that ends before ``lo``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Optional third-party (required by ``StaticIntervalIndex``).
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("the static interval index needs NumPy: pip install numpy")
+
+
+LEAF_SIZE = 32
+
+
+class StaticIntervalIndex:
+    """Immutable interval set answering point and range overlap queries."""
+
+    def __init__(self, starts, ends, ids=None, leaf_size: int = LEAF_SIZE) -> None:
+        _require_numpy()
+        starts = np.asarray(starts)
+        ends = np.asarray(ends)
+        if starts.shape != ends.shape or starts.ndim != 1:
+            raise ValueError("starts and ends must be 1-D arrays of equal length")
+        if np.any(starts > ends):
+            raise ValueError("every interval needs start <= end")
+        ids = np.arange(len(starts), dtype=np.int64) if ids is None else np.asarray(ids, dtype=np.int64)
+        self.starts, self.ends, self.ids = starts, ends, ids
+        order = np.argsort(starts, kind="stable")
+        self._g_start = starts[order]
+        self._g_id = ids[order]
+        self._ends_sorted = np.sort(ends)
+        self._build(leaf_size)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _build(self, leaf_size: int) -> None:
+        starts, ends = self.starts, self.ends
+        self.center: List = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.is_leaf: List[bool] = []
+        self.seg: List[Tuple[int, int]] = []
+        by_start: List = []   # per node: interval indices sorted by start
+        by_end: List = []     # per node: interval indices sorted by end, descending
+        offset = 0
+        root_items = np.arange(len(starts))
+        # (items, parent, is_left_child)
+        stack = [(root_items, -1, False)] if len(root_items) else []
+        while stack:
+            items, parent, as_left = stack.pop()
+            x = len(self.center)
+            if parent >= 0:
+                if as_left:
+                    self.left[parent] = x
+                else:
+                    self.right[parent] = x
+            s, e = starts[items], ends[items]
+            self.left.append(-1)
+            self.right.append(-1)
+            if len(items) <= leaf_size:
+                mid = items[np.argsort(s, kind="stable")]
+                self.center.append(None)
+                self.is_leaf.append(True)
+                by_start.append(mid)
+                by_end.append(mid)
+            else:
+                c = np.median(np.concatenate((s, e)))
+                go_left = e < c
+                go_right = s > c
+                here = ~(go_left | go_right)
+                mid = items[here]
+                self.center.append(c)
+                self.is_leaf.append(False)
+                by_start.append(mid[np.argsort(starts[mid], kind="stable")])
+                by_end.append(mid[np.argsort(-ends[mid], kind="stable")])
+                if go_left.any():
+                    stack.append((items[go_left], x, True))
+                if go_right.any():
+                    stack.append((items[go_right], x, False))
+            self.seg.append((offset, offset + len(mid)))
+            offset += len(mid)
+        bs = np.concatenate(by_start) if by_start else np.zeros(0, dtype=np.int64)
+        be = np.concatenate(by_end) if by_end else np.zeros(0, dtype=np.int64)
+        self._s_start, self._s_end, self._s_id = starts[bs], ends[bs], self.ids[bs]
+        self._e_negend, self._e_id = -ends[be], self.ids[be]
+
+    # ------------------------------------------------------------ single queries
+    def _stab(self, p) -> List:
+        out = []
+        x = 0 if self.center else -1
+        while x >= 0:
+            a, b = self.seg[x]
+            if self.is_leaf[x]:
+                m = (self._s_start[a:b] <= p) & (self._s_end[a:b] >= p)
+                out.append(self._s_id[a:b][m])
+                break
+            c = self.center[x]
+            if p < c:
+                k = np.searchsorted(self._s_start[a:b], p, side="right")
+                out.append(self._s_id[a:a + k])
+                x = self.left[x]
+            elif p > c:
+                k = np.searchsorted(self._e_negend[a:b], -p, side="right")
+                out.append(self._e_id[a:a + k])
+                x = self.right[x]
+            else:
+                out.append(self._s_id[a:b])
+                break
+        return out
+
+    def overlaps(self, lo, hi=None) -> "np.ndarray":
+        """Ids of intervals containing ``lo``, or meeting ``[lo, hi]``."""
+        out = self._stab(lo)
+        if hi is not None:
+            if hi < lo:
+                raise ValueError("empty query range: hi < lo")
+            g = self._g_start
+            i0 = np.searchsorted(g, lo, side="right")
+            i1 = np.searchsorted(g, hi, side="right")
+            out.append(self._g_id[i0:i1])
+        return np.concatenate(out) if out else np.zeros(0, dtype=np.int64)
+
+    # ------------------------------------------------------------ batch queries
+    def count_many(self, lo, hi=None) -> "np.ndarray":
+        """Number of overlapping intervals for each query point / range."""
+        lo = np.asarray(lo)
+        hi = lo if hi is None else np.asarray(hi)
+        return (np.searchsorted(self._g_start, hi, side="right")
+                - np.searchsorted(self._ends_sorted, lo, side="left"))
+
+    def overlaps_many(self, lo, hi=None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """All overlaps as ``(query_index, interval_id)`` pairs, grouped by query."""
+        lo = np.asarray(lo)
+        # Case A: the query's lo lies in the interval. Per interval, these
+        # queries are a contiguous run of the lo-sorted queries.
+        qo = np.argsort(lo, kind="stable")
+        qs = lo[qo]
+        a = np.searchsorted(qs, self.starts, side="left")
+        b = np.searchsorted(qs, self.ends, side="right")
+        pos, owner = _expand(a, b)
+        q_idx = [qo[pos]]
+        iv_id = [self.ids[owner]]
+        if hi is not None:
+            hi = np.asarray(hi)
+            if np.any(hi < lo):
+                raise ValueError("empty query range: hi < lo")
+            # Case B: the interval starts in (lo, hi]; a run of the start-sorted
+            # intervals per query.
+            a = np.searchsorted(self._g_start, lo, side="right")
+            b = np.searchsorted(self._g_start, hi, side="right")
+            pos, owner = _expand(a, b)
+            q_idx.append(owner)
+            iv_id.append(self._g_id[pos])
+        q_idx = np.concatenate(q_idx)
+        iv_id = np.concatenate(iv_id)
+        order = np.argsort(q_idx, kind="stable")
+        return q_idx[order], iv_id[order]
+
+
+def _expand(a, b) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Flatten the runs ``range(a[i], b[i])``: ``(positions, run index)``."""
+    cnt = np.maximum(b - a, 0)
+    owner = np.repeat(np.arange(len(cnt)), cnt)
+    starts = np.cumsum(cnt) - cnt
+    pos = np.arange(int(cnt.sum())) - np.repeat(starts - a, cnt)
+    return pos, owner
+
+
+class IntervalTreap:
+    """Dynamic interval set: treap on ``(start, id)`` with subtree max end."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        # Node 0 is the nil sentinel (max end -inf); freed nodes are reused.
+        self.start: List = [None]
+        self.end: List = [None]
+        self.ident = [-1]
+        self.maxend: List = [float("-inf")]
+        self.left = [0]
+        self.right = [0]
+        self.prio = [-1.0]
+        self._free: List[int] = []
+        self._node_of: Dict[int, int] = {}
+        self._rng = random.Random(seed)
+        self.root = 0
+
+    def __len__(self) -> int:
+        return len(self._node_of)
+
+    def _new(self, start, end, ident: int) -> int:
+        if self._free:
+            x = self._free.pop()
+            self.start[x], self.end[x], self.ident[x] = start, end, ident
+            self.maxend[x] = end
+            self.left[x] = self.right[x] = 0
+            self.prio[x] = self._rng.random()
+            return x
+        self.start.append(start)
+        self.end.append(end)
+        self.ident.append(ident)
+        self.maxend.append(end)
+        self.left.append(0)
+        self.right.append(0)
+        self.prio.append(self._rng.random())
+        return len(self.start) - 1
+
+    def _pull(self, x: int) -> None:
+        m = self.end[x]
+        a, b = self.maxend[self.left[x]], self.maxend[self.right[x]]
+        if a > m:
+            m = a
+        if b > m:
+            m = b
+        self.maxend[x] = m
+
+    def _split(self, t: int, key) -> Tuple[int, int]:
+        """``(keys < key, keys >= key)`` for keys ``(start, id)``."""
+        if t == 0:
+            return 0, 0
+        if (self.start[t], self.ident[t]) < key:
+            a, b = self._split(self.right[t], key)
+            self.right[t] = a
+            self._pull(t)
+            return t, b
+        a, b = self._split(self.left[t], key)
+        self.left[t] = b
+        self._pull(t)
+        return a, t
+
+    def _merge(self, a: int, b: int) -> int:
+        if a == 0 or b == 0:
+            return a or b
+        if self.prio[a] > self.prio[b]:
+            self.right[a] = self._merge(self.right[a], b)
+            self._pull(a)
+            return a
+        self.left[b] = self._merge(a, self.left[b])
+        self._pull(b)
+        return b
+
+    def insert(self, start, end, ident: int) -> None:
+        if start > end:
+            raise ValueError("interval needs start <= end")
+        if ident in self._node_of:
+            raise ValueError(f"interval id {ident} already present")
+        x = self._new(start, end, ident)
+        self._node_of[ident] = x
+        a, b = self._split(self.root, (start, ident))
+        self.root = self._merge(self._merge(a, x), b)
+
+    def delete(self, ident: int) -> None:
+        x = self._node_of.pop(ident)
+        key = (self.start[x], ident)
+        a, b = self._split(self.root, key)
+        # ``b`` starts with the node itself; cut it off the left spine.
+        mid, rest = self._split(b, (key[0], ident + 1))
+        self.root = self._merge(a, rest)
+        self.start[x] = self.end[x] = None
+        self._free.append(x)
+
+    def overlaps(self, lo, hi=None) -> List[int]:
+        """Ids of intervals containing ``lo``, or meeting ``[lo, hi]``."""
+        if hi is None:
+            hi = lo
+        out = []
+        start, end, maxend = self.start, self.end, self.maxend
+        left, right, ident = self.left, self.right, self.ident
+        stack = [self.root]
+        while stack:
+            x = stack.pop()
+            if x == 0 or maxend[x] < lo:
+                continue
+            stack.append(left[x])
+            if start[x] <= hi:
+                if end[x] >= lo:
+                    out.append(ident[x])
+                stack.append(right[x])
+        return out
+
+
+def random_intervals(n: int, horizon: int = 1_000_000, max_len: int = 200, seed: int = 0):
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, horizon, n)
+    return starts, starts + rng.integers(0, max_len, n)
+
+
+def benchmark(n: int = 200_000, queries: int = 20_000, seed: int = 0) -> None:
+    _require_numpy()
+    starts, ends = random_intervals(n, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+    lo = rng.integers(0, 1_000_000, queries)
+    hi = lo + rng.integers(0, 100, queries)
+    print(f"{n} intervals, {queries} range overlap queries")
+    pairs = list(zip(starts.tolist(), ends.tolist()))
+    t0 = time.perf_counter()
+    sample = 50
+    scan = [sorted(i for i, (s, e) in enumerate(pairs) if s <= h and e >= l)
+            for l, h in zip(lo[:sample].tolist(), hi[:sample].tolist())]
+    per = (time.perf_counter() - t0) / sample
+    print(f"  linear scan over tuples  {per * queries:8.2f} s (extrapolated)")
+    t0 = time.perf_counter()
+    idx = StaticIntervalIndex(starts, ends)
+    build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    single = [idx.overlaps(l, h) for l, h in zip(lo.tolist(), hi.tolist())]
+    print(f"  static tree, one by one  {time.perf_counter() - t0:8.2f} s  (build {build:.2f} s)")
+    assert [sorted(r.tolist()) for r in single[:sample]] == scan
+    t0 = time.perf_counter()
+    q_idx, ids = idx.overlaps_many(lo, hi)
+    print(f"  static tree, batched     {time.perf_counter() - t0:8.2f} s  ({len(ids)} overlaps)")
+    assert len(ids) == sum(len(r) for r in single)
+    assert (np.bincount(q_idx, minlength=queries) == idx.count_many(lo, hi)).all()
+    tree = IntervalTreap(seed=seed)
+    t0 = time.perf_counter()
+    for i, (s, e) in enumerate(pairs):
+        tree.insert(s, e, i)
+    build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    dyn = [tree.overlaps(l, h) for l, h in zip(lo.tolist(), hi.tolist())]
+    print(f"  max-end treap            {time.perf_counter() - t0:8.2f} s  (build {build:.2f} s)")
+    assert [sorted(r) for r in dyn[:sample]] == scan
+
+
+def demo():
+    starts = [1, 5, 8, 15, 20]
+    ends = [4, 10, 12, 18, 25]
+    if np is not None:
+        idx = StaticIntervalIndex(starts, ends, leaf_size=2)
+        print("containing 9:", sorted(idx.overlaps(9).tolist()))
+        print("meeting [11, 16]:", sorted(idx.overlaps(11, 16).tolist()))
+        print("counts for points [3, 9, 19]:", idx.count_many([3, 9, 19]).tolist())
+        q, ids = idx.overlaps_many([3, 9, 19], [6, 9, 21])
+        print("batch pairs:", list(zip(q.tolist(), ids.tolist())))
+    tree = IntervalTreap(seed=1)
+    for i, (s, e) in enumerate(zip(starts, ends)):
+        tree.insert(s, e, i)
+    print("treap meeting [11, 16]:", sorted(tree.overlaps(11, 16)))
+    tree.delete(2)
+    tree.insert(11, 11, 7)
+    print("after delete(2), insert [11, 11]:", sorted(tree.overlaps(11, 16)))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
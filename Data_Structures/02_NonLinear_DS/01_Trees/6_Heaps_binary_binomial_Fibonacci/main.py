@@ -1,5 +1,611 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 04_Data Structures — Trees & Hierarchical
+Subtopic: Heaps (binary, d-ary, pairing, Fibonacci)
+Description: Addressable priority queues with decrease-key and remove: an
+indexed d-ary heap, an array-pooled pairing heap and a Fibonacci heap kept
+as a reference, benchmarked against ``heapq`` with lazy deletion.
+
+``heapq`` has no decrease-key, so the usual pattern pushes a fresh entry and
+skips stale ones when they surface. With frequent rescheduling, most pops are
+stale, and the heap grows with the number of updates rather than the number
+of live items.
+
+``IndexedHeap`` stores integer items (vertex ids, entity ids) and their keys
+in two parallel lists in heap order, plus a position map ``pos[item]``.
+``decrease_key``, ``update`` (either direction) and ``remove`` sift from the
+item's slot in O(d log_d n). ``d = 4`` halves the depth and keeps each
+sibling group on a couple of cache lines; ``d = 2`` is the classic binary
+heap.
+
+``PairingHeap`` keeps nodes in parallel lists (key, item, first child, next
+sibling, and ``prev``: the parent for a first child, otherwise the left
+sibling) and recycles them through a free list. ``push`` returns a node
+handle, ``decrease_key`` cuts the subtree and melds it with the root in O(1),
+and ``pop`` does the standard two-pass pairing.
+
+``FibonacciHeap`` is the textbook node-object version with cascading cuts.
+Its bounds are the best on paper, but it is kept only as a baseline for the
+benchmark.
+
+What the benchmark shows on CPython: ``heapq`` is written in C, so even
+with most pops stale it stays the fastest in wall-clock time, while the
+indexed 4-ary and pairing heaps run 2-3x slower. Among the pure-Python heaps
+those two lead, and the binary and Fibonacci heaps trail. What the indexed
+heaps buy is a heap bounded by the number of live items (the lazy heap ends
+twice as large), exact cancellation, and keys that can be read or changed in
+place. When the stale backlog grows without bound (long-lived cancelled
+timers), that is the deciding factor.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import random
+import sys
+import time
+from typing import Any, List, Optional, Tuple
+
+
+class IndexedHeap:
+    """Min d-ary heap of integer items with a position map."""
+
+    def __init__(self, capacity: int = 0, d: int = 2) -> None:
+        if d < 2:
+            raise ValueError("arity d must be at least 2")
+        self.d = d
+        self.heap: List[int] = []
+        self.keys: List[Any] = []
+        self.pos = [-1] * capacity
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item: int) -> bool:
+        return item < len(self.pos) and self.pos[item] >= 0
+
+    def key_of(self, item: int) -> Any:
+        return self.keys[self._index(item)]
+
+    def _index(self, item: int) -> int:
+        if 0 <= item < len(self.pos) and self.pos[item] >= 0:
+            return self.pos[item]
+        raise KeyError(item)
+
+    def _up(self, i: int, item: int, key: Any) -> None:
+        heap, keys, pos, d = self.heap, self.keys, self.pos, self.d
+        while i:
+            p = (i - 1) // d
+            if not key < keys[p]:
+                break
+            moved = heap[p]
+            heap[i], keys[i] = moved, keys[p]
+            pos[moved] = i
+            i = p
+        heap[i], keys[i] = item, key
+        pos[item] = i
+
+    def _down(self, i: int, item: int, key: Any) -> None:
+        heap, keys, pos, d = self.heap, self.keys, self.pos, self.d
+        n = len(heap)
+        while True:
+            c = d * i + 1
+            if c >= n:
+                break
+            best, bk = c, keys[c]
+            for j in range(c + 1, min(c + d, n)):
+                if keys[j] < bk:
+                    best, bk = j, keys[j]
+            if not bk < key:
+                break
+            moved = heap[best]
+            heap[i], keys[i] = moved, bk
+            pos[moved] = i
+            i = best
+        heap[i], keys[i] = item, key
+        pos[item] = i
+
+    def push(self, item: int, key: Any) -> None:
+        if item >= len(self.pos):
+            self.pos.extend([-1] * (item + 1 - len(self.pos)))
+        elif self.pos[item] >= 0:
+            raise ValueError(f"item {item} is already in the heap")
+        self.heap.append(item)
+        self.keys.append(key)
+        self._up(len(self.heap) - 1, item, key)
+
+    def peek(self) -> Tuple[int, Any]:
+        return self.heap[0], self.keys[0]
+
+    def pop(self) -> Tuple[int, Any]:
+        heap, keys = self.heap, self.keys
+        top, top_key = heap[0], keys[0]
+        self.pos[top] = -1
+        item, key = heap.pop(), keys.pop()
+        if heap:
+            self._down(0, item, key)
+        return top, top_key
+
+    def decrease_key(self, item: int, key: Any) -> None:
+        i = self._index(item)
+        if key > self.keys[i]:
+            raise ValueError("decrease_key with a larger key")
+        self._up(i, item, key)
+
+    def update(self, item: int, key: Any) -> None:
+        """Set the key of ``item``, pushing it if absent."""
+        if item not in self:
+            self.push(item, key)
+            return
+        i = self.pos[item]
+        if key < self.keys[i]:
+            self._up(i, item, key)
+        else:
+            self._down(i, item, key)
+
+    def remove(self, item: int) -> Any:
+        """Delete ``item`` and return its key; KeyError if it is not queued."""
+        i = self._index(item)
+        removed = self.keys[i]
+        self.pos[item] = -1
+        last, last_key = self.heap.pop(), self.keys.pop()
+        if i < len(self.heap):
+            if i and last_key < self.keys[(i - 1) // self.d]:
+                self._up(i, last, last_key)
+            else:
+                self._down(i, last, last_key)
+        return removed
+
+
+class PairingHeap:
+    """Min pairing heap over pooled nodes; ``push`` returns a node handle."""
+
+    def __init__(self) -> None:
+        self.key: List[Any] = []
+        self.item: List[Any] = []
+        self.child: List[int] = []
+        self.sib: List[int] = []
+        self.prev: List[int] = []
+        self.live = bytearray()  # 1 while the handle's node is in the heap
+        self._free: List[int] = []
+        self.root = -1
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _meld(self, a: int, b: int) -> int:
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        key = self.key
+        if key[b] < key[a]:
+            a, b = b, a
+        c = self.child[a]
+        self.sib[b] = c
+        if c >= 0:
+            self.prev[c] = b
+        self.child[a] = b
+        self.prev[b] = a
+        return a
+
+    def _merge_pairs(self, first: int) -> int:
+        """Two-pass pairing of a sibling list into one tree."""
+        sib = self.sib
+        trees = []
+        x = first
+        while x >= 0:
+            y = sib[x]
+            if y < 0:
+                sib[x] = self.prev[x] = -1
+                trees.append(x)
+                break
+            nxt = sib[y]
+            sib[x] = sib[y] = self.prev[x] = self.prev[y] = -1
+            trees.append(self._meld(x, y))
+            x = nxt
+        root = -1
+        for t in reversed(trees):
+            root = self._meld(t, root)
+        return root
+
+    def push(self, key: Any, item: Any = None) -> int:
+        if self._free:
+            x = self._free.pop()
+            self.key[x], self.item[x] = key, item
+            self.child[x] = self.sib[x] = self.prev[x] = -1
+            self.live[x] = 1
+        else:
+            x = len(self.key)
+            self.key.append(key)
+            self.item.append(item)
+            self.child.append(-1)
+            self.sib.append(-1)
+            self.prev.append(-1)
+            self.live.append(1)
+        self.root = self._meld(self.root, x)
+        self.size += 1
+        return x
+
+    def peek(self) -> Tuple[Any, Any]:
+        if self.root < 0:
+            raise IndexError("peek from an empty heap")
+        return self.item[self.root], self.key[self.root]
+
+    def pop(self) -> Tuple[Any, Any]:
+        r = self.root
+        if r < 0:
+            raise IndexError("pop from an empty heap")
+        out = self.item[r], self.key[r]
+        self.root = self._merge_pairs(self.child[r])
+        self._release(r)
+        return out
+
+    def _release(self, x: int) -> None:
+        self.item[x] = self.key[x] = None
+        self.live[x] = 0
+        self._free.append(x)
+        self.size -= 1
+
+    def _cut(self, x: int) -> None:
+        p, s = self.prev[x], self.sib[x]
+        if self.child[p] == x:
+            self.child[p] = s
+        else:
+            self.sib[p] = s
+        if s >= 0:
+            self.prev[s] = p
+        self.sib[x] = self.prev[x] = -1
+
+    def _check(self, x: int) -> None:
+        if not (0 <= x < len(self.live) and self.live[x]):
+            raise KeyError(x)
+
+    def decrease_key(self, x: int, key: Any) -> None:
+        self._check(x)
+        if key > self.key[x]:
+            raise ValueError("decrease_key with a larger key")
+        self.key[x] = key
+        if x != self.root:
+            self._cut(x)
+            self.root = self._meld(self.root, x)
+
+    def remove(self, x: int) -> Any:
+        """Delete the node behind handle ``x``; KeyError if it was released."""
+        self._check(x)
+        if x == self.root:
+            return self.pop()[1]
+        removed = self.key[x]
+        self._cut(x)
+        self.root = self._meld(self.root, self._merge_pairs(self.child[x]))
+        self._release(x)
+        return removed
+
+
+class _FibNode:
+    __slots__ = ("key", "item", "parent", "child", "left", "right", "degree", "mark")
+
+    def __init__(self, key: Any, item: Any) -> None:
+        self.key, self.item = key, item
+        self.parent: Optional[_FibNode] = None
+        self.child: Optional[_FibNode] = None
+        self.left = self.right = self
+        self.degree = 0
+        self.mark = False
+
+
+class FibonacciHeap:
+    """Textbook Fibonacci heap (reference implementation for benchmarks)."""
+
+    def __init__(self) -> None:
+        self.min: Optional[_FibNode] = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _splice(a: _FibNode, x: _FibNode) -> None:
+        """Insert ``x`` into the circular list right of ``a``."""
+        x.left, x.right = a, a.right
+        a.right.left = x
+        a.right = x
+
+    @staticmethod
+    def _unlink(x: _FibNode) -> None:
+        x.left.right, x.right.left = x.right, x.left
+        x.left = x.right = x
+
+    def push(self, key: Any, item: Any = None) -> _FibNode:
+        x = _FibNode(key, item)
+        if self.min is None:
+            self.min = x
+        else:
+            self._splice(self.min, x)
+            if key < self.min.key:
+                self.min = x
+        self.size += 1
+        return x
+
+    def pop(self) -> Tuple[Any, Any]:
+        z = self.min
+        c = z.child
+        if c is not None:
+            kids = [c]
+            x = c.right
+            while x is not c:
+                kids.append(x)
+                x = x.right
+            for x in kids:
+                x.parent = None
+                self._unlink(x)
+                self._splice(z, x)
+        if z.right is z:
+            self.min = None
+        else:
+            self.min = z.right
+            self._unlink(z)
+            self._consolidate()
+        self.size -= 1
+        return z.item, z.key
+
+    def _consolidate(self) -> None:
+        table: List[Optional[_FibNode]] = [None] * (int(math.log2(self.size + 1) * 1.45) + 2)
+        roots = [self.min]
+        x = self.min.right
+        while x is not self.min:
+            roots.append(x)
+            x = x.right
+        for x in roots:
+            d = x.degree
+            while table[d] is not None:
+                y = table[d]
+                if y.key < x.key:
+                    x, y = y, x
+                self._unlink(y)
+                y.parent = x
+                if x.child is None:
+                    x.child = y
+                else:
+                    self._splice(x.child, y)
+                x.degree += 1
+                y.mark = False
+                table[d] = None
+                d += 1
+            table[d] = x
+        self.min = None
+        for x in table:
+            if x is not None:
+                x.left = x.right = x
+                if self.min is None:
+                    self.min = x
+                else:
+                    self._splice(self.min, x)
+                    if x.key < self.min.key:
+                        self.min = x
+
+    def decrease_key(self, x: _FibNode, key: Any) -> None:
+        if key > x.key:
+            raise ValueError("decrease_key with a larger key")
+        x.key = key
+        p = x.parent
+        if p is not None and x.key < p.key:
+            self._cut(x, p)
+            while p.parent is not None:
+                if not p.mark:
+                    p.mark = True
+                    break
+                gp = p.parent
+                self._cut(p, gp)
+                p = gp
+        if x.key < self.min.key:
+            self.min = x
+
+    def _cut(self, x: _FibNode, p: _FibNode) -> None:
+        if p.child is x:
+            p.child = x.right if x.right is not x else None
+        self._unlink(x)
+        p.degree -= 1
+        x.parent = None
+        x.mark = False
+        self._splice(self.min, x)
+
+    def remove(self, x: _FibNode) -> Any:
+        key = x.key
+        self.decrease_key(x, float("-inf"))
+        self.pop()
+        return key
+
+
+# ------------------------------------------------------------ workloads
+def random_graph(n: int, m: int, seed: int = 0):
+    """CSR ``(offsets, targets, weights)`` of a random weighted digraph."""
+    rng = random.Random(seed)
+    src = [i % n for i in range(m)]
+    dst = [rng.randrange(n) for _ in range(m)]
+    w = [rng.randint(1, 1000) for _ in range(m)]
+    offsets = [0] * (n + 1)
+    for u in src:
+        offsets[u + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+    fill = offsets[:-1]
+    targets = [0] * m
+    weights = [0] * m
+    for u, v, c in zip(src, dst, w):
+        targets[fill[u]], weights[fill[u]] = v, c
+        fill[u] += 1
+    return offsets, targets, weights
+
+
+def dijkstra_lazy(n, offsets, targets, weights, s):
+    dist = [math.inf] * n
+    dist[s] = 0
+    pq = [(0, s)]
+    stale = 0
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            stale += 1
+            continue
+        for i in range(offsets[u], offsets[u + 1]):
+            v, nd = targets[i], d + weights[i]
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+    return dist, stale
+
+
+def dijkstra_indexed(n, offsets, targets, weights, s, d=4):
+    dist = [math.inf] * n
+    dist[s] = 0
+    pq = IndexedHeap(n, d)
+    pq.push(s, 0)
+    while len(pq):
+        u, du = pq.pop()
+        for i in range(offsets[u], offsets[u + 1]):
+            v, nd = targets[i], du + weights[i]
+            if nd < dist[v]:
+                if dist[v] == math.inf:
+                    pq.push(v, nd)
+                else:
+                    pq.decrease_key(v, nd)
+                dist[v] = nd
+    return dist
+
+
+def dijkstra_handles(n, offsets, targets, weights, s, heap):
+    """Dijkstra over any heap with ``push -> handle`` and ``decrease_key(handle)``."""
+    dist = [math.inf] * n
+    dist[s] = 0
+    handle: List[Any] = [None] * n
+    done = bytearray(n)
+    heap.push(0, s)
+    while len(heap):
+        u, du = heap.pop()
+        done[u] = 1
+        for i in range(offsets[u], offsets[u + 1]):
+            v, nd = targets[i], du + weights[i]
+            if nd < dist[v]:
+                if handle[v] is None:
+                    handle[v] = heap.push(nd, v)
+                elif not done[v]:
+                    heap.decrease_key(handle[v], nd)
+                dist[v] = nd
+    return dist
+
+
+def simulate_lazy(entities: int, events: int, reschedule: float, seed: int = 0):
+    """Event loop on heapq: rescheduling leaves a stale entry behind."""
+    rng = random.Random(seed)
+    version = [0] * entities
+    pq = [(rng.expovariate(1.0), 0, e) for e in range(entities)]
+    heapq.heapify(pq)
+    stale = done = 0
+    checksum = 0.0
+    while done < events:
+        t, v, e = heapq.heappop(pq)
+        if v != version[e]:
+            stale += 1
+            continue
+        done += 1
+        checksum += t
+        version[e] += 1
+        heapq.heappush(pq, (t + rng.expovariate(1.0), version[e], e))
+        if rng.random() < reschedule:  # e.g. a timeout reset on another entity
+            o = rng.randrange(entities)
+            version[o] += 1
+            heapq.heappush(pq, (t + rng.expovariate(0.5), version[o], o))
+    return checksum, stale, len(pq)
+
+
+def simulate_indexed(entities: int, events: int, reschedule: float, seed: int = 0, d: int = 4):
+    rng = random.Random(seed)
+    pq = IndexedHeap(entities, d)
+    for e in range(entities):
+        pq.push(e, rng.expovariate(1.0))
+    checksum = 0.0
+    for _ in range(events):
+        e, t = pq.pop()
+        checksum += t
+        pq.push(e, t + rng.expovariate(1.0))
+        if rng.random() < reschedule:
+            pq.update(rng.randrange(entities), t + rng.expovariate(0.5))
+    return checksum, 0, len(pq)
+
+
+def simulate_handles(entities: int, events: int, reschedule: float, heap, seed: int = 0):
+    """Event loop on a handle heap: a reschedule is remove + push."""
+    rng = random.Random(seed)
+    handle = [heap.push(rng.expovariate(1.0), e) for e in range(entities)]
+    checksum = 0.0
+    for _ in range(events):
+        e, t = heap.pop()
+        checksum += t
+        handle[e] = heap.push(t + rng.expovariate(1.0), e)
+        if rng.random() < reschedule:
+            o = rng.randrange(entities)
+            heap.remove(handle[o])
+            handle[o] = heap.push(t + rng.expovariate(0.5), o)
+    return checksum, 0, len(heap)
+
+
+def benchmark(n: int = 50_000, m: int = 400_000, entities: int = 20_000,
+              events: int = 200_000, reschedule: float = 0.8) -> None:
+    graph = random_graph(n, m)
+    print(f"Dijkstra, n={n} m={m}")
+    t0 = time.perf_counter()
+    ref, stale = dijkstra_lazy(n, *graph, 0)
+    print(f"  heapq + lazy deletion   {time.perf_counter() - t0:6.2f} s  ({stale} stale pops)")
+    for name, run in (("indexed binary heap", lambda: dijkstra_indexed(n, *graph, 0, d=2)),
+                      ("indexed 4-ary heap", lambda: dijkstra_indexed(n, *graph, 0, d=4)),
+                      ("pairing heap", lambda: dijkstra_handles(n, *graph, 0, PairingHeap())),
+                      ("Fibonacci heap", lambda: dijkstra_handles(n, *graph, 0, FibonacciHeap()))):
+        t0 = time.perf_counter()
+        assert run() == ref
+        print(f"  {name:<23} {time.perf_counter() - t0:6.2f} s")
+
+    print(f"event simulation, {entities} entities, {events} events, "
+          f"reschedule probability {reschedule}")
+    t0 = time.perf_counter()
+    ref_sum, stale, size = simulate_lazy(entities, events, reschedule)
+    print(f"  heapq + lazy deletion   {time.perf_counter() - t0:6.2f} s  "
+          f"({stale} stale pops, final heap {size})")
+    for name, run in (("indexed binary heap", lambda: simulate_indexed(entities, events, reschedule, d=2)),
+                      ("indexed 4-ary heap", lambda: simulate_indexed(entities, events, reschedule, d=4)),
+                      ("pairing heap", lambda: simulate_handles(entities, events, reschedule, PairingHeap())),
+                      ("Fibonacci heap", lambda: simulate_handles(entities, events, reschedule,
+                                                                  FibonacciHeap()))):
+        t0 = time.perf_counter()
+        total, _, size = run()
+        assert total == ref_sum
+        print(f"  {name:<23} {time.perf_counter() - t0:6.2f} s  (final heap {size})")
+
+
+def demo():
+    h = IndexedHeap(d=4)
+    for item, key in enumerate([7, 3, 9, 5, 1]):
+        h.push(item, key)
+    h.decrease_key(2, 0)
+    h.remove(4)
+    h.update(1, 8)
+    print("indexed heap order:", [h.pop() for _ in range(len(h))])
+    p = PairingHeap()
+    nodes = [p.push(k, f"job{k}") for k in (7, 3, 9, 5)]
+    p.decrease_key(nodes[2], 1)
+    p.remove(nodes[1])
+    print("pairing heap order:", [p.pop() for _ in range(len(p))])
+    f = FibonacciHeap()
+    nodes = [f.push(k, k) for k in (7, 3, 9, 5)]
+    f.pop()
+    f.decrease_key(nodes[2], 2)
+    print("Fibonacci heap order:", [f.pop()[0] for _ in range(len(f))])
+    graph = random_graph(6, 14, seed=3)
+    print("Dijkstra from 0:", dijkstra_indexed(6, *graph, 0))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,5 +1,459 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 04_Data Structures — Trees & Hierarchical
+Subtopic: B-Trees and variants (B+, 2-3-4)
+Description: Disk-resident B+tree over fixed-size pages in an ``mmap``-ed
+file, with an LRU page cache, bottom-up bulk loading and leaf-linked range
+scans.
+
+Keys and values are signed 64-bit integers, e.g. a timestamp key and an
+offset into a data file. Page 0 holds the metadata; every other page is a
+node:
+
+- 16-byte header (kind, count, next-leaf link);
+- leaf pages: ``leaf_cap`` keys, then ``leaf_cap`` values;
+- internal pages: ``inner_cap`` separator keys, then ``inner_cap + 1`` child
+  page numbers.
+
+With 4 KiB pages that is 255 entries per leaf and a fanout of 255, so a
+billion keys need only four levels. ``fanout`` caps both capacities to trade
+height against page fill, and ``page_size`` is any multiple of 512 up to
+1 MiB (entry counts and capacities are stored as 16-bit fields).
+A cache miss decodes a whole page, so in the benchmark small fanouts win
+point lookups and large pages win scans and file size.
+
+The ``_Pager`` maps the file and grows it by doubling. Decoded pages (plain
+int lists, read with ``array.frombytes``) sit in an ``OrderedDict`` LRU of
+``cache_pages`` entries; dirty pages are packed back into the mapping when
+they are evicted or on ``flush``. Only the cached pages live in Python
+memory, so the index can be far larger than RAM.
+
+``bulk_load`` streams sorted items into full leaves, written straight to the
+file and linked as they go. Each level of separators is then built from the
+one below it, so every page is written exactly once. ``insert`` splits
+full nodes on the way back up. ``delete`` removes the entry from its leaf
+without merging underfull pages, the usual trade-off for append-mostly
+time-series data. ``range`` descends once, then follows the next-leaf links.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_META = struct.Struct("<4sHxxIHHqqqqq")  # magic, version, page size, caps, root, height, pages, keys, first leaf
+_HEADER = struct.Struct("<BxHxxxxq")       # kind, count, next leaf
+_MAGIC = b"BPT1"
+_VERSION = 1
+_MAX_PAGE = 1 << 20  # keeps leaf_cap and the per-page count within uint16
+LEAF, INNER = 1, 2
+NONE = -1
+
+
+class _Page:
+    __slots__ = ("no", "kind", "keys", "vals", "next", "dirty")
+
+    def __init__(self, no: int, kind: int, keys: List[int], vals: List[int], nxt: int = NONE) -> None:
+        self.no, self.kind, self.keys, self.vals, self.next = no, kind, keys, vals, nxt
+        self.dirty = False
+
+
+class _Pager:
+    """Page file behind an ``mmap`` plus an LRU cache of decoded pages."""
+
+    def __init__(self, path: str, page_size: int, cache_pages: int) -> None:
+        self.path = path
+        self.page_size = page_size
+        self.cache_pages = max(4, cache_pages)
+        self.cache: "OrderedDict[int, _Page]" = OrderedDict()
+        self.hits = self.misses = 0
+        self.file = open(path, "r+b")
+        size = os.fstat(self.file.fileno()).st_size
+        if size < page_size:
+            self.file.truncate(page_size * 16)
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        self.leaf_cap = self.inner_cap = 0  # set by the tree
+
+    def ensure(self, n_pages: int) -> None:
+        need = n_pages * self.page_size
+        if need > len(self.mm):
+            self.mm.close()
+            self.file.truncate(max(need, 2 * (os.fstat(self.file.fileno()).st_size)))
+            self.mm = mmap.mmap(self.file.fileno(), 0)
+
+    def _decode(self, no: int) -> _Page:
+        base = no * self.page_size
+        mm = self.mm
+        kind, count, nxt = _HEADER.unpack_from(mm, base)
+        off = base + _HEADER.size
+        cap = self.leaf_cap if kind == LEAF else self.inner_cap
+        keys = array("q")
+        keys.frombytes(mm[off:off + 8 * count])
+        vals = array("q")
+        nv = count if kind == LEAF else count + 1
+        voff = off + 8 * cap
+        vals.frombytes(mm[voff:voff + 8 * nv])
+        return _Page(no, kind, keys.tolist(), vals.tolist(), nxt)
+
+    def write(self, page: _Page) -> None:
+        base = page.no * self.page_size
+        mm = self.mm
+        _HEADER.pack_into(mm, base, page.kind, len(page.keys), page.next)
+        off = base + _HEADER.size
+        cap = self.leaf_cap if page.kind == LEAF else self.inner_cap
+        kb = array("q", page.keys).tobytes()
+        mm[off:off + len(kb)] = kb
+        vb = array("q", page.vals).tobytes()
+        mm[off + 8 * cap:off + 8 * cap + len(vb)] = vb
+        page.dirty = False
+
+    def get(self, no: int) -> _Page:
+        cache = self.cache
+        page = cache.get(no)
+        if page is not None:
+            cache.move_to_end(no)
+            self.hits += 1
+            return page
+        self.misses += 1
+        page = self._decode(no)
+        self._admit(page)
+        return page
+
+    def _admit(self, page: _Page) -> None:
+        cache = self.cache
+        cache[page.no] = page
+        while len(cache) > self.cache_pages:
+            _, old = cache.popitem(last=False)
+            if old.dirty:
+                self.write(old)
+
+    def new(self, page: _Page) -> None:
+        page.dirty = True
+        self._admit(page)
+
+    def put(self, page: _Page) -> None:
+        """Mark a modified page dirty, re-admitting it if it was evicted meanwhile."""
+        page.dirty = True
+        if self.cache.get(page.no) is page:
+            self.cache.move_to_end(page.no)
+        else:
+            self._admit(page)
+
+    def flush(self) -> None:
+        for page in self.cache.values():
+            if page.dirty:
+                self.write(page)
+        self.mm.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.cache.clear()
+        self.mm.close()
+        self.file.close()
+
+
+class BPlusTree:
+    """Ordered int64 -> int64 index stored in a page file."""
+
+    def __init__(self, path: str, page_size: int = 4096, fanout: Optional[int] = None,
+                 cache_pages: int = 1024) -> None:
+        exists = os.path.exists(path) and os.path.getsize(path) >= _META.size
+        if not exists:
+            if page_size % 512 or not 512 <= page_size <= _MAX_PAGE:
+                raise ValueError(f"page_size must be a multiple of 512 between 512 and {_MAX_PAGE}")
+            open(path, "wb").close()
+        else:
+            with open(path, "rb") as f:
+                head = f.read(_META.size)
+            magic, version, page_size = struct.unpack_from("<4sHxxI", head)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{path} is not a B+tree file (version {_VERSION})")
+        self.pager = _Pager(path, page_size, cache_pages)
+        self.page_size = page_size
+        if exists:
+            (_, _, _, self.leaf_cap, self.inner_cap, self.root, self.height,
+             self.n_pages, self.n_keys, self.first_leaf) = _META.unpack_from(self.pager.mm, 0)
+        else:
+            body = page_size - _HEADER.size
+            self.leaf_cap = body // 16
+            self.inner_cap = (body - 8) // 16
+            if fanout is not None:
+                if fanout < 3:
+                    raise ValueError("fanout must be at least 3")
+                self.leaf_cap = min(self.leaf_cap, fanout)
+                self.inner_cap = min(self.inner_cap, fanout - 1)
+            self.pager.leaf_cap, self.pager.inner_cap = self.leaf_cap, self.inner_cap
+            self.n_pages, self.n_keys = 1, 0
+            self.root = self._alloc(LEAF, [], []).no
+            self.first_leaf = self.root
+            self.height = 1
+        self.pager.leaf_cap, self.pager.inner_cap = self.leaf_cap, self.inner_cap
+
+    # ------------------------------------------------------------ plumbing
+    def _alloc(self, kind: int, keys: List[int], vals: List[int], nxt: int = NONE,
+               cached: bool = True) -> _Page:
+        no = self.n_pages
+        self.n_pages += 1
+        self.pager.ensure(self.n_pages)
+        page = _Page(no, kind, keys, vals, nxt)
+        if cached:
+            self.pager.new(page)
+        else:
+            self.pager.write(page)
+        return page
+
+    def _write_meta(self) -> None:
+        _META.pack_into(self.pager.mm, 0, _MAGIC, _VERSION, self.page_size, self.leaf_cap,
+                        self.inner_cap, self.root, self.height, self.n_pages, self.n_keys,
+                        self.first_leaf)
+
+    def flush(self) -> None:
+        self._write_meta()
+        self.pager.flush()
+
+    def close(self) -> None:
+        self._write_meta()
+        self.pager.close()
+
+    def __enter__(self) -> "BPlusTree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.n_keys
+
+    def _leaf_for(self, key: int, path: Optional[List[Tuple[_Page, int]]] = None) -> _Page:
+        get = self.pager.get
+        page = get(self.root)
+        while page.kind == INNER:
+            i = bisect_right(page.keys, key)
+            if path is not None:
+                path.append((page, i))
+            page = get(page.vals[i])
+        return page
+
+    # ------------------------------------------------------------ point operations
+    def get(self, key: int, default: Optional[int] = None) -> Optional[int]:
+        leaf = self._leaf_for(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.vals[i]
+        return default
+
+    def __contains__(self, key: int) -> bool:
+        return self.get(key) is not None
+
+    def insert(self, key: int, value: int) -> None:
+        path: List[Tuple[_Page, int]] = []
+        leaf = self._leaf_for(key, path)
+        keys = leaf.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            leaf.vals[i] = value
+            self.pager.put(leaf)
+            return
+        keys.insert(i, key)
+        leaf.vals.insert(i, value)
+        self.n_keys += 1
+        if len(keys) <= self.leaf_cap:
+            self.pager.put(leaf)
+            return
+        # Allocating may evict pages on ``path``, so every modified page is
+        # handed back to the pager with ``put`` once it is final.
+        mid = len(keys) // 2
+        right = self._alloc(LEAF, keys[mid:], leaf.vals[mid:], leaf.next)
+        del keys[mid:], leaf.vals[mid:]
+        leaf.next = right.no
+        self.pager.put(leaf)
+        sep, child = right.keys[0], right.no
+        while path:
+            node, i = path.pop()
+            node.keys.insert(i, sep)
+            node.vals.insert(i + 1, child)
+            if len(node.keys) <= self.inner_cap:
+                self.pager.put(node)
+                return
+            mid = len(node.keys) // 2
+            sep = node.keys[mid]
+            right = self._alloc(INNER, node.keys[mid + 1:], node.vals[mid + 1:])
+            del node.keys[mid:], node.vals[mid + 1:]
+            self.pager.put(node)
+            child = right.no
+        root = self._alloc(INNER, [sep], [self.root, child])
+        self.root = root.no
+        self.height += 1
+
+    def delete(self, key: int) -> bool:
+        """Remove ``key`` from its leaf (no rebalancing); False if absent."""
+        leaf = self._leaf_for(key)
+        i = bisect_left(leaf.keys, key)
+        if i == len(leaf.keys) or leaf.keys[i] != key:
+            return False
+        del leaf.keys[i], leaf.vals[i]
+        self.pager.put(leaf)
+        self.n_keys -= 1
+        return True
+
+    # ------------------------------------------------------------ scans
+    def range(self, lo: Optional[int] = None, hi: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        """``(key, value)`` for ``lo <= key <= hi`` in key order."""
+        if lo is None:
+            page = self.pager.get(self.first_leaf)
+            i = 0
+        else:
+            page = self._leaf_for(lo)
+            i = bisect_left(page.keys, lo)
+        while True:
+            keys, vals = page.keys, page.vals
+            if hi is not None and keys and keys[-1] > hi:
+                j = bisect_right(keys, hi, i)
+                yield from zip(keys[i:j], vals[i:j])
+                return
+            yield from zip(keys[i:], vals[i:])
+            if page.next == NONE:
+                return
+            page = self.pager.get(page.next)
+            i = 0
+
+    # ------------------------------------------------------------ bulk load
+    def bulk_load(self, items: Iterable[Tuple[int, int]], fill: float = 1.0) -> None:
+        """Build the tree from strictly increasing keys; the tree must be empty.
+
+        ``fill`` in ``(0, 1]``; below 1 leaves room in every page for later
+        inserts.
+        """
+        if self.n_keys:
+            raise ValueError("bulk_load needs an empty tree")
+        if not 0 < fill <= 1:
+            raise ValueError(f"fill must be in (0, 1], got {fill}")
+        leaf_n = max(1, int(self.leaf_cap * fill))
+        inner_n = min(self.inner_cap + 1, max(3, int((self.inner_cap + 1) * fill)))
+        self.pager.cache.clear()
+        self.n_pages = 1
+        level: List[Tuple[int, int]] = []  # (first key, page number) per node
+        keys: List[int] = []
+        vals: List[int] = []
+        prev: Optional[_Page] = None
+        last = None
+        count = 0
+
+        def emit() -> None:
+            nonlocal prev
+            page = _Page(self.n_pages, LEAF, keys[:], vals[:])
+            self.n_pages += 1
+            self.pager.ensure(self.n_pages)
+            if prev is not None:
+                prev.next = page.no
+                self.pager.write(prev)
+            level.append((page.keys[0], page.no))
+            prev = page
+
+        for k, v in items:
+            if last is not None and k <= last:
+                raise ValueError("bulk_load needs strictly increasing keys")
+            last = k
+            keys.append(k)
+            vals.append(v)
+            count += 1
+            if len(keys) == leaf_n:
+                emit()
+                keys.clear()
+                vals.clear()
+        if keys or prev is None:
+            if keys:
+                emit()
+            else:
+                level.append((0, self._alloc(LEAF, [], [], cached=False).no))
+        if prev is not None:
+            self.pager.write(prev)
+        self.first_leaf = level[0][1]
+        self.height = 1
+        while len(level) > 1:
+            # Spread the level evenly over the fewest parents; with at least
+            # three children per full parent, no parent is left with one child.
+            groups = -(-len(level) // inner_n)
+            size, bigger = divmod(len(level), groups)
+            upper = []
+            s = 0
+            for g in range(groups):
+                group = level[s:s + size + (g < bigger)]
+                s += len(group)
+                page = self._alloc(INNER, [k for k, _ in group[1:]], [no for _, no in group],
+                                   cached=False)
+                upper.append((group[0][0], page.no))
+            level = upper
+            self.height += 1
+        self.root = level[0][1]
+        self.n_keys = count
+        self._write_meta()
+
+    def stats(self) -> dict:
+        p = self.pager
+        total = p.hits + p.misses
+        return {"height": self.height, "pages": self.n_pages, "keys": self.n_keys,
+                "file_mb": self.n_pages * self.page_size / 2 ** 20,
+                "hit_rate": p.hits / total if total else 0.0}
+
+
+def benchmark(n: int = 500_000, lookups: int = 50_000, inserts: int = 20_000,
+              configs=((4096, None), (4096, 64), (16384, None)), cache_pages: int = 256) -> None:
+    rng = random.Random(0)
+    keys = sorted(rng.sample(range(100 * n), n))
+    probes = [rng.choice(keys) for _ in range(lookups)]
+    extra = [rng.randrange(100 * n) for _ in range(inserts)]
+    print(f"{n} int64 keys, cache {cache_pages} pages")
+    for page_size, fanout in configs:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.bpt")
+            tree = BPlusTree(path, page_size, fanout, cache_pages)
+            t0 = time.perf_counter()
+            tree.bulk_load((k, i) for i, k in enumerate(keys))
+            load = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for k in probes:
+                tree.get(k)
+            get = time.perf_counter() - t0
+            hit = tree.stats()["hit_rate"]
+            t0 = time.perf_counter()
+            scanned = sum(1 for _ in tree.range(keys[n // 4], keys[3 * n // 4]))
+            scan = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for k in extra:
+                tree.insert(k, -1)
+            ins = time.perf_counter() - t0
+            s = tree.stats()
+            tree.close()
+            print(f"  page {page_size:>5} fanout {fanout or tree.inner_cap + 1:>4}: height {s['height']}, "
+                  f"{s['file_mb']:6.1f} MiB | bulk load {n / load:9.0f}/s | get {lookups / get:8.0f}/s "
+                  f"(hit {hit:.0%}) | scan {scanned / scan:9.0f} keys/s | insert {inserts / ins:7.0f}/s")
+
+
+def demo():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "demo.bpt")
+        with BPlusTree(path, page_size=512, fanout=4, cache_pages=8) as tree:
+            tree.bulk_load((t, t * 10) for t in range(0, 40, 2))
+            for t in (5, 17, 41, 1):
+                tree.insert(t, t * 10)
+            tree.delete(6)
+            print("height:", tree.height, "keys:", len(tree))
+            print("range(10, 20):", list(tree.range(10, 20)))
+        with BPlusTree(path) as tree:
+            print("reopened: get(17) =", tree.get(17), "get(6) =", tree.get(6),
+                  "first five:", list(tree.range())[:5])
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,19 +1,420 @@
 """
 Topic: 04_Data Structures — Trees & Hierarchical
 Subtopic: Tries / Prefix Trees
-Description: Generic example stub.
+Description: Double-array (base/check) trie over UTF-8 bytes, bulk-built from
+a sorted word list, saved as a flat binary file that opens through ``mmap``,
+with exact lookup, prefix enumeration and weighted top-k completion.
 
-TODO:
-- Read the README.md in this folder.
-- Run this file to see examples, then extend experiments.
+Every trie node is a slot in parallel typed arrays. The child of node ``s``
+under label ``c`` is slot ``t = base[s] + c``, and it really belongs to ``s``
+iff ``check[t] == s``, so a transition is two array reads. Labels are
+``byte + 1``; label 0 marks end-of-word and leads to a terminal slot whose
+``base`` holds ``-(word id + 1)``, the word id being its rank in the
+sorted input.
+
+``child``/``sibling`` hold each node's first child label and each slot's
+next sibling label, so children are enumerated without probing all 257
+labels. ``maxw`` holds the largest weight in each subtree (a terminal holds
+its word's weight). ``top_k`` is a best-first search on ``maxw``: it
+expands only nodes that can still beat the k-th result, so a short prefix
+with millions of completions costs O(k * fanout * log) rather than a scan of
+its subtree.
+
+The builder walks the sorted words depth-first with an explicit stack. For
+each node it places the children with a first-fit search over a ``bytearray``
+of used slots; ``bytearray.find`` runs in C, so the search stays cheap.
+
+The file is a 24-byte header followed by the ``maxw`` (int64), ``base`` and
+``check`` (int32), and ``child`` and ``sibling`` (int16) arrays, each
+8-byte aligned. ``load`` maps it read-only and casts zero-copy
+``memoryview`` arrays over it, so opening a 20M-word trie does no parsing
+and no allocation: pages are faulted in as queries touch them.
 """
 from __future__ import annotations
-from typing import *
-import sys, os, math, json, re, pathlib, itertools, collections, functools, logging, datetime
-# Optional third-party (uncomment if installed)
-# import numpy as np
-# import pandas as pd
+
+import heapq
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+_HEADER = struct.Struct("<4sHxxqq")  # magic, version, slots, words
+_MAGIC = b"DATR"
+_VERSION = 1
+_SPANS = (("maxw", "q", 8), ("base", "i", 4), ("check", "i", 4), ("child", "h", 2),
+          ("sibling", "h", 2))
+_NO_WEIGHT = -(1 << 63)
+_FREE = -1
+
+
+class DoubleArrayTrie:
+    """Read-only trie; build with ``build`` or open a saved file with ``load``."""
+
+    def __init__(self, n_words: int, maxw, base, check, child, sibling) -> None:
+        self.n_words = n_words
+        self.maxw, self.base, self.check = maxw, base, check
+        self.child, self.sibling = child, sibling
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return self.n_words
+
+    # ------------------------------------------------------------ build
+    @classmethod
+    def build(cls, words: Sequence[str], weights: Optional[Sequence[int]] = None) -> "DoubleArrayTrie":
+        """Bulk build from strictly increasing ``words`` (optional int weights)."""
+        keys = [w.encode("utf-8") for w in words]
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError(f"words must be sorted and unique: {words[i - 1]!r} >= {words[i]!r}")
+        if weights is None:
+            weights = [0] * len(keys)
+        elif len(weights) != len(keys):
+            raise ValueError("need exactly one weight per word")
+
+        size = 1024
+        base = [0] * size
+        check = [_FREE] * size
+        child = [-1] * size
+        sibling = [-1] * size
+        maxw = [_NO_WEIGHT] * size
+        used = bytearray(size)
+        used[0] = 1
+        check[0] = 0
+        created: List[int] = []
+        first_free = 1
+
+        def grow(upto: int) -> None:
+            nonlocal size
+            if upto <= size:
+                return
+            extra = max(upto, 2 * size) - size
+            base.extend([0] * extra)
+            check.extend([_FREE] * extra)
+            child.extend([-1] * extra)
+            sibling.extend([-1] * extra)
+            maxw.extend([_NO_WEIGHT] * extra)
+            used.extend(bytes(extra))
+            size += extra
+
+        def place(labels: List[int]) -> int:
+            c0 = labels[0]
+            pos = used.find(0, max(first_free, c0 + 1))
+            while True:
+                if pos < 0:
+                    pos = size
+                b = pos - c0
+                grow(b + 258)
+                if all(not used[b + c] for c in labels):
+                    return b
+                pos = used.find(0, pos + 1)
+
+        stack = [(0, 0, len(keys), 0)] if keys else []
+        while stack:
+            s, lo, hi, d = stack.pop()
+            labels: List[int] = []
+            spans: List[Tuple[int, int]] = []
+            i = lo
+            if len(keys[i]) == d:  # shortest first: the word ending here
+                labels.append(0)
+                spans.append((i, i + 1))
+                i += 1
+            while i < hi:
+                c = keys[i][d]
+                j = i + 1
+                while j < hi and keys[j][d] == c:
+                    j += 1
+                labels.append(c + 1)
+                spans.append((i, j))
+                i = j
+            b = place(labels)
+            base[s] = b
+            child[s] = labels[0]
+            for k, c in enumerate(labels):
+                t = b + c
+                used[t] = 1
+                check[t] = s
+                sibling[t] = labels[k + 1] if k + 1 < len(labels) else -1
+                created.append(t)
+            if first_free < size and used[first_free]:
+                first_free = used.find(0, first_free)
+                if first_free < 0:
+                    first_free = size
+            for c, (i, j) in zip(reversed(labels), reversed(spans)):
+                t = b + c
+                if c == 0:
+                    base[t] = -(i + 1)
+                    maxw[t] = weights[i]
+                else:
+                    stack.append((t, i, j, d + 1))
+        for t in reversed(created):  # children were created after their parents
+            p = check[t]
+            if maxw[t] > maxw[p]:
+                maxw[p] = maxw[t]
+        n = (max(created) + 1) if created else 1
+        return cls(len(keys), array("q", maxw[:n]), array("i", base[:n]), array("i", check[:n]),
+                   array("h", child[:n]), array("h", sibling[:n]))
+
+    # ------------------------------------------------------------ file format
+    def save(self, path: str) -> None:
+        with open(path, "wb") as fh:
+            fh.write(_HEADER.pack(_MAGIC, _VERSION, len(self.base), self.n_words))
+            for name, code, _ in _SPANS:
+                fh.write(b"\0" * (-fh.tell() % 8))
+                buf = getattr(self, name)
+                fh.write(buf.tobytes() if isinstance(buf, array) else buf)
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "DoubleArrayTrie":
+        """Open a file written by ``save``; zero-copy views with ``use_mmap``."""
+        with open(path, "rb") as fh:
+            head = fh.read(_HEADER.size)
+            if len(head) < _HEADER.size:
+                raise ValueError(f"{path}: truncated trie header")
+            magic, version, n_slots, n_words = _HEADER.unpack(head)
+            if magic != _MAGIC:
+                raise ValueError(f"{path}: not a double-array trie file")
+            if version != _VERSION:
+                raise ValueError(f"{path}: unsupported trie format version {version}")
+            spans = []
+            pos = _HEADER.size
+            for _, code, width in _SPANS:
+                pos += -pos % 8
+                spans.append((code, pos, width * n_slots))
+                pos += width * n_slots
+            if os.fstat(fh.fileno()).st_size < pos:
+                raise ValueError(f"{path}: truncated trie data")
+            if use_mmap:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(mm)
+                bufs = [view[p:p + nbytes].cast(code) for code, p, nbytes in spans]
+                view.release()
+            else:
+                bufs = []
+                for code, p, nbytes in spans:
+                    fh.seek(p)
+                    a = array(code)
+                    a.frombytes(fh.read(nbytes))
+                    bufs.append(a)
+        trie = cls(n_words, *bufs)
+        if use_mmap:
+            trie._mmap = mm
+        return trie
+
+    def close(self) -> None:
+        """Release the file mapping of a trie returned by ``load``."""
+        if self._mmap is not None:
+            for name, _, _ in _SPANS:
+                buf = getattr(self, name)
+                if isinstance(buf, memoryview):
+                    buf.release()
+                    setattr(self, name, None)
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "DoubleArrayTrie":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------ queries
+    def _walk(self, key: bytes) -> int:
+        """Slot reached by ``key`` from the root, or -1."""
+        if not self.n_words:
+            return -1
+        base, check = self.base, self.check
+        n = len(check)
+        s = 0
+        for byte in key:
+            t = base[s] + byte + 1
+            if t >= n or check[t] != s:
+                return -1
+            s = t
+        return s
+
+    def lookup(self, word: str) -> Optional[int]:
+        """Word id (rank in the sorted build input), or None."""
+        s = self._walk(word.encode("utf-8"))
+        if s < 0 or self.child[s] != 0:
+            return None
+        return -self.base[self.base[s]] - 1
+
+    def __contains__(self, word: str) -> bool:
+        return self.lookup(word) is not None
+
+    def weight(self, word: str) -> Optional[int]:
+        s = self._walk(word.encode("utf-8"))
+        if s < 0 or self.child[s] != 0:
+            return None
+        return self.maxw[self.base[s]]
+
+    def items(self, prefix: str = "", limit: Optional[int] = None) -> Iterator[Tuple[str, int]]:
+        """``(word, weight)`` for every word starting with ``prefix``, in order."""
+        pb = prefix.encode("utf-8")
+        s = self._walk(pb)
+        if s < 0:
+            return
+        base, child, sibling, maxw = self.base, self.child, self.sibling, self.maxw
+        stack = [(s, pb)]
+        emitted = 0
+        while stack:
+            s, path = stack.pop()
+            b = base[s]
+            kids = []
+            c = child[s]
+            while c != -1:
+                kids.append(c)
+                c = sibling[b + c]
+            for c in reversed(kids):
+                t = b + c
+                if c == 0:
+                    stack.append((-1 - t, path))
+                else:
+                    stack.append((t, path + bytes((c - 1,))))
+            while stack and stack[-1][0] < 0:  # terminals come out in order
+                t, path = stack.pop()
+                yield path.decode("utf-8"), maxw[-1 - t]
+                emitted += 1
+                if limit is not None and emitted >= limit:
+                    return
+
+    def keys(self, prefix: str = "", limit: Optional[int] = None) -> Iterator[str]:
+        return (w for w, _ in self.items(prefix, limit))
+
+    def top_k(self, prefix: str, k: int = 10) -> List[Tuple[str, int]]:
+        """The ``k`` heaviest completions of ``prefix`` (ties in word order)."""
+        pb = prefix.encode("utf-8")
+        s = self._walk(pb)
+        if s < 0 or k <= 0:
+            return []
+        base, child, sibling, maxw = self.base, self.child, self.sibling, self.maxw
+        heap = [(-maxw[s], pb, s)]
+        out: List[Tuple[str, int]] = []
+        while heap and len(out) < k:
+            negw, path, s = heapq.heappop(heap)
+            if s < 0:
+                out.append((path.decode("utf-8"), -negw))
+                continue
+            b = base[s]
+            c = child[s]
+            while c != -1:
+                t = b + c
+                if c == 0:
+                    heapq.heappush(heap, (-maxw[t], path, -1))
+                else:
+                    heapq.heappush(heap, (-maxw[t], path + bytes((c - 1,)), t))
+                c = sibling[t]
+        return out
+
+    def nbytes(self) -> int:
+        return sum(len(getattr(self, name)) * width for name, _, width in _SPANS)
+
+
+# ------------------------------------------------------------ baseline
+def dict_trie(words: Sequence[str], weights: Sequence[int]) -> dict:
+    """Dict-of-dicts trie; the end of a word is stored under the key ``None``."""
+    root: dict = {}
+    for w, x in zip(words, weights):
+        node = root
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[None] = x
+    return root
+
+
+def dict_top_k(root: dict, prefix: str, k: int) -> List[Tuple[str, int]]:
+    node = root
+    for ch in prefix:
+        node = node.get(ch)
+        if node is None:
+            return []
+    found = []
+    stack = [(node, prefix)]
+    while stack:
+        node, path = stack.pop()
+        for ch, sub in node.items():
+            if ch is None:
+                found.append((path, sub))
+            else:
+                stack.append((sub, path + ch))
+    return heapq.nsmallest(k, found, key=lambda p: (-p[1], p[0]))
+
+
+def random_vocabulary(n: int, seed: int = 0) -> Tuple[List[str], List[int]]:
+    rng = random.Random(seed)
+    letters = "etaoinshrdlcumwfgypbvkjxqz"
+    freq = [1 / (i + 1) for i in range(len(letters))]
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choices(letters, weights=freq, k=rng.randint(3, 12))))
+    words = sorted(words)
+    return words, [int(1e6 / (rng.random() * n + 1)) for _ in words]
+
+
+def benchmark(n: int = 200_000, queries: int = 500, k: int = 10) -> None:
+    words, weights = random_vocabulary(n)
+    print(f"{n} words, top-{k} for {queries} random 1-3 letter prefixes")
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    dt = dict_trie(words, weights)
+    dict_build = time.perf_counter() - t0
+    dict_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    t0 = time.perf_counter()
+    trie = DoubleArrayTrie.build(words, weights)
+    build = time.perf_counter() - t0
+    print(f"  dict-of-dicts trie: build {dict_build:5.2f} s, {dict_mem / n:6.0f} bytes/word")
+    print(f"  double-array trie:  build {build:5.2f} s, {trie.nbytes() / n:6.0f} bytes/word "
+          f"({len(trie.base)} slots)")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "words.dat")
+        trie.save(path)
+        t0 = time.perf_counter()
+        mapped = DoubleArrayTrie.load(path)
+        opened = time.perf_counter() - t0
+        print(f"  open saved file via mmap {opened * 1e3:.3f} ms")
+        rng = random.Random(1)
+        prefixes = [w[:rng.randint(1, 3)] for w in rng.sample(words, queries)]
+        t0 = time.perf_counter()
+        ref = [dict_top_k(dt, p, k) for p in prefixes]
+        base = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        got = [mapped.top_k(p, k) for p in prefixes]
+        best = time.perf_counter() - t0
+        assert got == ref
+        print(f"  top-{k}: dict trie scan {queries / base:8.0f} q/s, "
+              f"double-array best-first {queries / best:8.0f} q/s")
+        probe = rng.sample(words, min(n, 50_000))
+        t0 = time.perf_counter()
+        assert all(w in mapped for w in probe)
+        print(f"  exact lookups {len(probe) / (time.perf_counter() - t0):8.0f} /s")
+        mapped.close()
+
+
 def demo():
-    print("Fill in your examples here.")
+    words = ["car", "card", "care", "careful", "cart", "cat", "dog", "dot", "über"]
+    weights = [50, 20, 70, 5, 30, 90, 40, 10, 15]
+    trie = DoubleArrayTrie.build(words, weights)
+    print("lookup('care'):", trie.lookup("care"), "weight:", trie.weight("care"),
+          "'ca' in trie:", "ca" in trie)
+    print("prefix 'car':", list(trie.keys("car")))
+    print("top 3 for 'ca':", trie.top_k("ca", 3))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "demo.dat")
+        trie.save(path)
+        with DoubleArrayTrie.load(path) as mapped:
+            print("mmap: top 2 for '':", mapped.top_k("", 2), "'über' ->", mapped.lookup("über"))
+
+
 if __name__ == "__main__":
-    demo()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,19 +1,269 @@
 """
 Topic: 10_Graph Algorithms
-Subtopic: Union-Find / Disjoint Set
-Description: Generic example stub.
+Subtopic: Cycle Detection (incl. Union-Find approach)
+Description: Fail-fast cycle detection over a stream of edges.
 
-TODO:
-- Read the README.md in this folder.
-- Run this file to see examples, then extend experiments.
+Edges are consumed one at a time from any iterator (``read_edges`` parses a
+text file in chunks), so the graph is never materialised up front and the
+scan stops at the first cycle-closing edge.
+
+* Undirected: union-find with path halving and union by size, O(α(n)) per
+  edge. Only the spanning-forest edges are remembered, so a witness cycle can
+  be produced on demand by walking the forest between the two endpoints.
+* Directed: an online topological order (Pearce-Kelly). An edge that agrees
+  with the current order costs O(1); otherwise only the vertices positioned
+  between its endpoints are searched, never the whole graph. Reaching the tail
+  from the head during that search is exactly the cycle, and the search tree
+  gives the witness.
+
+Vertex labels can be any hashable values; they are mapped to dense ids.
 """
 from __future__ import annotations
-from typing import *
-import sys, os, math, json, re, pathlib, itertools, collections, functools, logging, datetime
-# Optional third-party (uncomment if installed)
-# import numpy as np
-# import pandas as pd
+
+import sys
+import time
+from array import array
+from collections import deque
+from typing import Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class CycleReport(NamedTuple):
+    index: int          # position of the closing edge in the stream
+    edge: Tuple[Hashable, Hashable]
+    cycle: Optional[List[Hashable]]  # [a, ..., a] when a witness was requested
+
+
+def read_edges(path: str, chunk_bytes: int = 1 << 20, comments: str = "#") -> Iterator[Tuple[str, str]]:
+    """Yield ``(u, v)`` label pairs from a whitespace edge file, chunk by chunk."""
+    with open(path) as fh:
+        while True:
+            lines = fh.readlines(chunk_bytes)
+            if not lines:
+                return
+            for line in lines:
+                parts = line.split(comments, 1)[0].split()
+                if len(parts) >= 2:
+                    yield parts[0], parts[1]
+
+
+class _Ids:
+    """Dense integer ids for arbitrary hashable vertex labels."""
+
+    def __init__(self) -> None:
+        self.index = {}
+        self.labels: List[Hashable] = []
+
+    def get(self, label: Hashable) -> Tuple[int, bool]:
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+            return i, True
+        return i, False
+
+
+class UndirectedCycleDetector:
+    """Union-find over a growing vertex set plus the spanning forest."""
+
+    def __init__(self) -> None:
+        self._ids = _Ids()
+        self._parent = array("q")
+        self._size = array("q")
+        self._forest: List[List[int]] = []
+        self.closing: Optional[Tuple[int, int]] = None
+
+    def _vertex(self, label: Hashable) -> int:
+        i, new = self._ids.get(label)
+        if new:
+            self._parent.append(i)
+            self._size.append(1)
+            self._forest.append([])
+        return i
+
+    def _find(self, x: int) -> int:
+        p = self._parent
+        while p[x] != x:
+            p[x] = p[p[x]]
+            x = p[x]
+        return x
+
+    def add_edge(self, u: Hashable, v: Hashable) -> bool:
+        """Record ``u - v``; True if it closes a cycle (the edge is not stored)."""
+        a, b = self._vertex(u), self._vertex(v)
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            self.closing = (a, b)
+            return True
+        size = self._size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        size[ra] += size[rb]
+        self._forest[a].append(b)
+        self._forest[b].append(a)
+        return False
+
+    def witness(self) -> Optional[List[Hashable]]:
+        """The cycle closed by the last rejected edge, as ``[u, ..., v, u]``."""
+        if self.closing is None:
+            return None
+        a, b = self.closing
+        labels = self._ids.labels
+        if a == b:
+            return [labels[a], labels[a]]
+        prev = {a: -1}
+        q = deque([a])
+        while b not in prev:
+            x = q.popleft()
+            for y in self._forest[x]:
+                if y not in prev:
+                    prev[y] = x
+                    q.append(y)
+        path = [b]
+        while path[-1] != a:
+            path.append(prev[path[-1]])
+        path.reverse()
+        return [labels[x] for x in path] + [labels[a]]
+
+
+class DirectedCycleDetector:
+    """Pearce-Kelly online topological order over a growing vertex set."""
+
+    def __init__(self) -> None:
+        self._ids = _Ids()
+        self._out: List[List[int]] = []
+        self._in: List[List[int]] = []
+        self._ord = array("q")
+        self._node_at = array("q")
+        self._mark = array("q")
+        self._epoch = 0
+        self._cycle: Optional[List[int]] = None
+
+    def _vertex(self, label: Hashable) -> int:
+        i, new = self._ids.get(label)
+        if new:
+            self._out.append([])
+            self._in.append([])
+            self._ord.append(i)
+            self._node_at.append(i)
+            self._mark.append(0)
+        return i
+
+    def add_edge(self, u: Hashable, v: Hashable) -> bool:
+        """Record ``u -> v``; True if it closes a cycle (the edge is not stored)."""
+        a, b = self._vertex(u), self._vertex(v)
+        if a == b:
+            self._cycle = [a, a]
+            return True
+        ord_ = self._ord
+        lb, ub = ord_[b], ord_[a]
+        if lb < ub:
+            forward = self._forward(b, a, ub)
+            if forward is None:
+                return True
+            backward = self._backward(a, lb)
+            self._reorder(forward, backward)
+        self._out[a].append(b)
+        self._in[b].append(a)
+        return False
+
+    def _forward(self, start: int, target: int, ub: int) -> Optional[List[int]]:
+        ord_, out, mark = self._ord, self._out, self._mark
+        self._epoch += 1
+        ep = self._epoch
+        parent = {start: -1}
+        mark[start] = ep
+        stack = [start]
+        region = []
+        while stack:
+            x = stack.pop()
+            region.append(x)
+            for y in out[x]:
+                if y == target:
+                    path = [x]
+                    while parent[path[-1]] != -1:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    self._cycle = [target] + path + [target]
+                    return None
+                if mark[y] != ep and ord_[y] < ub:
+                    mark[y] = ep
+                    parent[y] = x
+                    stack.append(y)
+        return region
+
+    def _backward(self, start: int, lb: int) -> List[int]:
+        ord_, inn, mark = self._ord, self._in, self._mark
+        self._epoch += 1
+        ep = self._epoch
+        mark[start] = ep
+        stack = [start]
+        region = []
+        while stack:
+            x = stack.pop()
+            region.append(x)
+            for y in inn[x]:
+                if mark[y] != ep and ord_[y] > lb:
+                    mark[y] = ep
+                    stack.append(y)
+        return region
+
+    def _reorder(self, forward: List[int], backward: List[int]) -> None:
+        ord_, node_at = self._ord, self._node_at
+        forward.sort(key=ord_.__getitem__)
+        backward.sort(key=ord_.__getitem__)
+        nodes = backward + forward
+        for x, p in zip(nodes, sorted(ord_[x] for x in nodes)):
+            ord_[x] = p
+            node_at[p] = x
+
+    def witness(self) -> Optional[List[Hashable]]:
+        """The cycle closed by the last rejected edge, as ``[u, v, ..., u]``."""
+        if self._cycle is None:
+            return None
+        labels = self._ids.labels
+        return [labels[x] for x in self._cycle]
+
+    def order(self) -> List[Hashable]:
+        """Current topological order of every vertex seen so far."""
+        labels = self._ids.labels
+        return [labels[x] for x in self._node_at]
+
+
+def first_cycle(edges: Iterable[Tuple[Hashable, Hashable]], directed: bool = False,
+                witness: bool = False) -> Optional[CycleReport]:
+    """Scan ``edges`` and stop at the first one that closes a cycle."""
+    det = DirectedCycleDetector() if directed else UndirectedCycleDetector()
+    for i, (u, v) in enumerate(edges):
+        if det.add_edge(u, v):
+            return CycleReport(i, (u, v), det.witness() if witness else None)
+    return None
+
+
+def _chain_with_back_edge(n: int) -> Iterator[Tuple[int, int]]:
+    for i in range(n - 1):
+        yield i, i + 1
+    yield n - 1, 0
+
+
+def benchmark(n: int = 500_000) -> None:
+    for directed in (False, True):
+        t0 = time.perf_counter()
+        rep = first_cycle(_chain_with_back_edge(n), directed=directed)
+        secs = time.perf_counter() - t0
+        kind = "directed" if directed else "undirected"
+        print(f"  {kind:<10} {n} edges streamed in {secs:6.2f} s, cycle at edge {rep.index}")
+
+
 def demo():
-    print("Fill in your examples here.")
+    deps = [("app", "lib"), ("lib", "core"), ("app", "core"), ("core", "util"), ("util", "lib")]
+    print("directed:", first_cycle(deps, directed=True, witness=True))
+    roads = [(1, 2), (2, 3), (3, 4), (4, 2)]
+    print("undirected:", first_cycle(roads, witness=True))
+
+
 if __name__ == "__main__":
-    demo()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,20 +1,547 @@
 """
 Topic: 10_Graph Algorithms
-Subtopic: Shortest Paths: Dijkstra, Bellman-Ford, A*, Floyd-Warshall, 0-1 BFS, Johnson’s, SPFA, DAG shortest path (topo order)
-Description: pathlib for path ops.
+Subtopic: Shortest Paths: Dijkstra, A* (ALT landmarks), 0-1 BFS
+Description: Query engine over a compact CSR graph.
 
-TODO:
-- Read the README.md in this folder.
-- Run this file to see examples, then extend experiments.
+``CSRGraph`` stores the graph once in typed ``array`` buffers. A
+``ShortestPathEngine`` keeps per-vertex search state that is invalidated by
+bumping an epoch counter, so point-to-point and batched queries never
+reallocate O(n) arrays or rebuild the graph. Dijkstra can run on ``heapq``, an
+indexed d-ary heap with decrease-key, or a radix heap (integer weights); the
+default picks the radix heap for integer weights and ``heapq`` otherwise.
+ALT landmark tables can be saved to disk and reloaded with ``Landmarks.load``.
+
+Run ``python main.py`` for the demo or ``python main.py --bench`` for timings.
 """
 from __future__ import annotations
-from typing import *
-import sys, os, math, json, re, pathlib, itertools, collections, functools, logging, datetime
-# Optional third-party (uncomment if installed)
-# import numpy as np
-# import pandas as pd
-from pathlib import Path
+
+import heapq
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+INF = float("inf")
+
+
+class CSRGraph:
+    """Directed weighted graph in compressed sparse row form."""
+
+    __slots__ = ("n", "offsets", "targets", "weights", "_reverse")
+
+    def __init__(self, n: int, offsets: array, targets: array, weights: array) -> None:
+        self.n = n
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._reverse: Optional[CSRGraph] = None
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[Tuple[int, int, float]],
+                   directed: bool = True) -> "CSRGraph":
+        """Build from ``(u, v, w)`` triples; undirected edges are stored twice."""
+        src: List[int] = []
+        dst: List[int] = []
+        wts: List[float] = []
+        for u, v, w in edges:
+            if w < 0:
+                raise ValueError(f"negative weight on edge ({u}, {v})")
+            src.append(u); dst.append(v); wts.append(w)
+            if not directed:
+                src.append(v); dst.append(u); wts.append(w)
+        return cls._from_arrays(n, src, dst, wts)
+
+    @classmethod
+    def _from_arrays(cls, n: int, src: Sequence[int], dst: Sequence[int],
+                     wts: Sequence[float]) -> "CSRGraph":
+        offsets = array("q", bytes(8 * (n + 1)))
+        for u in src:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+        fill = offsets[:-1]
+        m = len(src)
+        targets = array("q", bytes(8 * m))
+        typecode = "q" if all(isinstance(w, int) for w in wts) else "d"
+        weights = array(typecode, bytes(8 * m))
+        for u, v, w in zip(src, dst, wts):
+            p = fill[u]
+            targets[p] = v
+            weights[p] = w
+            fill[u] = p + 1
+        return cls(n, offsets, targets, weights)
+
+    @property
+    def m(self) -> int:
+        return len(self.targets)
+
+    @property
+    def integer_weights(self) -> bool:
+        return self.weights.typecode == "q"
+
+    def reverse(self) -> "CSRGraph":
+        """Graph with every arc flipped (cached)."""
+        if self._reverse is None:
+            off, tg = self.offsets, self.targets
+            src = [u for u in range(self.n) for _ in range(off[u + 1] - off[u])]
+            self._reverse = CSRGraph._from_arrays(self.n, tg, src, self.weights)
+            self._reverse._reverse = self
+        return self._reverse
+
+
+class HeapQueue:
+    """Binary heap on ``heapq`` with lazy deletion of stale entries."""
+
+    __slots__ = ("_h",)
+
+    def __init__(self, n: int = 0) -> None:
+        self._h: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._h)
+
+    def push(self, key: float, v: int) -> None:
+        heapq.heappush(self._h, (key, v))
+
+    def pop(self) -> Tuple[float, int]:
+        return heapq.heappop(self._h)
+
+    def clear(self) -> None:
+        self._h.clear()
+
+
+class DaryHeap:
+    """Indexed d-ary min-heap: ``push`` inserts or decreases a key in place.
+
+    A position map makes ``decrease-key`` O(log_d n), so the heap never holds
+    more than one entry per vertex.
+    """
+
+    __slots__ = ("d", "items", "keys", "pos")
+
+    def __init__(self, n: int, d: int = 4) -> None:
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.items: List[int] = []
+        self.keys: List[float] = []
+        self.pos = [-1] * n
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def push(self, key: float, v: int) -> None:
+        items, keys, pos, d = self.items, self.keys, self.pos, self.d
+        i = pos[v]
+        if i < 0:
+            i = len(items)
+            items.append(v)
+            keys.append(key)
+        elif key >= keys[i]:
+            return
+        while i:
+            parent = (i - 1) // d
+            pk = keys[parent]
+            if pk <= key:
+                break
+            pv = items[parent]
+            items[i] = pv; keys[i] = pk; pos[pv] = i
+            i = parent
+        items[i] = v; keys[i] = key; pos[v] = i
+
+    def pop(self) -> Tuple[float, int]:
+        items, keys, pos, d = self.items, self.keys, self.pos, self.d
+        top, top_key = items[0], keys[0]
+        pos[top] = -1
+        v, key = items.pop(), keys.pop()
+        size = len(items)
+        if size:
+            i = 0
+            while True:
+                first = i * d + 1
+                if first >= size:
+                    break
+                best, best_key = first, keys[first]
+                for c in range(first + 1, min(first + d, size)):
+                    if keys[c] < best_key:
+                        best, best_key = c, keys[c]
+                if best_key >= key:
+                    break
+                cv = items[best]
+                items[i] = cv; keys[i] = best_key; pos[cv] = i
+                i = best
+            items[i] = v; keys[i] = key; pos[v] = i
+        return top_key, top
+
+    def clear(self) -> None:
+        for v in self.items:
+            self.pos[v] = -1
+        self.items.clear()
+        self.keys.clear()
+
+
+class RadixHeap:
+    """Monotone radix heap for non-negative integer keys (lazy deletion)."""
+
+    __slots__ = ("_buckets", "_last", "_size")
+
+    def __init__(self, n: int = 0) -> None:
+        self._buckets: List[List[Tuple[int, int]]] = [[] for _ in range(65)]
+        self._last = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, key: int, v: int) -> None:
+        if key < self._last:
+            raise ValueError("radix heap keys must be monotone non-decreasing")
+        self._buckets[(key ^ self._last).bit_length()].append((key, v))
+        self._size += 1
+
+    def pop(self) -> Tuple[int, int]:
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            moved = buckets[i]
+            last = self._last = min(moved)[0]
+            for item in moved:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+            moved.clear()
+        self._size -= 1
+        return buckets[0].pop()
+
+    def clear(self) -> None:
+        for b in self._buckets:
+            b.clear()
+        self._last = 0
+        self._size = 0
+
+
+HEAPS = {"heapq": HeapQueue, "dary": DaryHeap, "radix": RadixHeap}
+
+_ALT_MAGIC = b"ALT1"
+
+
+class Landmarks:
+    """ALT preprocessing: distances from and to a few landmark vertices.
+
+    For any landmark L the triangle inequality gives the admissible and
+    consistent A* bound ``d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L))``.
+    """
+
+    def __init__(self, n: int, ids: List[int], dist_from: List[array], dist_to: List[array]) -> None:
+        self.n = n
+        self.ids = ids
+        self.dist_from = dist_from
+        self.dist_to = dist_to
+
+    @classmethod
+    def build(cls, graph: CSRGraph, k: int = 8, seed: int = 0) -> "Landmarks":
+        """Pick ``k`` landmarks by farthest-point selection and tabulate them."""
+        if graph.n == 0:
+            return cls(0, [], [], [])
+        fwd = ShortestPathEngine(graph)
+        bwd = ShortestPathEngine(graph.reverse())
+        rng = random.Random(seed)
+        ids: List[int] = []
+        chosen = set()
+        dist_from: List[array] = []
+        dist_to: List[array] = []
+        closest = [INF] * graph.n
+        candidate = rng.randrange(graph.n)
+        for _ in range(min(k, graph.n)):
+            ids.append(candidate)
+            chosen.add(candidate)
+            df = array("d", fwd.dijkstra(candidate))
+            dist_from.append(df)
+            dist_to.append(array("d", bwd.dijkstra(candidate)))
+            best, candidate = -1.0, -1
+            for v in range(graph.n):
+                d = df[v]
+                if d < closest[v]:
+                    closest[v] = d
+                if closest[v] < INF and closest[v] > best and v not in chosen:
+                    best, candidate = closest[v], v
+            if candidate < 0:
+                unused = [v for v in range(graph.n) if v not in chosen]
+                if not unused:
+                    break
+                candidate = rng.choice(unused)
+        return cls(graph.n, ids, dist_from, dist_to)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as fh:
+            fh.write(_ALT_MAGIC)
+            fh.write(struct.pack("<qq", self.n, len(self.ids)))
+            array("q", self.ids).tofile(fh)
+            for table in self.dist_from + self.dist_to:
+                table.tofile(fh)
+
+    @classmethod
+    def load(cls, path: str, graph: Optional[CSRGraph] = None) -> "Landmarks":
+        with open(path, "rb") as fh:
+            if fh.read(4) != _ALT_MAGIC:
+                raise ValueError(f"{path}: not an ALT landmark file")
+            n, k = struct.unpack("<qq", fh.read(16))
+            if graph is not None and graph.n != n:
+                raise ValueError(f"{path}: landmarks built for n={n}, graph has n={graph.n}")
+            ids = array("q")
+            ids.fromfile(fh, k)
+            tables = []
+            for _ in range(2 * k):
+                t = array("d")
+                t.fromfile(fh, n)
+                tables.append(t)
+        return cls(n, list(ids), tables[:k], tables[k:])
+
+    def heuristic(self, t: int, integral: bool = False) -> Callable[[int], float]:
+        """Lower bound on ``d(v, t)`` for a fixed target (``int`` if ``integral``)."""
+        terms = []
+        for df, dt in zip(self.dist_from, self.dist_to):
+            terms.append((df, df[t], dt, dt[t]))
+
+        def h(v: int) -> float:
+            best = 0.0
+            for df, a, dt, b in terms:
+                x, y = df[v], dt[v]
+                if a < INF and x < INF and a - x > best:
+                    best = a - x
+                if y == INF:
+                    if b < INF:
+                        return INF  # v cannot reach L, but t can: v cannot reach t
+                elif y - b > best:
+                    best = y - b
+            return int(best) if integral else best
+
+        return h
+
+
+class ShortestPathEngine:
+    """Reusable shortest-path searches over one ``CSRGraph``."""
+
+    def __init__(self, graph: CSRGraph, heap: str = "auto", d: int = 4,
+                 landmarks: Optional[Landmarks] = None) -> None:
+        if heap == "auto":
+            # The C-implemented heapq beats a pure-Python d-ary heap in CPython;
+            # the radix heap wins whenever the weights are integers.
+            heap = "radix" if graph.integer_weights else "heapq"
+        if heap not in HEAPS:
+            raise ValueError(f"unknown heap {heap!r}; choose from {sorted(HEAPS)}")
+        if heap == "radix" and not graph.integer_weights:
+            raise ValueError("radix heap needs integer edge weights")
+        self.graph = graph
+        self.heap_name = heap
+        n = graph.n
+        self._heap = DaryHeap(n, d) if heap == "dary" else HEAPS[heap](n)
+        self._epoch = 0
+        self._stamp = [0] * n
+        self._done = [0] * n
+        self._dist = [INF] * n
+        self._parent = [-1] * n
+        self.landmarks = landmarks
+        self.last_settled = 0
+        self._backward: Optional[ShortestPathEngine] = None
+
+    def _search(self, source: int, targets: Optional[set] = None,
+                h: Optional[Callable[[int], float]] = None) -> None:
+        """Dijkstra / A* from ``source``; stops once every target is settled."""
+        graph = self.graph
+        off, tg, wt = graph.offsets, graph.targets, graph.weights
+        self._epoch += 1
+        ep = self._epoch
+        stamp, done, dist, parent = self._stamp, self._done, self._dist, self._parent
+        heap = self._heap
+        heap.clear()
+        stamp[source] = ep
+        dist[source] = 0
+        parent[source] = -1
+        remaining = set(targets) if targets is not None else None
+        hval = {} if h is not None else None
+        h0 = h(source) if h is not None else 0
+        if h0 == INF:
+            self.last_settled = 0
+            return
+        heap.push(h0, source)
+        settled = 0
+        push, pop = heap.push, heap.pop
+        while heap:
+            _, u = pop()
+            if done[u] == ep:
+                continue
+            done[u] = ep
+            settled += 1
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+            du = dist[u]
+            for i in range(off[u], off[u + 1]):
+                v = tg[i]
+                nd = du + wt[i]
+                if stamp[v] != ep:
+                    stamp[v] = ep
+                elif nd >= dist[v]:
+                    continue
+                dist[v] = nd
+                parent[v] = u
+                if hval is None:
+                    push(nd, v)
+                else:
+                    hv = hval.get(v)
+                    if hv is None:
+                        hv = hval[v] = h(v)
+                    if hv != INF:
+                        push(nd + hv, v)
+        self.last_settled = settled
+
+    def _dist_of(self, v: int) -> float:
+        return self._dist[v] if self._done[v] == self._epoch else INF
+
+    def dijkstra(self, source: int) -> List[float]:
+        """Distances from ``source`` to every vertex (``inf`` if unreachable)."""
+        self._search(source)
+        ep, stamp, dist = self._epoch, self._stamp, self._dist
+        return [dist[v] if stamp[v] == ep else INF for v in range(self.graph.n)]
+
+    def distance(self, s: int, t: int) -> float:
+        """Point-to-point distance; uses ALT A* when landmarks are attached."""
+        h = None
+        if self.landmarks is not None:
+            h = self.landmarks.heuristic(t, self.graph.integer_weights)
+        self._search(s, {t}, h)
+        return self._dist_of(t)
+
+    def path(self, s: int, t: int) -> Optional[List[int]]:
+        """Vertices of a shortest ``s -> t`` path, or ``None`` if unreachable."""
+        if self.distance(s, t) == INF:
+            return None
+        out = [t]
+        parent = self._parent
+        while out[-1] != s:
+            out.append(parent[out[-1]])
+        out.reverse()
+        return out
+
+    def many_to_many(self, sources: Sequence[int], targets: Sequence[int]) -> List[List[float]]:
+        """Distance table ``table[i][j] = d(sources[i], targets[j])``.
+
+        One pruned search runs per row and stops as soon as all targets are
+        settled. When there are fewer targets than sources the searches run
+        backwards from the targets on the reversed graph instead.
+        """
+        if len(targets) < len(sources):
+            back = self._backward_engine()
+            table_t = back.many_to_many(targets, sources)
+            return [list(col) for col in zip(*table_t)] if table_t else [[] for _ in sources]
+        wanted = set(targets)
+        rows = []
+        for s in sources:
+            self._search(s, wanted)
+            rows.append([self._dist_of(t) for t in targets])
+        return rows
+
+    def _backward_engine(self) -> "ShortestPathEngine":
+        if self._backward is None:
+            self._backward = ShortestPathEngine(self.graph.reverse(), self.heap_name,
+                                                getattr(self._heap, "d", 4))
+        return self._backward
+
+
+def bfs_01(graph: CSRGraph, source: int) -> List[float]:
+    """Shortest paths when every weight is 0 or 1, using a deque in O(V + E)."""
+    off, tg, wt = graph.offsets, graph.targets, graph.weights
+    dist = [INF] * graph.n
+    dist[source] = 0
+    dq = deque([source])
+    while dq:
+        u = dq.popleft()
+        du = dist[u]
+        for i in range(off[u], off[u + 1]):
+            w = wt[i]
+            if w != 0 and w != 1:
+                raise ValueError(f"0-1 BFS got weight {w} on an edge from {u}")
+            v = tg[i]
+            if du + w < dist[v]:
+                dist[v] = du + w
+                if w:
+                    dq.append(v)
+                else:
+                    dq.appendleft(v)
+    return dist
+
+
+def grid_graph(rows: int, cols: int, max_w: int = 9, seed: int = 0) -> CSRGraph:
+    """Undirected 4-neighbour grid with random integer weights (road-like)."""
+    rng = random.Random(seed)
+    edges = []
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            if c + 1 < cols:
+                edges.append((u, u + 1, rng.randint(1, max_w)))
+            if r + 1 < rows:
+                edges.append((u, u + cols, rng.randint(1, max_w)))
+    return CSRGraph.from_edges(rows * cols, edges, directed=False)
+
+
+def benchmark(rows: int = 100, cols: int = 100, queries: int = 100) -> None:
+    g = grid_graph(rows, cols)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(g.n), rng.randrange(g.n)) for _ in range(queries)]
+    print(f"grid {rows}x{cols}: n={g.n} m={g.m}, {queries} point-to-point queries")
+    ref = None
+    for heap in ("heapq", "dary", "radix"):
+        eng = ShortestPathEngine(g, heap=heap)
+        t0 = time.perf_counter()
+        got = [eng.distance(s, t) for s, t in pairs]
+        print(f"  dijkstra/{heap:<6} {1000 * (time.perf_counter() - t0):8.1f} ms")
+        ref = ref or got
+        assert got == ref
+    t0 = time.perf_counter()
+    lm = Landmarks.build(g, k=8)
+    print(f"  ALT preprocessing (8 landmarks) {1000 * (time.perf_counter() - t0):8.1f} ms")
+    eng = ShortestPathEngine(g, landmarks=lm)
+    t0 = time.perf_counter()
+    got, settled = [], 0
+    for s, t in pairs:
+        got.append(eng.distance(s, t))
+        settled += eng.last_settled
+    alt_ms = 1000 * (time.perf_counter() - t0)
+    assert got == ref
+    plain = ShortestPathEngine(g)
+    plain_settled = 0
+    for s, t in pairs:
+        plain.distance(s, t)
+        plain_settled += plain.last_settled
+    print(f"  A*/ALT            {alt_ms:8.1f} ms  settled {settled} vs {plain_settled} for Dijkstra")
+    srcs, tgts = [p[0] for p in pairs[:20]], [p[1] for p in pairs[:20]]
+    t0 = time.perf_counter()
+    eng.many_to_many(srcs, tgts)
+    print(f"  many_to_many 20x20 {1000 * (time.perf_counter() - t0):7.1f} ms")
+
+
 def demo():
-    p=Path("."); print([str(x) for x in p.iterdir()][:3])
+    edges = [(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 1), (2, 3, 5), (3, 4, 3)]
+    g = CSRGraph.from_edges(5, edges)
+    eng = ShortestPathEngine(g)
+    print("dijkstra from 0:", eng.dijkstra(0))
+    print("path 0 -> 4:", eng.path(0, 4), "dist", eng.distance(0, 4))
+    print("many_to_many:", eng.many_to_many([0, 2], [3, 4]))
+    lm = Landmarks.build(g, k=2)
+    alt = ShortestPathEngine(g, heap="radix", landmarks=lm)
+    print("ALT A* 0 -> 4:", alt.distance(0, 4))
+    zero_one = CSRGraph.from_edges(4, [(0, 1, 1), (0, 2, 0), (2, 1, 0), (1, 3, 1)])
+    print("0-1 BFS:", bfs_01(zero_one, 0))
+
+
 if __name__ == "__main__":
-    demo()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
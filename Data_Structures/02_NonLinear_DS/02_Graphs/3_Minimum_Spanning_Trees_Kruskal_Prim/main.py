@@ -1,19 +1,236 @@
 """
 Topic: 10_Graph Algorithms
-Subtopic: Minimum Spanning Trees: Kruskal, Prim
-Description: Generic example stub.
+Subtopic: Minimum Spanning Trees: Kruskal, Prim, Borůvka
+Description: MST / minimum spanning forest over NumPy edge arrays.
 
-TODO:
-- Read the README.md in this folder.
-- Run this file to see examples, then extend experiments.
+Edges live in three parallel arrays ``u``, ``v``, ``w`` and are never turned
+into per-edge Python tuples. ``kruskal`` sorts once with ``argsort`` and runs a
+union-find over typed ``array`` buffers (path halving + union by size). ``boruvka`` does every
+round with array operations: label edges by component, pick each component's
+cheapest outgoing edge with one ``minimum.at`` reduction over edge ranks, and
+contract with pointer jumping. The per-round cheapest-edge scan can be split
+into chunks and fanned out over a ``ProcessPoolExecutor``.
+
+Ties are broken by (weight, edge index) everywhere, so Kruskal and Borůvka
+pick the same forest and Borůvka never closes a cycle.
 """
 from __future__ import annotations
-from typing import *
-import sys, os, math, json, re, pathlib, itertools, collections, functools, logging, datetime
-# Optional third-party (uncomment if installed)
-# import numpy as np
-# import pandas as pd
+
+import heapq
+import itertools
+import sys
+import time
+import warnings
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+# Optional third-party (required for everything except ``prim``).
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("the array MST routines need NumPy: pip install numpy")
+
+
+def read_edge_list(path: str, chunk_rows: int = 1 << 20, comments: str = "#"):
+    """Parse a whitespace ``u v w`` file into ``(u, v, w)`` arrays, chunk by chunk."""
+    _require_numpy()
+    us, vs, ws = [], [], []
+    with open(path) as fh:
+        while True:
+            lines = list(itertools.islice(fh, chunk_rows))
+            if not lines:
+                break
+            with warnings.catch_warnings():
+                # A chunk of only comments or blank lines is fine; skip it quietly.
+                warnings.filterwarnings("ignore", message="loadtxt: input contained no data")
+                block = np.loadtxt(lines, dtype=np.float64, comments=comments, ndmin=2)
+            if block.size:
+                us.append(block[:, 0].astype(np.int64))
+                vs.append(block[:, 1].astype(np.int64))
+                ws.append(block[:, 2])
+    if not us:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+    return np.concatenate(us), np.concatenate(vs), np.concatenate(ws)
+
+
+def kruskal(n: int, u, v, w) -> Tuple[float, "np.ndarray"]:
+    """Minimum spanning forest; returns ``(total weight, chosen edge indices)``."""
+    _require_numpy()
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    w = np.asarray(w)
+    order = np.argsort(w, kind="stable")
+    su, sv = u[order].tolist(), v[order].tolist()
+    # Typed arrays hold the union-find in 4 bytes per entry, not boxed ints.
+    typecode = "i" if n < 2 ** 31 else "q"
+    parent = array(typecode, range(n))
+    size = array(typecode, [1]) * n
+    chosen = array("q")
+    need = n - 1
+    for k, (a, b) in enumerate(zip(su, sv)):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+        chosen.append(k)
+        if len(chosen) == need:
+            break
+    picked = order[np.asarray(chosen, dtype=np.int64)]
+    return float(w[picked].sum()), np.sort(picked)
+
+
+def _cheapest_per_component(n: int, rank, *endpoint_comps):
+    """Cheapest outgoing edge of every touched component as (comps, ranks).
+
+    ``rank`` is the edge's position in (weight, index) order, so one integer
+    ``minimum`` reduction replaces a multi-key sort.
+    """
+    best = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    for comp in endpoint_comps:
+        np.minimum.at(best, comp, rank)
+    comps = np.flatnonzero(best != np.iinfo(np.int64).max)
+    return comps, best[comps]
+
+
+def _chunk_worker(args):
+    return _cheapest_per_component(*args)
+
+
+def boruvka(n: int, u, v, w, workers: Optional[int] = None,
+            chunk_size: int = 1 << 20) -> Tuple[float, "np.ndarray"]:
+    """Minimum spanning forest with vectorized Borůvka rounds.
+
+    With ``workers > 1`` each round's cheapest-edge scan is split into
+    ``chunk_size`` slices handled by a process pool and merged with the same
+    minimum-rank reduction. Pickling the chunks and starting the pool cost
+    more than they save below roughly tens of millions of edges.
+    """
+    _require_numpy()
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    w = np.asarray(w)
+    order = np.argsort(w, kind="stable")
+    # Work in rank space: edge k of the arrays below is the k-th cheapest.
+    ru, rv = u[order], v[order]
+    rank = np.arange(len(order), dtype=np.int64)
+    label = np.arange(n, dtype=np.int64)
+    picked: List["np.ndarray"] = []
+    pool = ProcessPoolExecutor(workers) if workers and workers > 1 else None
+    try:
+        eu, ev, er = ru, rv, rank
+        while True:
+            cu, cv = label[eu], label[ev]
+            live = cu != cv
+            if not live.any():
+                break
+            eu, ev, er, cu, cv = eu[live], ev[live], er[live], cu[live], cv[live]
+            if pool is not None and len(er) > chunk_size:
+                jobs = [(n, er[s:s + chunk_size], cu[s:s + chunk_size], cv[s:s + chunk_size])
+                        for s in range(0, len(er), chunk_size)]
+                parts = list(pool.map(_chunk_worker, jobs))
+                comps, best = _cheapest_per_component(
+                    n, np.concatenate([p[1] for p in parts]), np.concatenate([p[0] for p in parts]))
+            else:
+                comps, best = _cheapest_per_component(n, er, cu, cv)
+            picked.append(best)
+            # Hook each component onto the other end of its cheapest edge.
+            other = label[ru[best]]
+            other = np.where(other == comps, label[rv[best]], other)
+            hook = np.arange(n, dtype=np.int64)
+            hook[comps] = other
+            # Mutual pairs (a -> b -> a) form the only cycles; the smaller id wins.
+            mutual = hook[hook[comps]] == comps
+            roots = comps[mutual & (comps < hook[comps])]
+            hook[roots] = roots
+            while True:
+                nxt = hook[hook]
+                if np.array_equal(nxt, hook):
+                    break
+                hook = nxt
+            label = hook[label]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if not picked:
+        return 0.0, np.empty(0, dtype=np.int64)
+    chosen = np.sort(order[np.unique(np.concatenate(picked))])
+    return float(w[chosen].sum()), chosen
+
+
+def prim(n: int, u, v, w) -> float:
+    """Textbook heap-based Prim on tuple adjacency lists (benchmark baseline)."""
+    adj: List[List[Tuple[float, int]]] = [[] for _ in range(n)]
+    for a, b, c in zip(list(u), list(v), list(w)):
+        adj[a].append((c, b))
+        adj[b].append((c, a))
+    seen = [False] * n
+    total = 0.0
+    for root in range(n):
+        if seen[root]:
+            continue
+        pq = [(0.0, root)]
+        while pq:
+            c, x = heapq.heappop(pq)
+            if seen[x]:
+                continue
+            seen[x] = True
+            total += c
+            for item in adj[x]:
+                if not seen[item[1]]:
+                    heapq.heappush(pq, item)
+    return total
+
+
+def random_edges(n: int, m: int, seed: int = 0):
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    u = rng.integers(0, n, size=m)
+    v = rng.integers(0, n, size=m)
+    w = rng.random(m)
+    return u, v, w
+
+
+def benchmark(n: int = 200_000, m: int = 2_000_000) -> None:
+    u, v, w = random_edges(n, m)
+    print(f"n={n} m={m}")
+    t0 = time.perf_counter()
+    ref = prim(n, u.tolist(), v.tolist(), w.tolist())
+    print(f"  prim (heapq, tuples)   {time.perf_counter() - t0:7.2f} s")
+    for name, fn, kw in (("kruskal (argsort)", kruskal, {}),
+                         ("boruvka", boruvka, {}),
+                         ("boruvka, 4 workers", boruvka, {"workers": 4, "chunk_size": m // 4})):
+        t0 = time.perf_counter()
+        total, _ = fn(n, u, v, w, **kw)
+        print(f"  {name:<22} {time.perf_counter() - t0:7.2f} s")
+        assert abs(total - ref) < 1e-6 * max(1.0, ref)
+
+
 def demo():
-    print("Fill in your examples here.")
+    edges = [(0, 1, 4), (0, 2, 3), (1, 2, 1), (1, 3, 2), (2, 3, 4), (3, 4, 2), (5, 6, 1)]
+    print("prim total:", prim(7, *zip(*edges)))
+    if np is not None:
+        u, v, w = (np.array(col) for col in zip(*edges))
+        print("kruskal:", kruskal(7, u, v, w))
+        print("boruvka:", boruvka(7, u, v, w))
+
+
 if __name__ == "__main__":
-    demo()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,19 +1,326 @@
 """
 Topic: 10_Graph Algorithms
 Subtopic: Topological Sort
-Description: Generic example stub.
+Description: Batch Kahn / DFS sorts over CSR arrays, parallel levels, and a
+Pearce-Kelly order that is repaired locally as edges are inserted.
 
-TODO:
-- Read the README.md in this folder.
-- Run this file to see examples, then extend experiments.
+Re-running Kahn after every insertion costs O(V + E) per edge.
+``DynamicTopoOrder.add_edge(u, v)`` is free when ``u`` already precedes ``v``;
+otherwise it only searches the "affected region" between the two positions
+and shuffles those vertices among their own slots. A cycle is reported at
+insertion time (with a witness) and the offending edge is rejected.
 """
 from __future__ import annotations
-from typing import *
-import sys, os, math, json, re, pathlib, itertools, collections, functools, logging, datetime
-# Optional third-party (uncomment if installed)
-# import numpy as np
-# import pandas as pd
+
+import random
+import sys
+import time
+from array import array
+from typing import Iterable, List, Sequence, Tuple
+
+
+class CycleError(ValueError):
+    """The graph has a cycle; ``cycle`` lists it as ``[a, b, ..., a]``."""
+
+    def __init__(self, message: str, cycle: Sequence[int] = ()) -> None:
+        super().__init__(message)
+        self.cycle = list(cycle)
+
+
+def to_csr(n: int, edges: Iterable[Tuple[int, int]]) -> Tuple[array, array]:
+    """Counting-sort an edge list into ``(offsets, targets)`` typed arrays."""
+    edges = list(edges)
+    offsets = array("q", bytes(8 * (n + 1)))
+    for u, _ in edges:
+        offsets[u + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+    fill = offsets[:-1]
+    targets = array("q", bytes(8 * len(edges)))
+    for u, v in edges:
+        targets[fill[u]] = v
+        fill[u] += 1
+    return offsets, targets
+
+
+def _in_degrees(n: int, targets: array) -> List[int]:
+    indeg = [0] * n
+    for v in targets:
+        indeg[v] += 1
+    return indeg
+
+
+def _find_cycle(n: int, offsets: array, targets: array, candidates: Iterable[int]) -> List[int]:
+    """Locate one cycle among ``candidates`` (vertices Kahn could not remove)."""
+    state = [0] * n  # 0 = new, 1 = on stack, 2 = done
+    for root in candidates:
+        if state[root]:
+            continue
+        stack = [(root, offsets[root])]
+        path = [root]
+        state[root] = 1
+        while stack:
+            u, i = stack[-1]
+            if i < offsets[u + 1]:
+                stack[-1] = (u, i + 1)
+                v = targets[i]
+                if state[v] == 1:
+                    return path[path.index(v):] + [v]
+                if state[v] == 0:
+                    state[v] = 1
+                    stack.append((v, offsets[v]))
+                    path.append(v)
+            else:
+                state[u] = 2
+                stack.pop()
+                path.pop()
+    return []
+
+
+def kahn_toposort(n: int, edges: Iterable[Tuple[int, int]]) -> List[int]:
+    """Topological order by repeatedly removing in-degree-0 vertices."""
+    offsets, targets = to_csr(n, edges)
+    indeg = _in_degrees(n, targets)
+    order = [v for v in range(n) if indeg[v] == 0]
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                order.append(v)
+    if len(order) < n:
+        left = [v for v in range(n) if indeg[v] > 0]
+        cycle = _find_cycle(n, offsets, targets, left)
+        raise CycleError(f"graph has a cycle: {cycle}", cycle)
+    return order
+
+
+def dfs_toposort(n: int, edges: Iterable[Tuple[int, int]]) -> List[int]:
+    """Reverse DFS post-order, computed with an explicit stack."""
+    offsets, targets = to_csr(n, edges)
+    state = bytearray(n)
+    post: List[int] = []
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [root]
+        cursor = [offsets[root]]
+        path = [root]
+        while stack:
+            u = stack[-1]
+            i = cursor[-1]
+            if i < offsets[u + 1]:
+                cursor[-1] = i + 1
+                v = targets[i]
+                if state[v] == 1:
+                    cycle = path[path.index(v):] + [v]
+                    raise CycleError(f"graph has a cycle: {cycle}", cycle)
+                if state[v] == 0:
+                    state[v] = 1
+                    stack.append(v)
+                    cursor.append(offsets[v])
+                    path.append(v)
+            else:
+                state[u] = 2
+                post.append(u)
+                stack.pop()
+                cursor.pop()
+                path.pop()
+    post.reverse()
+    return post
+
+
+def parallel_levels(n: int, edges: Iterable[Tuple[int, int]]) -> List[List[int]]:
+    """Antichains for concurrent execution.
+
+    Level ``k`` holds the vertices whose longest chain of predecessors has
+    length ``k``; every vertex in a level can run once all earlier levels are
+    done, and no two vertices in one level depend on each other.
+    """
+    offsets, targets = to_csr(n, edges)
+    indeg = _in_degrees(n, targets)
+    current = [v for v in range(n) if indeg[v] == 0]
+    levels: List[List[int]] = []
+    seen = 0
+    while current:
+        levels.append(current)
+        seen += len(current)
+        nxt = []
+        for u in current:
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    nxt.append(v)
+        current = nxt
+    if seen < n:
+        left = [v for v in range(n) if indeg[v] > 0]
+        cycle = _find_cycle(n, offsets, targets, left)
+        raise CycleError(f"graph has a cycle: {cycle}", cycle)
+    return levels
+
+
+class DynamicTopoOrder:
+    """Pearce-Kelly online topological order.
+
+    ``ord[v]`` is the position of ``v`` and ``node_at[p]`` its inverse. Adding
+    ``u -> v`` with ``ord[u] > ord[v]`` explores forward from ``v`` and
+    backward from ``u`` only through positions in ``[ord[v], ord[u]]``, then
+    reassigns exactly those positions.
+    """
+
+    def __init__(self, n: int = 0) -> None:
+        self.out: List[List[int]] = [[] for _ in range(n)]
+        self.inn: List[List[int]] = [[] for _ in range(n)]
+        self.ord = list(range(n))
+        self.node_at = list(range(n))
+        self._mark = [0] * n
+        self._epoch = 0
+        self.reordered = 0
+
+    def __len__(self) -> int:
+        return len(self.ord)
+
+    def add_node(self) -> int:
+        v = len(self.ord)
+        self.out.append([])
+        self.inn.append([])
+        self.ord.append(v)
+        self.node_at.append(v)
+        self._mark.append(0)
+        return v
+
+    def order(self) -> List[int]:
+        return list(self.node_at)
+
+    def add_edge(self, u: int, v: int) -> None:
+        """Insert ``u -> v``; raises ``CycleError`` (edge not added) on a cycle."""
+        if u == v:
+            raise CycleError(f"self-loop on {u}", [u, u])
+        ord_ = self.ord
+        lb, ub = ord_[v], ord_[u]
+        if lb < ub:
+            forward = self._forward(v, u, ub)
+            backward = self._backward(u, lb)
+            self._reorder(forward, backward)
+        self.out[u].append(v)
+        self.inn[v].append(u)
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """Delete one ``u -> v`` edge; the current order stays valid."""
+        self.out[u].remove(v)
+        self.inn[v].remove(u)
+
+    def _forward(self, v: int, u: int, ub: int) -> List[int]:
+        ord_, out, mark = self.ord, self.out, self._mark
+        self._epoch += 1
+        ep = self._epoch
+        parent = {v: -1}
+        mark[v] = ep
+        stack = [v]
+        region = []
+        while stack:
+            x = stack.pop()
+            region.append(x)
+            for y in out[x]:
+                if y == u:
+                    path = [y, x]
+                    while parent[path[-1]] != -1:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    cycle = [u] + path
+                    raise CycleError(f"edge ({u}, {v}) closes a cycle: {cycle}", cycle)
+                if mark[y] != ep and ord_[y] < ub:
+                    mark[y] = ep
+                    parent[y] = x
+                    stack.append(y)
+        return region
+
+    def _backward(self, u: int, lb: int) -> List[int]:
+        ord_, inn, mark = self.ord, self.inn, self._mark
+        self._epoch += 1
+        ep = self._epoch
+        mark[u] = ep
+        stack = [u]
+        region = []
+        while stack:
+            x = stack.pop()
+            region.append(x)
+            for y in inn[x]:
+                if mark[y] != ep and ord_[y] > lb:
+                    mark[y] = ep
+                    stack.append(y)
+        return region
+
+    def _reorder(self, forward: List[int], backward: List[int]) -> None:
+        ord_, node_at = self.ord, self.node_at
+        forward.sort(key=ord_.__getitem__)
+        backward.sort(key=ord_.__getitem__)
+        nodes = backward + forward
+        slots = sorted(ord_[x] for x in nodes)
+        for x, p in zip(nodes, slots):
+            ord_[x] = p
+            node_at[p] = x
+        self.reordered += len(nodes)
+
+
+def random_dag_edges(n: int, m: int, seed: int = 0) -> List[Tuple[int, int]]:
+    """Random DAG edges (respecting a hidden random order) in random order."""
+    rng = random.Random(seed)
+    hidden = list(range(n))
+    rng.shuffle(hidden)
+    edges = []
+    while len(edges) < m:
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            a, b = min(a, b), max(a, b)
+            edges.append((hidden[a], hidden[b]))
+    return edges
+
+
+def benchmark(n: int = 2000, m: int = 6000) -> None:
+    edges = random_dag_edges(n, m)
+    # Re-sorting after all m insertions is too slow to run; time every
+    # ``step``-th one and scale up.
+    step = 200
+    t0 = time.perf_counter()
+    for k in range(step, m + 1, step):
+        kahn_toposort(n, edges[:k])
+    rerun = (time.perf_counter() - t0) * step
+    t0 = time.perf_counter()
+    dyn = DynamicTopoOrder(n)
+    for u, v in edges:
+        dyn.add_edge(u, v)
+    online = time.perf_counter() - t0
+    pos = dyn.ord
+    assert all(pos[u] < pos[v] for u, v in edges)
+    print(f"n={n} m={m}")
+    print(f"  Kahn after every insertion (extrapolated) {rerun:8.2f} s")
+    print(f"  Pearce-Kelly incremental                  {online:8.2f} s  "
+          f"({dyn.reordered} vertex moves)")
+
+
 def demo():
-    print("Fill in your examples here.")
+    edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+    print("kahn:", kahn_toposort(6, edges))
+    print("dfs :", dfs_toposort(6, edges))
+    print("levels:", parallel_levels(6, edges))
+    dyn = DynamicTopoOrder(6)
+    for u, v in edges:
+        dyn.add_edge(u, v)
+    print("dynamic:", dyn.order())
+    try:
+        dyn.add_edge(1, 5)
+    except CycleError as exc:
+        print("rejected:", exc.cycle)
+
+
 if __name__ == "__main__":
-    demo()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
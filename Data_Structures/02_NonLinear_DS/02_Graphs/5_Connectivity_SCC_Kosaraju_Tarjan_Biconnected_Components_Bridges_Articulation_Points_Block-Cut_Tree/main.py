@@ -1,5 +1,290 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 10_Graph Algorithms
+Subtopic: Connectivity: SCC (Tarjan), Biconnected Components, Bridges,
+Articulation Points, Block-Cut Tree
+Description: Iterative low-link algorithms over one NumPy CSR graph type,
+returning label arrays instead of lists of lists.
+
+Every routine runs its DFS with an explicit call stack (vertex, edge cursor,
+parent edge) held in flat lists, so depth is bounded only by memory. Per-vertex
+state lives in preallocated ``int64`` arrays that the inner loops touch
+through ``memoryview`` (plain Python ints, no NumPy scalar boxing).
+
+* ``strongly_connected_components``: Tarjan; component ids come out in reverse
+  topological order of the condensation.
+* ``biconnectivity``: one Hopcroft-Tarjan pass that labels every edge with its
+  biconnected block and marks articulation points and bridges at once.
+  Parallel edges are told apart by edge id, so a doubled edge is never a
+  bridge. Self-loops belong to no block (label ``-1``).
+* ``block_cut_tree``: blocks ``0..b-1`` followed by one node per cut vertex,
+  built from the edge labels with array operations.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from typing import NamedTuple
+
+# Optional third-party (required: graphs and labels are NumPy arrays).
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("the connectivity routines need NumPy: pip install numpy")
+
+
+class CSRGraph:
+    """Adjacency in CSR form; undirected edges are stored in both directions.
+
+    ``indices[k]`` is the head of slot ``k`` and ``edge_ids[k]`` the id of the
+    input edge it came from, so both directions of an undirected edge share
+    one id.
+    """
+
+    def __init__(self, n: int, src, dst, directed: bool = False) -> None:
+        _require_numpy()
+        self.n = n
+        self.directed = directed
+        self.src = np.asarray(src, dtype=np.int64)
+        self.dst = np.asarray(dst, dtype=np.int64)
+        self.m = len(self.src)
+        ids = np.arange(self.m, dtype=np.int64)
+        tail, head = self.src, self.dst
+        if not directed:
+            tail, head = np.concatenate([tail, head]), np.concatenate([head, tail])
+            ids = np.concatenate([ids, ids])
+        order = np.argsort(tail, kind="stable")
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tail, minlength=n), out=self.indptr[1:])
+        self.indices = head[order]
+        self.edge_ids = ids[order]
+
+
+class Biconnectivity(NamedTuple):
+    n_blocks: int
+    edge_block: "np.ndarray"    # block id per input edge, -1 for self-loops
+    is_cut: "np.ndarray"        # bool per vertex
+    is_bridge: "np.ndarray"     # bool per input edge
+
+
+class BlockCutTree(NamedTuple):
+    n_blocks: int               # tree nodes 0..n_blocks-1 are blocks
+    cut_vertices: "np.ndarray"  # graph vertex of tree node n_blocks + k
+    tree_u: "np.ndarray"        # block node of each tree edge
+    tree_v: "np.ndarray"        # cut-vertex node of each tree edge
+    node_of: "np.ndarray"       # tree node per graph vertex, -1 if isolated
+
+
+def strongly_connected_components(g: CSRGraph):
+    """Iterative Tarjan; returns ``(count, labels)`` with one label per vertex."""
+    n = g.n
+    off, tgt = memoryview(g.indptr), memoryview(g.indices)
+    index_arr = np.full(n, -1, dtype=np.int64)
+    low_arr = np.empty(n, dtype=np.int64)
+    comp_arr = np.full(n, -1, dtype=np.int64)
+    index, low, comp = memoryview(index_arr), memoryview(low_arr), memoryview(comp_arr)
+    on_stack = bytearray(n)
+    stack = []
+    counter = 0
+    n_comp = 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call_v = [root]
+        call_i = [off[root]]
+        while call_v:
+            v = call_v[-1]
+            i = call_i[-1]
+            if i < off[v + 1]:
+                call_i[-1] = i + 1
+                w = tgt[i]
+                if index[w] < 0:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    call_v.append(w)
+                    call_i.append(off[w])
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            call_v.pop()
+            call_i.pop()
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    comp[w] = n_comp
+                    if w == v:
+                        break
+                n_comp += 1
+            if call_v:
+                u = call_v[-1]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+    return n_comp, comp_arr
+
+
+def biconnectivity(g: CSRGraph) -> Biconnectivity:
+    """Blocks, articulation points and bridges of an undirected graph."""
+    if g.directed:
+        raise ValueError("biconnectivity needs an undirected graph")
+    n = g.n
+    off, tgt, eid = memoryview(g.indptr), memoryview(g.indices), memoryview(g.edge_ids)
+    disc_arr = np.full(n, -1, dtype=np.int64)
+    low_arr = np.empty(n, dtype=np.int64)
+    block_arr = np.full(g.m, -1, dtype=np.int64)
+    cut_arr = np.zeros(n, dtype=bool)
+    bridge_arr = np.zeros(g.m, dtype=bool)
+    disc, low, block = memoryview(disc_arr), memoryview(low_arr), memoryview(block_arr)
+    is_cut, is_bridge = memoryview(cut_arr), memoryview(bridge_arr)
+    edge_stack = []
+    t = 0
+    n_blocks = 0
+    for root in range(n):
+        if disc[root] >= 0:
+            continue
+        disc[root] = low[root] = t
+        t += 1
+        root_children = 0
+        call_v = [root]
+        call_i = [off[root]]
+        call_e = [-1]
+        while call_v:
+            v = call_v[-1]
+            i = call_i[-1]
+            if i < off[v + 1]:
+                call_i[-1] = i + 1
+                e = eid[i]
+                if e == call_e[-1]:
+                    continue
+                w = tgt[i]
+                dw = disc[w]
+                if dw < 0:
+                    edge_stack.append(e)
+                    disc[w] = low[w] = t
+                    t += 1
+                    call_v.append(w)
+                    call_i.append(off[w])
+                    call_e.append(e)
+                elif dw < disc[v]:
+                    # Back edge to an ancestor; the mirror slot (seen from the
+                    # ancestor, dw > disc[v]) and self-loops are ignored.
+                    edge_stack.append(e)
+                    if dw < low[v]:
+                        low[v] = dw
+                continue
+            call_v.pop()
+            call_i.pop()
+            e_v = call_e.pop()
+            if not call_v:
+                break
+            u = call_v[-1]
+            if low[v] < low[u]:
+                low[u] = low[v]
+            if low[v] >= disc[u]:
+                while True:
+                    f = edge_stack.pop()
+                    block[f] = n_blocks
+                    if f == e_v:
+                        break
+                n_blocks += 1
+                if low[v] > disc[u]:
+                    is_bridge[e_v] = True
+                if u != root:
+                    is_cut[u] = True
+                else:
+                    root_children += 1
+        if root_children > 1:
+            is_cut[root] = True
+    return Biconnectivity(n_blocks, block_arr, cut_arr, bridge_arr)
+
+
+def bridges(g: CSRGraph):
+    """Ids of the edges whose removal disconnects their endpoints."""
+    return np.flatnonzero(biconnectivity(g).is_bridge)
+
+
+def articulation_points(g: CSRGraph):
+    """Vertices whose removal increases the number of components."""
+    return np.flatnonzero(biconnectivity(g).is_cut)
+
+
+def block_cut_tree(g: CSRGraph, bc: Biconnectivity = None) -> BlockCutTree:
+    """Tree joining every block to the cut vertices it contains."""
+    if bc is None:
+        bc = biconnectivity(g)
+    nb = bc.n_blocks
+    ok = bc.edge_block >= 0
+    blk = np.concatenate([bc.edge_block[ok], bc.edge_block[ok]])
+    ver = np.concatenate([g.src[ok], g.dst[ok]])
+    node_of = np.full(g.n, -1, dtype=np.int64)
+    node_of[ver] = blk  # a non-cut vertex lies in exactly one block
+    cut_vertices = np.flatnonzero(bc.is_cut)
+    node_of[cut_vertices] = nb + np.arange(len(cut_vertices), dtype=np.int64)
+    on_cut = bc.is_cut[ver]
+    pairs = np.unique(blk[on_cut] * g.n + ver[on_cut])
+    tree_u = pairs // g.n
+    tree_v = node_of[pairs % g.n]
+    return BlockCutTree(nb, cut_vertices, tree_u, tree_v, node_of)
+
+
+def random_topology(n: int, extra: int, seed: int = 0):
+    """A random tree (lots of bridges) plus ``extra`` random chords."""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    child = np.arange(1, n, dtype=np.int64)
+    parent = (rng.random(n - 1) * child).astype(np.int64)
+    cu = rng.integers(0, n, extra)
+    cv = rng.integers(0, n, extra)
+    return np.concatenate([parent, cu]), np.concatenate([child, cv])
+
+
+def benchmark(n: int = 1_000_000, extra: int = 300_000) -> None:
+    src, dst = random_topology(n, extra)
+    t0 = time.perf_counter()
+    g = CSRGraph(n, src, dst)
+    print(f"n={n} m={g.m}: CSR built in {time.perf_counter() - t0:.2f} s")
+    t0 = time.perf_counter()
+    bc = biconnectivity(g)
+    print(f"  biconnectivity  {time.perf_counter() - t0:6.2f} s  "
+          f"({bc.n_blocks} blocks, {int(bc.is_cut.sum())} cut vertices, "
+          f"{int(bc.is_bridge.sum())} bridges)")
+    t0 = time.perf_counter()
+    bct = block_cut_tree(g, bc)
+    print(f"  block-cut tree  {time.perf_counter() - t0:6.2f} s  ({len(bct.tree_u)} tree edges)")
+    dg = CSRGraph(n, src, dst, directed=True)
+    t0 = time.perf_counter()
+    count, _ = strongly_connected_components(dg)
+    print(f"  tarjan SCC      {time.perf_counter() - t0:6.2f} s  ({count} components)")
+
+
+def demo():
+    if np is None:
+        print("this demo needs NumPy")
+        return
+    dg = CSRGraph(6, [0, 1, 2, 2, 3, 4, 5], [1, 2, 0, 3, 4, 5, 4], directed=True)
+    print("SCC:", strongly_connected_components(dg))
+    # Two triangles sharing vertex 2, plus a pendant edge 4-5 (a bridge).
+    g = CSRGraph(7, [0, 1, 2, 2, 3, 4, 4], [1, 2, 0, 3, 4, 2, 5])
+    bc = biconnectivity(g)
+    print("edge blocks:", bc.edge_block.tolist())
+    print("articulation points:", articulation_points(g).tolist())
+    print("bridges (edge ids):", bridges(g).tolist())
+    bct = block_cut_tree(g, bc)
+    print("block-cut tree edges:", list(zip(bct.tree_u.tolist(), bct.tree_v.tolist())))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
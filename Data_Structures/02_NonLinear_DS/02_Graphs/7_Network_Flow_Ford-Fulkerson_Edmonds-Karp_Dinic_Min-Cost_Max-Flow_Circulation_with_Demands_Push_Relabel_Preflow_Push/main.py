@@ -1,23 +1,517 @@
+"""
+Topic: 10_Graph Algorithms
+Subtopic: Network Flow: Edmonds-Karp, Dinic, Min-Cost Max-Flow, Push-Relabel
+Description: Array-based residual graphs in CSR layout.
+
+Edges are collected with ``add_edge`` and then frozen into CSR form: all arcs
+leaving ``u`` live in ``range(head[u], head[u + 1])`` of the parallel arrays
+``to``/``cap``/``cost`` and ``rev[e]`` is the index of the paired reverse arc.
+Every algorithm walks only the arcs that exist, so memory and time scale with
+``E`` instead of ``V**2``.
+
+Run ``python main.py`` for the demo or ``python main.py --bench`` to compare
+against the dense-matrix Edmonds-Karp.
+"""
+from __future__ import annotations
+
+import heapq
+import random
+import sys
+import time
 from collections import deque
-def edmonds_karp(n, cap, s, t):
-    flow=0
+from typing import List, Optional, Sequence, Tuple
+
+INF = float("inf")
+
+
+class FlowNetwork:
+    """Residual flow network stored as CSR arrays with paired reverse arcs."""
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self._tail: List[int] = []
+        self._head_v: List[int] = []
+        self._cap0: List[int] = []
+        self._cost0: List[int] = []
+        self._built = False
+
+    def add_edge(self, u: int, v: int, cap: int, cost: int = 0) -> int:
+        """Add arc ``u -> v`` and return its id (usable with ``flow_on``)."""
+        if self._built:
+            raise RuntimeError("cannot add edges after the network is built")
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise IndexError(f"edge ({u}, {v}) out of range for n={self.n}")
+        self._tail += (u, v)
+        self._head_v += (v, u)
+        self._cap0 += (cap, 0)
+        self._cost0 += (cost, -cost)
+        return len(self._tail) // 2 - 1
+
+    def build(self) -> "FlowNetwork":
+        """Freeze the edge list into CSR order (counting sort by tail)."""
+        n, m = self.n, len(self._tail)
+        head = [0] * (n + 1)
+        for u in self._tail:
+            head[u + 1] += 1
+        for u in range(n):
+            head[u + 1] += head[u]
+        fill = head[:n]
+        pos = [0] * m
+        for e, u in enumerate(self._tail):
+            pos[e] = fill[u]
+            fill[u] += 1
+        to = [0] * m
+        cap = [0] * m
+        cost = [0] * m
+        rev = [0] * m
+        for e in range(m):
+            p = pos[e]
+            to[p] = self._head_v[e]
+            cap[p] = self._cap0[e]
+            cost[p] = self._cost0[e]
+            rev[p] = pos[e ^ 1]
+        self.head, self.to, self.cap, self.cost, self.rev = head, to, cap, cost, rev
+        self._orig = [self._cap0[e] for e in range(0, m, 2)]
+        self._pos = pos
+        self._built = True
+        return self
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.build()
+
+    def reset(self) -> None:
+        """Restore the original capacities so the network can be solved again."""
+        self._ensure_built()
+        for e, c in enumerate(self._cap0):
+            self.cap[self._pos[e]] = c
+
+    def flow_on(self, edge_id: int) -> int:
+        """Flow currently routed through the arc returned by ``add_edge``."""
+        return self._orig[edge_id] - self.cap[self._pos[2 * edge_id]]
+
+    # ------------------------------------------------------------------ Dinic
+    def _bfs_levels(self, s: int, t: int) -> Optional[List[int]]:
+        head, to, cap = self.head, self.to, self.cap
+        level = [-1] * self.n
+        level[s] = 0
+        q = deque([s])
+        while q:
+            u = q.popleft()
+            lu = level[u] + 1
+            for e in range(head[u], head[u + 1]):
+                v = to[e]
+                if cap[e] > 0 and level[v] < 0:
+                    level[v] = lu
+                    if v == t:
+                        return level
+                    q.append(v)
+        return None
+
+    def _blocking_flow(self, s: int, t: int, level: List[int]) -> int:
+        """Iterative DFS with current-arc pointers; no recursion at all."""
+        head, to, cap, rev = self.head, self.to, self.cap, self.rev
+        it = head[:-1]
+        path: List[int] = []
+        total = 0
+        u = s
+        while True:
+            if u == t:
+                f = min(cap[e] for e in path)
+                cut = len(path)
+                for i, e in enumerate(path):
+                    cap[e] -= f
+                    cap[rev[e]] += f
+                    if cap[e] == 0 and i < cut:
+                        cut = i
+                total += f
+                del path[cut:]
+                u = to[path[-1]] if path else s
+                continue
+            i, end, want = it[u], head[u + 1], level[u] + 1
+            while i < end and not (cap[i] > 0 and level[to[i]] == want):
+                i += 1
+            it[u] = i
+            if i < end:
+                path.append(i)
+                u = to[i]
+            elif u == s:
+                return total
+            else:
+                level[u] = -1
+                path.pop()
+                u = to[path[-1]] if path else s
+
+    def dinic(self, s: int, t: int) -> int:
+        """Maximum flow in O(V^2 E) (O(E sqrt V) on unit networks)."""
+        self._ensure_built()
+        if s == t:
+            return 0
+        flow = 0
+        while True:
+            level = self._bfs_levels(s, t)
+            if level is None:
+                return flow
+            flow += self._blocking_flow(s, t, level)
+
+    # ---------------------------------------------------------- Push-relabel
+    def _global_relabel(self, t: int, h: List[int]) -> None:
+        """Exact distance-to-sink labels via reverse BFS on the residual graph."""
+        n, head, to, cap, rev = self.n, self.head, self.to, self.cap, self.rev
+        for v in range(n):
+            h[v] = n
+        h[t] = 0
+        q = deque([t])
+        while q:
+            v = q.popleft()
+            hv = h[v] + 1
+            for e in range(head[v], head[v + 1]):
+                u = to[e]
+                if h[u] == n and cap[rev[e]] > 0:
+                    h[u] = hv
+                    q.append(u)
+
+    def push_relabel(self, s: int, t: int) -> int:
+        """Highest-label preflow-push with gap and global-relabel heuristics.
+
+        The first (preflow) phase fixes the max-flow value. Excess left at
+        nodes that cannot reach ``t`` is then pushed back to ``s`` by
+        ``_return_excess``, so the per-arc flows form a valid flow and
+        ``min_cut`` works just as after ``dinic``.
+        """
+        self._ensure_built()
+        if s == t:
+            return 0
+        n, head, to, cap, rev = self.n, self.head, self.to, self.cap, self.rev
+        h = [0] * n
+        self._global_relabel(t, h)
+        h[s] = n
+        excess = [0] * n
+        count = [0] * (n + 1)
+        for v in range(n):
+            if h[v] < n:
+                count[h[v]] += 1
+        buckets: List[List[int]] = [[] for _ in range(n)]
+        active = [False] * n
+        for e in range(head[s], head[s + 1]):
+            f = cap[e]
+            if f:
+                v = to[e]
+                cap[e] = 0
+                cap[rev[e]] += f
+                excess[v] += f
+                if v != t and not active[v] and h[v] < n:
+                    active[v] = True
+                    buckets[h[v]].append(v)
+        cur = head[:-1]
+        highest = n - 1
+        work, relabel_budget = 0, 6 * n + len(to)
+        while highest >= 0:
+            bucket = buckets[highest]
+            if not bucket:
+                highest -= 1
+                continue
+            u = bucket.pop()
+            active[u] = False
+            hu = h[u]
+            if hu >= n:
+                continue
+            ex = excess[u]
+            i, end = cur[u], head[u + 1]
+            while ex > 0:
+                if i == end:
+                    # Relabel.
+                    work += end - head[u]
+                    new_h = 2 * n
+                    for e in range(head[u], end):
+                        if cap[e] > 0 and h[to[e]] + 1 < new_h:
+                            new_h = h[to[e]] + 1
+                    count[hu] -= 1
+                    if count[hu] == 0 and hu < n:
+                        # Gap: nothing above ``hu`` can reach the sink any more.
+                        for v in range(n):
+                            if hu < h[v] < n:
+                                count[h[v]] -= 1
+                                h[v] = n
+                        new_h = n
+                    hu = h[u] = min(new_h, n)
+                    if hu >= n:
+                        break
+                    count[hu] += 1
+                    i = head[u]
+                    continue
+                v = to[i]
+                if cap[i] > 0 and hu == h[v] + 1:
+                    f = ex if ex < cap[i] else cap[i]
+                    cap[i] -= f
+                    cap[rev[i]] += f
+                    ex -= f
+                    excess[v] += f
+                    if v != t and v != s and not active[v]:
+                        active[v] = True
+                        buckets[hu - 1].append(v)
+                        if hu - 1 > highest:
+                            highest = hu - 1
+                    if ex == 0:
+                        break
+                i += 1
+            cur[u] = i
+            excess[u] = ex
+            if work > relabel_budget:
+                work = 0
+                self._global_relabel(t, h)
+                h[s] = n
+                count = [0] * (n + 1)
+                for v in range(n):
+                    if h[v] < n:
+                        count[h[v]] += 1
+                    cur[v] = head[v]
+                buckets = [[] for _ in range(n)]
+                for v in range(n):
+                    if active[v] and h[v] < n:
+                        buckets[h[v]].append(v)
+                    else:
+                        active[v] = False
+                highest = n - 1
+        self._return_excess(s, t, excess)
+        return excess[t]
+
+    def _return_excess(self, s: int, t: int, excess: List[int]) -> None:
+        """Second phase: FIFO push-relabel of the stranded excess back to ``s``.
+
+        None of these nodes can reach ``t`` in the residual graph, so no push
+        ever touches ``t`` and the flow value is unchanged.
+        """
+        n, head, to, cap, rev = self.n, self.head, self.to, self.cap, self.rev
+        queue = deque(v for v in range(n) if excess[v] > 0 and v != s and v != t)
+        if not queue:
+            return
+        h = [0] * n
+        self._global_relabel(s, h)
+        cur = head[:-1]
+        while queue:
+            u = queue.popleft()
+            ex, hu = excess[u], h[u]
+            i, end = cur[u], head[u + 1]
+            while ex > 0:
+                if i == end:
+                    new_h = 2 * n
+                    for e in range(head[u], end):
+                        if cap[e] > 0 and h[to[e]] + 1 < new_h:
+                            new_h = h[to[e]] + 1
+                    hu = h[u] = new_h
+                    i = head[u]
+                    continue
+                v = to[i]
+                if cap[i] > 0 and hu == h[v] + 1:
+                    f = ex if ex < cap[i] else cap[i]
+                    cap[i] -= f
+                    cap[rev[i]] += f
+                    ex -= f
+                    if excess[v] == 0 and v != s:
+                        queue.append(v)
+                    excess[v] += f
+                    if ex == 0:
+                        break
+                i += 1
+            cur[u] = i
+            excess[u] = ex
+
+    # ------------------------------------------------------ Min-cost max-flow
+    def _initial_potentials(self, s: int) -> List[float]:
+        """Bellman-Ford (SPFA) potentials so negative arc costs are allowed."""
+        n, head, to, cap, cost = self.n, self.head, self.to, self.cap, self.cost
+        dist = [INF] * n
+        dist[s] = 0
+        in_q = [False] * n
+        q = deque([s])
+        in_q[s] = True
+        relax = 0
+        while q:
+            u = q.popleft()
+            in_q[u] = False
+            du = dist[u]
+            for e in range(head[u], head[u + 1]):
+                if cap[e] > 0 and du + cost[e] < dist[to[e]]:
+                    v = to[e]
+                    dist[v] = du + cost[e]
+                    if not in_q[v]:
+                        relax += 1
+                        if relax > n * len(to):
+                            raise ValueError("negative-cost cycle reachable from source")
+                        in_q[v] = True
+                        q.append(v)
+        return [0 if d == INF else d for d in dist]
+
+    def min_cost_max_flow(self, s: int, t: int, max_flow: float = INF) -> Tuple[int, int]:
+        """Successive shortest paths with Johnson potentials; returns (flow, cost)."""
+        self._ensure_built()
+        n, head, to, cap, cost, rev = self.n, self.head, self.to, self.cap, self.cost, self.rev
+        if any(c < 0 for e, c in enumerate(cost) if cap[e] > 0):
+            pot = self._initial_potentials(s)
+        else:
+            pot = [0] * n
+        flow = total_cost = 0
+        while flow < max_flow:
+            dist = [INF] * n
+            prev_e = [-1] * n
+            dist[s] = 0
+            pq = [(0, s)]
+            while pq:
+                d, u = heapq.heappop(pq)
+                if d > dist[u]:
+                    continue
+                pu = pot[u]
+                for e in range(head[u], head[u + 1]):
+                    if cap[e] > 0:
+                        v = to[e]
+                        nd = d + cost[e] + pu - pot[v]
+                        if nd < dist[v]:
+                            dist[v] = nd
+                            prev_e[v] = e
+                            heapq.heappush(pq, (nd, v))
+            if dist[t] == INF:
+                break
+            for v in range(n):
+                if dist[v] < INF:
+                    pot[v] += dist[v]
+            f = max_flow - flow
+            v = t
+            while v != s:
+                e = prev_e[v]
+                if cap[e] < f:
+                    f = cap[e]
+                v = to[rev[e]]
+            v = t
+            while v != s:
+                e = prev_e[v]
+                cap[e] -= f
+                cap[rev[e]] += f
+                total_cost += f * cost[e]
+                v = to[rev[e]]
+            flow += f
+        return flow, total_cost
+
+    def min_cut(self, s: int) -> List[bool]:
+        """Source side of a minimum cut (call after a max-flow run)."""
+        head, to, cap = self.head, self.to, self.cap
+        side = [False] * self.n
+        side[s] = True
+        q = deque([s])
+        while q:
+            u = q.popleft()
+            for e in range(head[u], head[u + 1]):
+                if cap[e] > 0 and not side[to[e]]:
+                    side[to[e]] = True
+                    q.append(to[e])
+        return side
+
+
+def _edmonds_karp_dense(n, cap, s, t):
+    """Original O(V^2)-per-BFS matrix implementation, kept for benchmarking."""
+    flow = 0
     while True:
-        parent=[-1]*n; parent[s]=s; q=deque([s])
-        while q and parent[t]==-1:
-            u=q.popleft()
+        parent = [-1] * n; parent[s] = s; q = deque([s])
+        while q and parent[t] == -1:
+            u = q.popleft()
             for v in range(n):
-                if parent[v]==-1 and cap[u][v]>0:
-                    parent[v]=u; q.append(v)
-        if parent[t]==-1: break
-        v=t; aug=float('inf')
-        while v!=s:
-            u=parent[v]; aug=min(aug, cap[u][v]); v=u
-        v=t
-        while v!=s:
-            u=parent[v]; cap[u][v]-=aug; cap[v][u]+=aug; v=u
-        flow+=aug
+                if parent[v] == -1 and cap[u][v] > 0:
+                    parent[v] = u; q.append(v)
+        if parent[t] == -1: break
+        v = t; aug = float('inf')
+        while v != s:
+            u = parent[v]; aug = min(aug, cap[u][v]); v = u
+        v = t
+        while v != s:
+            u = parent[v]; cap[u][v] -= aug; cap[v][u] += aug; v = u
+        flow += aug
+    return flow
+
+
+def edmonds_karp(n, cap, s, t):
+    """Max flow on a dense capacity matrix (compatibility wrapper).
+
+    The matrix is converted to a sparse ``FlowNetwork`` and solved with Dinic.
+    As before, ``cap`` is updated in place to hold the residual capacities.
+    """
+    net = FlowNetwork(n)
+    for u in range(n):
+        row = cap[u]
+        for v in range(n):
+            if row[v] > 0:
+                net.add_edge(u, v, row[v])
+    net.build()
+    flow = net.dinic(s, t)
+    head, to, rc = net.head, net.to, net.cap
+    for u in range(n):
+        for e in range(head[u], head[u + 1]):
+            cap[u][to[e]] = 0
+    for u in range(n):
+        for e in range(head[u], head[u + 1]):
+            cap[u][to[e]] += rc[e]
     return flow
-if __name__=="__main__":
-    n=4; s,t=0,3
-    cap=[[0,3,2,0],[0,0,2,2],[0,0,0,3],[0,0,0,0]]
+
+
+def random_network(n: int, m: int, max_cap: int = 100, seed: int = 0) -> List[Tuple[int, int, int]]:
+    """Sparse random network with a guaranteed 0 -> n-1 backbone path."""
+    rng = random.Random(seed)
+    edges = [(i, i + 1, rng.randint(1, max_cap)) for i in range(n - 1)]
+    while len(edges) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((u, v, rng.randint(1, max_cap)))
+    return edges
+
+
+def _network_from(n: int, edges: Sequence[Tuple[int, int, int]]) -> FlowNetwork:
+    net = FlowNetwork(n)
+    for u, v, c in edges:
+        net.add_edge(u, v, c)
+    return net.build()
+
+
+def benchmark(n: int = 600, m: int = 6000, seed: int = 0) -> None:
+    """Time dense-matrix Edmonds-Karp against the CSR engines on one network."""
+    edges = random_network(n, m, seed=seed)
+    matrix = [[0] * n for _ in range(n)]
+    for u, v, c in edges:
+        matrix[u][v] += c
+    timings = []
+    t0 = time.perf_counter()
+    ref = _edmonds_karp_dense(n, matrix, 0, n - 1)
+    timings.append(("edmonds_karp (dense matrix)", time.perf_counter() - t0, ref))
+    for name in ("dinic", "push_relabel"):
+        net = _network_from(n, edges)
+        t0 = time.perf_counter()
+        val = getattr(net, name)(0, n - 1)
+        timings.append((f"{name} (CSR)", time.perf_counter() - t0, val))
+    base = timings[0][1]
+    print(f"n={n} m={m}")
+    for name, secs, val in timings:
+        print(f"  {name:<30} flow={val:<8} {secs * 1000:9.1f} ms  x{base / secs:6.1f}")
+    assert all(val == ref for _, _, val in timings), "flow values disagree"
+
+
+def demo():
+    n = 4; s, t = 0, 3
+    cap = [[0, 3, 2, 0], [0, 0, 2, 2], [0, 0, 0, 3], [0, 0, 0, 0]]
     print("max flow:", edmonds_karp(n, cap, s, t))
+
+    net = FlowNetwork(4)
+    for u, v, c in [(0, 1, 3), (0, 2, 2), (1, 2, 2), (1, 3, 2), (2, 3, 3)]:
+        net.add_edge(u, v, c)
+    print("dinic:", net.dinic(0, 3))
+    net.reset()
+    print("push-relabel:", net.push_relabel(0, 3))
+
+    mcmf = FlowNetwork(4)
+    for u, v, c, w in [(0, 1, 2, 1), (0, 2, 1, 2), (1, 2, 1, 1), (1, 3, 1, 3), (2, 3, 2, 1)]:
+        mcmf.add_edge(u, v, c, w)
+    print("min-cost max-flow (flow, cost):", mcmf.min_cost_max_flow(0, 3))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,5 +1,230 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 10_Graph Algorithms
+Subtopic: Eulerian paths & circuits (Hierholzer), de Bruijn graphs
+Description: Iterative Hierholzer over CSR arrays for directed and undirected
+multigraphs, plus a de Bruijn graph builder fed by k-mers streamed from disk.
+
+Edges are counting-sorted into typed ``offsets``/``targets``/``edge_ids``
+arrays and every vertex keeps a cursor to its next unused slot, so each slot
+is looked at once: O(V + E) overall. The walk uses an explicit stack of
+(vertex, edge) pairs held in ``array('q')`` buffers, so trails with tens of
+millions of edges need no recursion and about 16 bytes per stacked edge.
+Undirected edges appear in both endpoints' slots and share an id; a
+``bytearray`` marks ids already walked.
+
+Parallel edges and self-loops are fine. ``NotEulerianError`` is raised when
+the degree conditions fail or the edges are not connected.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+
+class NotEulerianError(ValueError):
+    """The multigraph has no Eulerian path (or circuit, when one was required)."""
+
+
+class EulerTrail(NamedTuple):
+    vertices: array   # v0, v1, ..., vm
+    edges: array      # edge ids in walking order (len == m)
+
+
+def _csr(n: int, src: Sequence[int], dst: Sequence[int], directed: bool):
+    m = len(src)
+    offsets = array("q", bytes(8 * (n + 1)))
+    for u in src:
+        offsets[u + 1] += 1
+    if not directed:
+        for v in dst:
+            offsets[v + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+    fill = offsets[:-1]
+    slots = offsets[-1]
+    targets = array("q", bytes(8 * slots))
+    edge_ids = array("q", bytes(8 * slots))
+    for e in range(m):
+        u, v = src[e], dst[e]
+        k = fill[u]
+        targets[k] = v
+        edge_ids[k] = e
+        fill[u] = k + 1
+        if not directed:
+            k = fill[v]
+            targets[k] = u
+            edge_ids[k] = e
+            fill[v] = k + 1
+    return offsets, targets, edge_ids
+
+
+def _start_vertex(n: int, offsets: array, src: Sequence[int], dst: Sequence[int],
+                  directed: bool, circuit: bool) -> int:
+    if directed:
+        balance = [0] * n
+        for u in src:
+            balance[u] += 1
+        for v in dst:
+            balance[v] -= 1
+        starts = [v for v in range(n) if balance[v] == 1]
+        ends = [v for v in range(n) if balance[v] == -1]
+        bad = sum(1 for b in balance if b < -1 or b > 1)
+        if bad or len(starts) > 1 or len(starts) != len(ends):
+            raise NotEulerianError("in/out degrees are too unbalanced for an Eulerian path")
+    else:
+        starts = [v for v in range(n) if (offsets[v + 1] - offsets[v]) & 1]
+        if len(starts) > 2:
+            raise NotEulerianError(f"{len(starts)} vertices have odd degree")
+    if starts:
+        if circuit:
+            raise NotEulerianError("degrees allow a path but not a circuit")
+        return starts[0]
+    return src[0]
+
+
+def eulerian_trail(n: int, src: Sequence[int], dst: Sequence[int], directed: bool = True,
+                   circuit: bool = False) -> EulerTrail:
+    """Walk every edge ``src[e] -> dst[e]`` exactly once.
+
+    With ``circuit=True`` the trail must end where it started.
+    """
+    m = len(src)
+    if len(dst) != m:
+        raise ValueError("src and dst must have the same length")
+    if m == 0:
+        return EulerTrail(array("q"), array("q"))
+    offsets, targets, edge_ids = _csr(n, src, dst, directed)
+    start = _start_vertex(n, offsets, src, dst, directed, circuit)
+    cursor = offsets[:-1]
+    used = bytearray(0 if directed else m)
+    stack_v = array("q", [start])
+    stack_e = array("q", [-1])
+    out_v = array("q")
+    out_e = array("q")
+    while stack_v:
+        v = stack_v[-1]
+        k = cursor[v]
+        end = offsets[v + 1]
+        if not directed:
+            while k < end and used[edge_ids[k]]:
+                k += 1
+        if k < end:
+            cursor[v] = k + 1
+            e = edge_ids[k]
+            if not directed:
+                used[e] = 1
+            stack_v.append(targets[k])
+            stack_e.append(e)
+        else:
+            cursor[v] = k
+            out_v.append(stack_v.pop())
+            out_e.append(stack_e.pop())
+    if len(out_e) != m + 1:
+        raise NotEulerianError("edges are not connected")
+    out_v.reverse()
+    out_e.reverse()
+    return EulerTrail(out_v, out_e[1:])
+
+
+# -------------------------------------------------------------- de Bruijn
+class DeBruijnGraph(NamedTuple):
+    labels: List[str]   # (k-1)-mer of each node
+    src: array
+    dst: array          # edge e is the k-mer labels[src[e]] + labels[dst[e]][-1]
+
+
+def read_kmers(path: str, k: int, chunk_bytes: int = 1 << 20) -> Iterator[str]:
+    """Yield every k-mer of every read in a text file, chunk by chunk.
+
+    One read per line; FASTA header lines (``>``) and blank lines are skipped.
+    """
+    with open(path) as fh:
+        while True:
+            lines = fh.readlines(chunk_bytes)
+            if not lines:
+                return
+            for line in lines:
+                read = line.strip()
+                if not read or read[0] == ">":
+                    continue
+                for i in range(len(read) - k + 1):
+                    yield read[i:i + k]
+
+
+def de_bruijn(kmers: Iterable[str]) -> DeBruijnGraph:
+    """One edge per k-mer from its prefix (k-1)-mer to its suffix (k-1)-mer.
+
+    All k-mers must share one length ``k >= 2``.
+    """
+    ids: Dict[str, int] = {}
+    labels: List[str] = []
+    src = array("q")
+    dst = array("q")
+    k = None
+    for kmer in kmers:
+        if k is None:
+            k = len(kmer)
+            if k < 2:
+                raise ValueError(f"k-mers need k >= 2, got {kmer!r}")
+        elif len(kmer) != k:
+            raise ValueError(f"k-mer {kmer!r} does not have length {k}")
+        for part, out in ((kmer[:-1], src), (kmer[1:], dst)):
+            i = ids.get(part)
+            if i is None:
+                i = ids[part] = len(labels)
+                labels.append(part)
+            out.append(i)
+    return DeBruijnGraph(labels, src, dst)
+
+
+def assemble(graph: DeBruijnGraph) -> str:
+    """Spell the sequence of an Eulerian path through a de Bruijn graph."""
+    trail = eulerian_trail(len(graph.labels), graph.src, graph.dst)
+    if not trail.vertices:
+        return ""
+    labels = graph.labels
+    return labels[trail.vertices[0]] + "".join(labels[v][-1] for v in trail.vertices[1:])
+
+
+def random_eulerian_edges(n: int, m: int, seed: int = 0) -> Tuple[array, array]:
+    """Edges of one random closed walk of length ``m`` (always Eulerian)."""
+    rng = random.Random(seed)
+    walk = array("q", (rng.randrange(n) for _ in range(m)))
+    src = walk
+    dst = walk[1:] + walk[:1]
+    return src, dst
+
+
+def benchmark(n: int = 200_000, m: int = 2_000_000) -> None:
+    src, dst = random_eulerian_edges(n, m)
+    for directed in (True, False):
+        t0 = time.perf_counter()
+        trail = eulerian_trail(n, src, dst, directed=directed, circuit=True)
+        kind = "directed" if directed else "undirected"
+        print(f"  {kind:<10} n={n} m={m}: circuit in {time.perf_counter() - t0:6.2f} s")
+        assert len(trail.edges) == m and trail.vertices[0] == trail.vertices[-1]
+    print(f"  trail buffers: {2 * 8 * (m + 1) / 1e6:.0f} MB (array('q'))")
+
+
+def demo():
+    # Undirected multigraph with a doubled edge 0-1 and a self-loop at 2.
+    print("undirected:", eulerian_trail(4, [0, 0, 1, 1, 2, 2, 3], [1, 1, 2, 3, 2, 3, 0],
+                                       directed=False).vertices.tolist())
+    genome = "TAATGCCATGGGATGTT"
+    graph = de_bruijn(genome[i:i + 3] for i in range(len(genome) - 2))
+    print("de Bruijn nodes:", len(graph.labels), "edges:", len(graph.src))
+    print("assembled:", assemble(graph))
+    try:
+        eulerian_trail(3, [0, 0, 0], [1, 2, 1])
+    except NotEulerianError as exc:
+        print("rejected:", exc)
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,5 +1,402 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 06_Data Structures — Graph & Connectivity
+Subtopic: Graph Representations (adjacency list & matrix, CSR/CSC)
+Description: Four interchangeable graph backends, chunked edge-list parsing
+into typed arrays, and a versioned binary format opened through ``mmap``.
+
+Backends (all directed; store both arcs for an undirected graph):
+
+* ``AdjacencyList``  - ``out[u]`` lists of ``(v, w)``; cheap inserts.
+* ``DenseMatrix``    - one flat ``array('d')`` of ``n * n`` weights, 0 = no
+  edge; O(1) edge tests, O(n^2) memory.
+* ``CSRGraph``       - out-edges grouped by source: ``offsets`` (n + 1),
+  ``indices`` and ``weights`` (m).
+* ``CSCGraph``       - the same layout grouped by target (in-edges).
+
+Every backend exposes ``edges()`` (three typed arrays) and ``from_edges``,
+and ``convert(graph, Backend)`` goes through those, so any pair converts in
+O(n + m) (plus O(n^2) for the dense matrix).
+
+``save_graph`` writes a CSR/CSC graph as a fixed header followed by the raw
+arrays, each 8-byte aligned. ``load_graph`` maps the file and exposes the
+arrays as ``memoryview`` casts into the mapping, so opening costs the same
+for 1 KB or 1 GB; pages are read lazily by the OS and shared between every
+process that maps the same file.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from typing import List, Optional, Sequence, Tuple, Type
+
+_MAGIC = b"GRPH"
+_VERSION = 1
+# magic, version, layout (0 = CSR, 1 = CSC), weighted, pad, n, m
+_HEADER = struct.Struct("<4sHBBxxxxqq")
+_FLAG_WEIGHTED = 1
+
+
+def read_edge_list(path: str, weighted: bool = False, chunk_bytes: int = 1 << 20,
+                   comments: str = "#") -> Tuple[int, array, array, Optional[array]]:
+    """Parse ``u v [w]`` lines into ``(n, src, dst, weights)`` typed arrays.
+
+    The file is read ``chunk_bytes`` at a time and never held in memory as
+    lines or tuples; ``n`` is one more than the largest vertex id.
+    """
+    src = array("q")
+    dst = array("q")
+    wts = array("d") if weighted else None
+    with open(path) as fh:
+        while True:
+            lines = fh.readlines(chunk_bytes)
+            if not lines:
+                break
+            for line in lines:
+                parts = line.split(comments, 1)[0].split()
+                if len(parts) < 2:
+                    continue
+                src.append(int(parts[0]))
+                dst.append(int(parts[1]))
+                if weighted:
+                    wts.append(float(parts[2]) if len(parts) > 2 else 1.0)
+    n = max(max(src, default=-1), max(dst, default=-1)) + 1
+    return n, src, dst, wts
+
+
+def _compress(n: int, keys: Sequence[int], vals: Sequence[int],
+              wts: Optional[Sequence[float]]) -> Tuple[array, array, Optional[array]]:
+    """Counting sort of ``vals`` (and ``wts``) by ``keys``; stable."""
+    offsets = array("q", bytes(8 * (n + 1)))
+    for k in keys:
+        offsets[k + 1] += 1
+    for k in range(n):
+        offsets[k + 1] += offsets[k]
+    fill = offsets[:-1]
+    m = len(keys)
+    indices = array("q", bytes(8 * m))
+    weights = array("d", bytes(8 * m)) if wts is not None else None
+    for e in range(m):
+        k = keys[e]
+        p = fill[k]
+        indices[p] = vals[e]
+        if weights is not None:
+            weights[p] = wts[e]
+        fill[k] = p + 1
+    return offsets, indices, weights
+
+
+class AdjacencyList:
+    """``out[u]`` is a list of ``(v, w)`` pairs."""
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.out: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+
+    @classmethod
+    def from_edges(cls, n: int, src: Sequence[int], dst: Sequence[int],
+                   weights: Optional[Sequence[float]] = None) -> "AdjacencyList":
+        g = cls(n)
+        for e in range(len(src)):
+            g.out[src[e]].append((dst[e], weights[e] if weights is not None else 1.0))
+        return g
+
+    def add_edge(self, u: int, v: int, w: float = 1.0) -> None:
+        self.out[u].append((v, w))
+
+    def neighbors(self, u: int) -> List[int]:
+        return [v for v, _ in self.out[u]]
+
+    def edges(self) -> Tuple[array, array, array]:
+        src, dst, wts = array("q"), array("q"), array("d")
+        for u, lst in enumerate(self.out):
+            for v, w in lst:
+                src.append(u)
+                dst.append(v)
+                wts.append(w)
+        return src, dst, wts
+
+
+class DenseMatrix:
+    """Row-major ``n * n`` weight matrix; 0 means no edge."""
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.data = array("d", bytes(8 * n * n))
+
+    @classmethod
+    def from_edges(cls, n: int, src: Sequence[int], dst: Sequence[int],
+                   weights: Optional[Sequence[float]] = None) -> "DenseMatrix":
+        g = cls(n)
+        for e in range(len(src)):
+            g.data[src[e] * n + dst[e]] += weights[e] if weights is not None else 1.0
+        return g
+
+    def weight(self, u: int, v: int) -> float:
+        return self.data[u * self.n + v]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return self.data[u * self.n + v] != 0
+
+    def neighbors(self, u: int) -> List[int]:
+        row = self.data[u * self.n:(u + 1) * self.n]
+        return [v for v, w in enumerate(row) if w != 0]
+
+    def edges(self) -> Tuple[array, array, array]:
+        """Non-zero entries in row order (parallel edges were summed)."""
+        src, dst, wts = array("q"), array("q"), array("d")
+        n, data = self.n, self.data
+        for u in range(n):
+            base = u * n
+            for v in range(n):
+                w = data[base + v]
+                if w != 0:
+                    src.append(u)
+                    dst.append(v)
+                    wts.append(w)
+        return src, dst, wts
+
+
+class _Compressed:
+    """Shared CSR/CSC storage: ``offsets``, ``indices`` and optional ``weights``.
+
+    The buffers may be ``array`` objects or ``memoryview`` casts into a
+    mapped file (see ``load_graph``); both index and slice the same way.
+    Rows handed out by ``neighbors``/``predecessors`` are always copies, so
+    no view into the mapping outlives ``close()``.
+    """
+
+    _LAYOUT = -1
+
+    def __init__(self, n: int, offsets, indices, weights=None) -> None:
+        self.n = n
+        self.offsets = offsets
+        self.indices = indices
+        self.weights = weights
+        self._mmap: Optional[mmap.mmap] = None
+        self._spans: List[Tuple[str, int, int]] = []
+
+    @property
+    def m(self) -> int:
+        return len(self.indices)
+
+    def degree(self, x: int) -> int:
+        return self.offsets[x + 1] - self.offsets[x]
+
+    def _row(self, x: int):
+        row = self.indices[self.offsets[x]:self.offsets[x + 1]]
+        return row.tolist() if isinstance(row, memoryview) else row
+
+    def _pairs(self) -> Tuple[array, array, Optional[array]]:
+        """``(major, minor, weights)``: major is the grouping vertex of each slot."""
+        major = array("q", bytes(8 * self.m))
+        off = self.offsets
+        for x in range(self.n):
+            for p in range(off[x], off[x + 1]):
+                major[p] = x
+        minor = array("q", self.indices) if isinstance(self.indices, array) \
+            else array("q", self.indices.tobytes())
+        wts = None
+        if self.weights is not None:
+            wts = array("d", self.weights) if isinstance(self.weights, array) \
+                else array("d", self.weights.tobytes())
+        return major, minor, wts
+
+    def _map_views(self) -> None:
+        view = memoryview(self._mmap)
+        bufs = [view[p:p + 8 * c].cast(code) for code, p, c in self._spans]
+        view.release()
+        self.offsets, self.indices = bufs[0], bufs[1]
+        self.weights = bufs[2] if len(bufs) > 2 else None
+
+    def close(self) -> None:
+        """Release the file mapping of a graph returned by ``load_graph``.
+
+        Raises ``BufferError`` (leaving the graph open and usable) while the
+        caller still holds a view of ``offsets``/``indices``/``weights``.
+        """
+        if self._mmap is None:
+            return
+        try:
+            for buf in (self.offsets, self.indices, self.weights):
+                if buf is not None:
+                    buf.release()
+            self._mmap.close()
+        except BufferError:
+            self._map_views()
+            raise BufferError("graph arrays are still referenced; drop them before close()") from None
+        self.offsets = self.indices = self.weights = None
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CSRGraph(_Compressed):
+    """Out-edges of ``u`` are ``indices[offsets[u]:offsets[u + 1]]``."""
+
+    _LAYOUT = 0
+
+    @classmethod
+    def from_edges(cls, n: int, src: Sequence[int], dst: Sequence[int],
+                   weights: Optional[Sequence[float]] = None) -> "CSRGraph":
+        return cls(n, *_compress(n, src, dst, weights))
+
+    def neighbors(self, u: int):
+        return self._row(u)
+
+    def edges(self) -> Tuple[array, array, Optional[array]]:
+        return self._pairs()
+
+
+class CSCGraph(_Compressed):
+    """In-edges of ``v`` are ``indices[offsets[v]:offsets[v + 1]]``."""
+
+    _LAYOUT = 1
+
+    @classmethod
+    def from_edges(cls, n: int, src: Sequence[int], dst: Sequence[int],
+                   weights: Optional[Sequence[float]] = None) -> "CSCGraph":
+        return cls(n, *_compress(n, dst, src, weights))
+
+    def predecessors(self, v: int):
+        return self._row(v)
+
+    def edges(self) -> Tuple[array, array, Optional[array]]:
+        dst, src, wts = self._pairs()
+        return src, dst, wts
+
+
+def convert(graph, backend: Type):
+    """Re-encode ``graph`` in another backend class (O(n + m) via edge arrays)."""
+    src, dst, wts = graph.edges()
+    return backend.from_edges(graph.n, src, dst, wts)
+
+
+# ------------------------------------------------------------ binary format
+def _pad(fh) -> None:
+    fh.write(b"\0" * (-fh.tell() % 8))
+
+
+def save_graph(graph: _Compressed, path: str) -> None:
+    """Write a CSR/CSC graph as header + offsets + indices [+ weights]."""
+    flags = _FLAG_WEIGHTED if graph.weights is not None else 0
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, graph._LAYOUT, flags, graph.n, graph.m))
+        for buf in (graph.offsets, graph.indices, graph.weights):
+            if buf is None:
+                continue
+            _pad(fh)
+            fh.write(buf.tobytes() if isinstance(buf, array) else buf)
+
+
+def load_graph(path: str, use_mmap: bool = True) -> _Compressed:
+    """Open a file written by ``save_graph``.
+
+    With ``use_mmap`` the arrays are zero-copy views into a read-only mapping
+    (call ``close()`` or use ``with`` to release it); otherwise they are read
+    into ordinary arrays.
+    """
+    with open(path, "rb") as fh:
+        head = fh.read(_HEADER.size)
+        if len(head) < _HEADER.size:
+            raise ValueError(f"{path}: truncated graph header")
+        magic, version, layout, flags, n, m = _HEADER.unpack(head)
+        if magic != _MAGIC:
+            raise ValueError(f"{path}: not a graph file")
+        if version != _VERSION:
+            raise ValueError(f"{path}: unsupported graph format version {version}")
+        if layout not in (0, 1):
+            raise ValueError(f"{path}: unknown layout {layout}")
+        sizes = [("q", n + 1), ("q", m)]
+        if flags & _FLAG_WEIGHTED:
+            sizes.append(("d", m))
+        spans = []
+        pos = _HEADER.size
+        for code, count in sizes:
+            pos += -pos % 8
+            spans.append((code, pos, count))
+            pos += 8 * count
+        if os.fstat(fh.fileno()).st_size < pos:
+            raise ValueError(f"{path}: truncated graph data")
+        cls = CSRGraph if layout == 0 else CSCGraph
+        if use_mmap:
+            g = cls(n, None, None)
+            g._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            g._spans = spans
+            g._map_views()
+            return g
+        bufs = []
+        for code, p, c in spans:
+            fh.seek(p)
+            a = array(code)
+            a.fromfile(fh, c)
+            bufs.append(a)
+    return cls(n, bufs[0], bufs[1], bufs[2] if len(bufs) > 2 else None)
+
+
+def _write_random_edge_file(path: str, n: int, m: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with open(path, "w") as fh:
+        for start in range(0, m, 10_000):
+            fh.write("".join(f"{rng.randrange(n)} {rng.randrange(n)} {rng.random():.4f}\n"
+                             for _ in range(min(10_000, m - start))))
+
+
+def benchmark(n: int = 200_000, m: int = 2_000_000) -> None:
+    tmp = tempfile.mkdtemp()
+    text = os.path.join(tmp, "edges.txt")
+    binary = os.path.join(tmp, "edges.grph")
+    _write_random_edge_file(text, n, m)
+    print(f"n={n} m={m}, text file {os.path.getsize(text) / 1e6:.0f} MB")
+    t0 = time.perf_counter()
+    nn, src, dst, wts = read_edge_list(text, weighted=True)
+    parse = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    g = CSRGraph.from_edges(nn, src, dst, wts)
+    build = time.perf_counter() - t0
+    print(f"  parse text {parse:6.2f} s, build CSR {build:6.2f} s")
+    save_graph(g, binary)
+    print(f"  binary file {os.path.getsize(binary) / 1e6:.0f} MB")
+    t0 = time.perf_counter()
+    with load_graph(binary) as h:
+        opened = time.perf_counter() - t0
+        assert h.m == g.m and list(h.neighbors(7)) == list(g.neighbors(7))
+    t0 = time.perf_counter()
+    load_graph(binary, use_mmap=False)
+    read = time.perf_counter() - t0
+    print(f"  open via mmap {opened * 1e3:8.3f} ms, read into arrays {read * 1e3:8.1f} ms")
+    for p in (text, binary):
+        os.remove(p)
+    os.rmdir(tmp)
+
+
+def demo():
+    src, dst, wts = [0, 0, 1, 2, 3], [1, 2, 2, 0, 2], [1.0, 4.0, 2.0, 7.0, 3.0]
+    csr = CSRGraph.from_edges(4, src, dst, wts)
+    print("CSR out(0):", list(csr.neighbors(0)))
+    csc = convert(csr, CSCGraph)
+    print("CSC in(2):", list(csc.predecessors(2)))
+    print("dense w(2,0):", convert(csc, DenseMatrix).weight(2, 0))
+    print("adjacency list:", convert(csr, AdjacencyList).out)
+    path = os.path.join(tempfile.mkdtemp(), "demo.grph")
+    save_graph(csr, path)
+    with load_graph(path) as g:
+        print("mmap reload out(0):", list(g.neighbors(0)), "weights:", list(g.weights))
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
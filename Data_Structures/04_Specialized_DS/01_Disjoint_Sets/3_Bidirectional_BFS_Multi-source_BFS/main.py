@@ -1,5 +1,223 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 06_Data Structures — Graph & Connectivity
+Subtopic: Bidirectional BFS, Multi-source BFS
+Description: Unweighted shortest-path query engine over CSR arrays with
+epoch-stamped search state.
+
+``BFSEngine.distance``/``path`` grow one BFS ball from each endpoint and
+always expand the side whose frontier currently has fewer vertices. A whole
+layer is expanded before stopping, so the shortest meeting is found; on
+graphs with growing neighbourhoods each ball stays around the square root
+of what a one-sided search would touch.
+
+The engine allocates its mark/distance/parent arrays once. A query bumps an
+epoch counter instead of clearing them, so a query costs only the vertices
+it visits, which is what lets a server answer thousands per second.
+
+``nearest_facility`` is a single BFS seeded with every facility at distance
+0: each vertex ends up labelled with the facility that reached it first
+(ties go to the facility listed first) and its distance, in O(n + m).
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from array import array
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+
+def _csr(n: int, src: Sequence[int], dst: Sequence[int]) -> Tuple[array, array]:
+    offsets = array("q", bytes(8 * (n + 1)))
+    for u in src:
+        offsets[u + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+    fill = offsets[:-1]
+    targets = array("q", bytes(8 * len(src)))
+    for u, v in zip(src, dst):
+        targets[fill[u]] = v
+        fill[u] += 1
+    return offsets, targets
+
+
+class BFSEngine:
+    """Reusable bidirectional and multi-source BFS over one graph."""
+
+    def __init__(self, n: int, src: Sequence[int], dst: Sequence[int], directed: bool = False) -> None:
+        self.n = n
+        self.directed = directed
+        if not directed:
+            src, dst = list(src) + list(dst), list(dst) + list(src)
+        self.out = _csr(n, src, dst)
+        self.inn = _csr(n, dst, src) if directed else self.out
+        self._epoch = 0
+        # Per side: epoch stamp, distance from that side's root, BFS parent.
+        self._mark = (array("q", bytes(8 * n)), array("q", bytes(8 * n)))
+        self._dist = (array("q", bytes(8 * n)), array("q", bytes(8 * n)))
+        self._parent = (array("q", bytes(8 * n)), array("q", bytes(8 * n)))
+        self.visited = 0  # vertices touched by the last query
+
+    def _search(self, s: int, t: int) -> Tuple[int, int]:
+        """``(distance, meeting vertex)``; distance -1 if unreachable."""
+        if s == t:
+            return 0, s
+        self._epoch += 1
+        ep = self._epoch
+        mark, dist, parent = self._mark, self._dist, self._parent
+        for side, root in ((0, s), (1, t)):
+            mark[side][root] = ep
+            dist[side][root] = 0
+            parent[side][root] = -1
+        frontiers = [[s], [t]]
+        graphs = (self.out, self.inn)
+        visited = 2
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            off, tgt = graphs[side]
+            my_mark, my_dist, my_parent = mark[side], dist[side], parent[side]
+            other_mark, other_dist = mark[1 - side], dist[1 - side]
+            best, meet = -1, -1
+            nxt = []
+            for x in frontiers[side]:
+                dx = my_dist[x] + 1
+                for i in range(off[x], off[x + 1]):
+                    y = tgt[i]
+                    if my_mark[y] == ep:
+                        continue
+                    my_mark[y] = ep
+                    my_dist[y] = dx
+                    my_parent[y] = x
+                    visited += 1
+                    if other_mark[y] == ep:
+                        d = dx + other_dist[y]
+                        if best < 0 or d < best:
+                            best, meet = d, y
+                    else:
+                        nxt.append(y)
+            if best >= 0:
+                self.visited = visited
+                return best, meet
+            frontiers[side] = nxt
+        self.visited = visited
+        return -1, -1
+
+    def distance(self, s: int, t: int) -> int:
+        """Number of edges on a shortest ``s -> t`` path, or -1."""
+        return self._search(s, t)[0]
+
+    def path(self, s: int, t: int) -> Optional[List[int]]:
+        """A shortest ``s -> t`` path as a vertex list, or None."""
+        if s == t:
+            return [s]
+        d, meet = self._search(s, t)
+        if d < 0:
+            return None
+        # The meeting vertex was reached by both searches; roots have parent -1.
+        fwd, bwd = self._parent
+        head = []
+        x = meet
+        while x != -1:
+            head.append(x)
+            x = fwd[x]
+        head.reverse()
+        x = bwd[meet]
+        while x != -1:
+            head.append(x)
+            x = bwd[x]
+        return head
+
+    def nearest_facility(self, facilities: Sequence[int],
+                         toward: bool = False) -> Tuple[array, array]:
+        """``(label, dist)`` for every vertex; -1 where no facility is reachable.
+
+        ``label[v]`` is the index into ``facilities``. Distances run from the
+        facility to ``v``; with ``toward=True`` (directed graphs) from ``v`` to
+        the facility instead.
+        """
+        n = self.n
+        off, tgt = self.inn if toward else self.out
+        label = array("q", [-1]) * n
+        dist = array("q", [-1]) * n
+        q = deque()
+        for k, f in enumerate(facilities):
+            if label[f] < 0:
+                label[f] = k
+                dist[f] = 0
+                q.append(f)
+        while q:
+            x = q.popleft()
+            lx, dx = label[x], dist[x] + 1
+            for i in range(off[x], off[x + 1]):
+                y = tgt[i]
+                if label[y] < 0:
+                    label[y] = lx
+                    dist[y] = dx
+                    q.append(y)
+        return label, dist
+
+
+def _bfs_distance(n: int, off: array, tgt: array, s: int, t: int) -> int:
+    """One-sided BFS with a fresh distance list per query (baseline)."""
+    dist = [-1] * n
+    dist[s] = 0
+    q = deque([s])
+    while q:
+        x = q.popleft()
+        if x == t:
+            return dist[x]
+        for i in range(off[x], off[x + 1]):
+            y = tgt[i]
+            if dist[y] < 0:
+                dist[y] = dist[x] + 1
+                q.append(y)
+    return -1
+
+
+def random_graph(n: int, m: int, seed: int = 0) -> Tuple[List[int], List[int]]:
+    rng = random.Random(seed)
+    return [rng.randrange(n) for _ in range(m)], [rng.randrange(n) for _ in range(m)]
+
+
+def benchmark(n: int = 200_000, m: int = 1_000_000, queries: int = 40) -> None:
+    src, dst = random_graph(n, m)
+    eng = BFSEngine(n, src, dst)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    print(f"n={n} m={m}, {queries} random queries")
+    t0 = time.perf_counter()
+    ref = [_bfs_distance(n, *eng.out, s, t) for s, t in pairs]
+    base = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    touched = 0
+    got = []
+    for s, t in pairs:
+        got.append(eng.distance(s, t))
+        touched += eng.visited
+    bi = time.perf_counter() - t0
+    assert got == ref
+    print(f"  one-sided BFS     {base:6.2f} s  ({queries / base:8.0f} queries/s)")
+    print(f"  bidirectional BFS {bi:6.2f} s  ({queries / bi:8.0f} queries/s, "
+          f"{touched // queries} vertices/query)")
+    t0 = time.perf_counter()
+    eng.nearest_facility(rng.sample(range(n), 100))
+    print(f"  nearest of 100 facilities for all vertices {time.perf_counter() - t0:6.2f} s")
+
+
+def demo():
+    # 0-1-2-3-4 chain with a shortcut 1-3 and a spur 4-5.
+    eng = BFSEngine(7, [0, 1, 2, 3, 1, 4], [1, 2, 3, 4, 3, 5])
+    print("distance(0, 5):", eng.distance(0, 5), "path:", eng.path(0, 5))
+    print("distance(0, 6):", eng.distance(0, 6))
+    label, dist = eng.nearest_facility([0, 5])
+    print("nearest facility:", label.tolist(), "dist:", dist.tolist())
+    dg = BFSEngine(4, [0, 1, 2], [1, 2, 3], directed=True)
+    print("directed path(0, 3):", dg.path(0, 3), "reverse:", dg.path(3, 0))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
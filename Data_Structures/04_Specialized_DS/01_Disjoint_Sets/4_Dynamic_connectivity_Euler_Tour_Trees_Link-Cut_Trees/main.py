@@ -1,5 +1,496 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 06_Data Structures — Graph & Connectivity
+Subtopic: Dynamic connectivity: Euler Tour Trees, Link-Cut Trees
+Description: Link-cut trees with path aggregates, Euler-tour-tree forests and
+an online connectivity structure for graphs whose edges come and go.
+
+All node state lives in parallel lists indexed by node id (children, parent,
+flags, aggregates); there are no per-node Python objects.
+
+* ``LinkCutTree``: Sleator-Tarjan splay-based preferred paths with a lazy
+  reversal bit, so ``link``/``cut``/``connected``/``path_aggregate`` are
+  amortized O(log n). The aggregate ``op`` must be associative and
+  commutative (sum, min, max, xor, ...), because rerooting reverses paths.
+* ``EulerTourForest``: each tree is its Euler tour stored in an implicit
+  treap (vertex nodes plus two arc nodes per edge). Rerooting, linking and
+  cutting are O(1) splits/merges, each expected O(log n); subtree counters
+  give component sizes in O(log n).
+* ``DynamicConnectivity``: a spanning forest kept in an ``EulerTourForest``
+  plus the non-tree edges. Deleting a tree edge searches for a replacement
+  from the smaller of the two halves only, skipping treap subtrees with no
+  non-tree edges. This is the first level of Holm-de Lichtenberg-Thorup
+  without the level hierarchy: inserts and queries are O(log n); a deletion
+  costs O(log n) per non-tree edge scanned on the smaller side.
+"""
+from __future__ import annotations
+
+import operator
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class LinkCutTree:
+    """Dynamic forest on vertices ``0..n-1`` with path aggregates."""
+
+    def __init__(self, n: int, values: Optional[Sequence] = None,
+                 op: Callable = operator.add, identity=0) -> None:
+        self.left = [-1] * n
+        self.right = [-1] * n
+        self.par = [-1] * n
+        self.rev = [False] * n
+        self.val = list(values) if values is not None else [identity] * n
+        self.agg = list(self.val)
+        self.op = op
+        self.identity = identity
+
+    def _is_root(self, x: int) -> bool:
+        p = self.par[x]
+        return p < 0 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x: int) -> None:
+        if self.rev[x]:
+            left, right, rev = self.left, self.right, self.rev
+            a, b = left[x], right[x]
+            left[x], right[x] = b, a
+            if a >= 0:
+                rev[a] = not rev[a]
+            if b >= 0:
+                rev[b] = not rev[b]
+            rev[x] = False
+
+    def _pull(self, x: int) -> None:
+        a, b = self.left[x], self.right[x]
+        agg, op = self.agg, self.op
+        v = self.val[x]
+        if a >= 0:
+            v = op(agg[a], v)
+        if b >= 0:
+            v = op(v, agg[b])
+        agg[x] = v
+
+    def _rotate(self, x: int) -> None:
+        left, right, par = self.left, self.right, self.par
+        p = par[x]
+        g = par[p]
+        if left[p] == x:
+            b = right[x]
+            left[p] = b
+            right[x] = p
+        else:
+            b = left[x]
+            right[p] = b
+            left[x] = p
+        if b >= 0:
+            par[b] = p
+        if g >= 0:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        par[x] = g
+        par[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x: int) -> None:
+        path = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.par[y]
+            path.append(y)
+        for y in reversed(path):
+            self._push(y)
+        left, par = self.left, self.par
+        while not self._is_root(x):
+            p = par[x]
+            if not self._is_root(p):
+                g = par[p]
+                self._rotate(p if (left[g] == p) == (left[p] == x) else x)
+            self._rotate(x)
+
+    def _access(self, x: int) -> None:
+        last = -1
+        y = x
+        while y >= 0:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.par[y]
+        self._splay(x)
+
+    def make_root(self, x: int) -> None:
+        self._access(x)
+        self.rev[x] = not self.rev[x]
+
+    def find_root(self, x: int) -> int:
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] < 0:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, u: int, v: int) -> bool:
+        return u == v or self.find_root(u) == self.find_root(v)
+
+    def link(self, u: int, v: int) -> None:
+        """Add edge ``u - v``; they must be in different trees."""
+        self.make_root(u)
+        if self.find_root(v) == u:
+            raise ValueError(f"{u} and {v} are already connected")
+        self.par[u] = v
+
+    def cut(self, u: int, v: int) -> None:
+        """Remove edge ``u - v``; raises ValueError if it is not in the forest."""
+        self.make_root(u)
+        self._access(v)
+        if self.left[v] == u:
+            self._push(u)
+        if self.left[v] != u or self.left[u] >= 0 or self.right[u] >= 0:
+            raise ValueError(f"no edge {u} - {v}")
+        self.left[v] = -1
+        self.par[u] = -1
+        self._pull(v)
+
+    def path_aggregate(self, u: int, v: int):
+        """``op`` folded over the values on the ``u .. v`` path."""
+        if not self.connected(u, v):
+            raise ValueError(f"{u} and {v} are not connected")
+        self.make_root(u)
+        self._access(v)
+        return self.agg[v]
+
+    def set_value(self, x: int, value) -> None:
+        self._access(x)
+        self.val[x] = value
+        self._pull(x)
+
+
+class EulerTourForest:
+    """Euler tours of a dynamic forest in array-backed implicit treaps.
+
+    Nodes ``0..n-1`` are the vertices; arc nodes for tree edges are
+    allocated above ``n`` and recycled through a free list.
+    """
+
+    def __init__(self, n: int, seed: int = 0) -> None:
+        self.n = n
+        self._rng = random.Random(seed)
+        self.left = [-1] * n
+        self.right = [-1] * n
+        self.par = [-1] * n
+        self.prio = [self._rng.random() for _ in range(n)]
+        self.size = [1] * n
+        self.vcount = [1] * n       # vertex nodes in the subtree
+        self.mark = [0] * n         # per-node user counter (e.g. non-tree degree)
+        self.mark_sum = [0] * n
+        self.arcs: Dict[Tuple[int, int], int] = {}
+        self._free: List[int] = []
+
+    # ----------------------------------------------------------- treap core
+    def _new_arc(self) -> int:
+        if self._free:
+            x = self._free.pop()
+            self.prio[x] = self._rng.random()
+        else:
+            x = len(self.left)
+            for lst, v in ((self.left, -1), (self.right, -1), (self.par, -1), (self.size, 1),
+                           (self.vcount, 0), (self.mark, 0), (self.mark_sum, 0)):
+                lst.append(v)
+            self.prio.append(self._rng.random())
+        self.left[x] = self.right[x] = self.par[x] = -1
+        self.size[x] = 1
+        self.vcount[x] = self.mark[x] = self.mark_sum[x] = 0
+        return x
+
+    def _update(self, x: int) -> None:
+        a, b = self.left[x], self.right[x]
+        s = 1
+        c = 1 if x < self.n else 0
+        k = self.mark[x]
+        if a >= 0:
+            s += self.size[a]
+            c += self.vcount[a]
+            k += self.mark_sum[a]
+        if b >= 0:
+            s += self.size[b]
+            c += self.vcount[b]
+            k += self.mark_sum[b]
+        self.size[x] = s
+        self.vcount[x] = c
+        self.mark_sum[x] = k
+
+    def _root(self, x: int) -> int:
+        par = self.par
+        while par[x] >= 0:
+            x = par[x]
+        return x
+
+    def _index(self, x: int) -> int:
+        left, par, size = self.left, self.par, self.size
+        i = size[left[x]] if left[x] >= 0 else 0
+        while par[x] >= 0:
+            p = par[x]
+            if self.right[p] == x:
+                i += 1 + (size[left[p]] if left[p] >= 0 else 0)
+            x = p
+        return i
+
+    def _merge(self, a: int, b: int) -> int:
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        left, right, par, prio = self.left, self.right, self.par, self.prio
+        if prio[a] > prio[b]:
+            r = self._merge(right[a], b)
+            right[a] = r
+            par[r] = a
+            self._update(a)
+            par[a] = -1
+            return a
+        r = self._merge(a, left[b])
+        left[b] = r
+        par[r] = b
+        self._update(b)
+        par[b] = -1
+        return b
+
+    def _split(self, t: int, k: int) -> Tuple[int, int]:
+        """First ``k`` nodes of treap ``t`` and the rest, both detached."""
+        if t < 0:
+            return -1, -1
+        left, right, par, size = self.left, self.right, self.par, self.size
+        ls = size[left[t]] if left[t] >= 0 else 0
+        if k <= ls:
+            a, b = self._split(left[t], k)
+            left[t] = b
+            if b >= 0:
+                par[b] = t
+            self._update(t)
+            par[t] = -1
+            if a >= 0:
+                par[a] = -1
+            return a, t
+        a, b = self._split(right[t], k - ls - 1)
+        right[t] = a
+        if a >= 0:
+            par[a] = t
+        self._update(t)
+        par[t] = -1
+        if b >= 0:
+            par[b] = -1
+        return t, b
+
+    def _reroot(self, v: int) -> int:
+        r = self._root(v)
+        a, b = self._split(r, self._index(v))
+        return self._merge(b, a)
+
+    # ------------------------------------------------------------- forest API
+    def connected(self, u: int, v: int) -> bool:
+        return self._root(u) == self._root(v)
+
+    def component_size(self, v: int) -> int:
+        return self.vcount[self._root(v)]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return (u, v) in self.arcs
+
+    def link(self, u: int, v: int) -> None:
+        if self.connected(u, v):
+            raise ValueError(f"{u} and {v} are already connected")
+        tu = self._reroot(u)
+        tv = self._reroot(v)
+        uv, vu = self._new_arc(), self._new_arc()
+        self.arcs[(u, v)] = uv
+        self.arcs[(v, u)] = vu
+        self._merge(self._merge(self._merge(tu, uv), tv), vu)
+
+    def cut(self, u: int, v: int) -> None:
+        a = self.arcs.pop((u, v), None)
+        if a is None:
+            raise ValueError(f"no tree edge {u} - {v}")
+        b = self.arcs.pop((v, u))
+        ia, ib = self._index(a), self._index(b)
+        if ia > ib:
+            a, b, ia, ib = b, a, ib, ia
+        rest, tail = self._split(self._root(a), ib + 1)
+        rest, _ = self._split(rest, ib)               # drop arc b
+        rest, middle = self._split(rest, ia + 1)      # middle: the detached tree
+        head, _ = self._split(rest, ia)               # drop arc a
+        self._merge(head, tail)
+        self._free.extend((a, b))
+
+    def add_mark(self, v: int, delta: int) -> None:
+        """Adjust ``v``'s counter and every subtree sum above it."""
+        self.mark[v] += delta
+        x = v
+        while x >= 0:
+            self.mark_sum[x] += delta
+            x = self.par[x]
+
+    def marked_vertices(self, v: int) -> List[int]:
+        """Vertices with a non-zero counter in ``v``'s tree (skips empty subtrees)."""
+        out = []
+        stack = [self._root(v)]
+        left, right, mark_sum, mark, n = self.left, self.right, self.mark_sum, self.mark, self.n
+        while stack:
+            x = stack.pop()
+            if x < n and mark[x]:
+                out.append(x)
+            for c in (left[x], right[x]):
+                if c >= 0 and mark_sum[c]:
+                    stack.append(c)
+        return out
+
+
+class DynamicConnectivity:
+    """Online ``connected(u, v)`` under edge insertions and deletions."""
+
+    def __init__(self, n: int) -> None:
+        self.forest = EulerTourForest(n)
+        self.nontree: List[Dict[int, int]] = [{} for _ in range(n)]  # neighbour -> copies
+        self.scanned = 0  # non-tree edges looked at by replacement searches
+
+    def connected(self, u: int, v: int) -> bool:
+        return u == v or self.forest.connected(u, v)
+
+    def component_size(self, v: int) -> int:
+        return self.forest.component_size(v)
+
+    def _add_nontree(self, u: int, v: int) -> None:
+        for a, b in ((u, v), (v, u)):
+            adj = self.nontree[a]
+            if b not in adj:
+                self.forest.add_mark(a, 1)
+            adj[b] = adj.get(b, 0) + 1
+
+    def _remove_nontree(self, u: int, v: int) -> None:
+        for a, b in ((u, v), (v, u)):
+            adj = self.nontree[a]
+            if adj[b] == 1:
+                del adj[b]
+                self.forest.add_mark(a, -1)
+            else:
+                adj[b] -= 1
+
+    def add_edge(self, u: int, v: int) -> None:
+        if u == v:
+            return
+        if self.forest.connected(u, v):
+            self._add_nontree(u, v)
+        else:
+            self.forest.link(u, v)
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """Delete one copy of ``u - v``; raises ValueError if absent."""
+        if u == v:
+            return
+        if v in self.nontree[u]:
+            self._remove_nontree(u, v)
+            return
+        forest = self.forest
+        if not forest.has_edge(u, v):
+            raise ValueError(f"no edge {u} - {v}")
+        forest.cut(u, v)
+        small = u if forest.component_size(u) <= forest.component_size(v) else v
+        for x in forest.marked_vertices(small):
+            for y in self.nontree[x]:
+                self.scanned += 1
+                if not forest.connected(x, y):
+                    self._remove_nontree(x, y)
+                    forest.link(x, y)
+                    return
+
+
+def _component_labels(n: int, edges: Dict[Tuple[int, int], int]) -> List[int]:
+    """Component labels from scratch with a list union-find (baseline)."""
+    parent = list(range(n))
+    for (a, b) in edges:
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[a] = b
+    for x in range(n):
+        r = x
+        while parent[r] != r:
+            r = parent[r]
+        parent[x] = r
+    return parent
+
+
+def benchmark(n: int = 50_000, m: int = 100_000, events: int = 20_000) -> None:
+    rng = random.Random(0)
+    live: Dict[Tuple[int, int], int] = {}
+    dc = DynamicConnectivity(n)
+    for _ in range(m):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            key = (min(a, b), max(a, b))
+            live[key] = live.get(key, 0) + 1
+            dc.add_edge(a, b)
+    keys = list(live)
+    t0 = time.perf_counter()
+    for _ in range(events):
+        if rng.random() < 0.5 and keys:
+            i = rng.randrange(len(keys))
+            key = keys[i]
+            dc.remove_edge(*key)
+            live[key] -= 1
+            if not live[key]:
+                del live[key]
+                keys[i] = keys[-1]
+                keys.pop()
+        else:
+            a, b = rng.randrange(n), rng.randrange(n)
+            if a != b:
+                key = (min(a, b), max(a, b))
+                if key not in live:
+                    keys.append(key)
+                live[key] = live.get(key, 0) + 1
+                dc.add_edge(a, b)
+        dc.connected(rng.randrange(n), rng.randrange(n))
+    online = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    labels = _component_labels(n, live)
+    per_event = time.perf_counter() - t0
+    print(f"n={n} m~{m}, {events} link up/down events with a query after each")
+    print(f"  recompute components per event (extrapolated) {per_event * events:8.2f} s")
+    print(f"  DynamicConnectivity                            {online:8.2f} s  "
+          f"({dc.scanned} non-tree edges scanned)")
+    for _ in range(1000):
+        a, b = rng.randrange(n), rng.randrange(n)
+        assert dc.connected(a, b) == (labels[a] == labels[b])
+
+
+def demo():
+    lct = LinkCutTree(6, values=[5, 1, 4, 2, 7, 3], op=max, identity=float("-inf"))
+    for u, v in [(0, 1), (1, 2), (1, 3), (3, 4)]:
+        lct.link(u, v)
+    print("max on path 2..4:", lct.path_aggregate(2, 4))
+    lct.cut(1, 3)
+    print("after cut(1, 3): 2~4", lct.connected(2, 4), " 3~4", lct.connected(3, 4))
+    dc = DynamicConnectivity(5)
+    for u, v in [(0, 1), (1, 2), (2, 0), (3, 4)]:
+        dc.add_edge(u, v)
+    dc.remove_edge(0, 1)
+    print("ring minus an edge, 0~1:", dc.connected(0, 1), "size:", dc.component_size(0))
+    dc.remove_edge(1, 2)
+    print("then minus 1-2, 0~1:", dc.connected(0, 1), " 0~3:", dc.connected(0, 3))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
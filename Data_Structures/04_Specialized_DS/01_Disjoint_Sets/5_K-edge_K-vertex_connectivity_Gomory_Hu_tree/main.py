@@ -1,5 +1,341 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 06_Data Structures — Graph & Connectivity
+Subtopic: K-edge / K-vertex connectivity, Gomory-Hu tree
+Description: Gusfield's Gomory-Hu (equivalent flow) tree with one reusable
+residual graph, optional process-pool flows, O(1) min-cut queries and
+k-edge-connected classes.
+
+``ResidualGraph`` builds the CSR flow network of an undirected capacitated
+graph once (each edge becomes two arcs of the same capacity). Every max-flow
+starts by copying the original capacities back over the residual array, a
+single list slice, so the n - 1 flows never rebuild anything. Flows are
+Dinic with BFS levels and an iterative current-arc DFS.
+
+Gusfield needs the flows in order (cut ``i`` re-parents later vertices), but
+the flow for ``i`` only depends on the pair ``(i, parent[i])``. With
+``workers > 1`` a batch of upcoming pairs is solved speculatively in a
+process pool; results are applied in order and a pair whose parent was
+changed by an earlier cut in the batch is simply solved again. The tree is
+identical to the serial one.
+
+``CutOracle`` answers ``min_cut(u, v)``: the minimum edge weight on the tree
+path. The path minimum is the weight of the lowest common ancestor in the
+tree's Kruskal reconstruction tree, found in O(1) with an Euler tour and a
+sparse table. ``k_edge_classes(k)`` groups vertices with pairwise
+edge-connectivity >= k (delete tree edges lighter than ``k``).
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+Edge = Tuple[int, int, float]
+
+
+class ResidualGraph:
+    """Undirected flow network in CSR form, reusable across max-flow calls."""
+
+    def __init__(self, n: int, edges: Sequence[Edge]) -> None:
+        self.n = n
+        deg = [0] * (n + 1)
+        for u, v, c in edges:
+            if c < 0:
+                raise ValueError(f"edge ({u}, {v}) has negative capacity {c}")
+            if u != v:
+                deg[u + 1] += 1
+                deg[v + 1] += 1
+        for x in range(n):
+            deg[x + 1] += deg[x]
+        head = deg
+        fill = head[:-1]
+        m = head[-1]
+        to = [0] * m
+        rev = [0] * m
+        base = [0] * m
+        for u, v, c in edges:
+            if u == v:
+                continue
+            a, b = fill[u], fill[v]
+            fill[u] += 1
+            fill[v] += 1
+            to[a], to[b] = v, u
+            rev[a], rev[b] = b, a
+            base[a] = base[b] = c
+        self.head, self.to, self.rev, self.base = head, to, rev, base
+        self.cap = list(base)
+
+    def _levels(self, s: int) -> List[int]:
+        head, to, cap = self.head, self.to, self.cap
+        level = [-1] * self.n
+        level[s] = 0
+        q = [s]
+        for u in q:
+            lu = level[u] + 1
+            for e in range(head[u], head[u + 1]):
+                v = to[e]
+                if cap[e] > 0 and level[v] < 0:
+                    level[v] = lu
+                    q.append(v)
+        return level
+
+    def _blocking_flow(self, s: int, t: int, level: List[int]):
+        head, to, cap, rev = self.head, self.to, self.cap, self.rev
+        it = head[:-1]
+        path: List[int] = []
+        total = 0
+        u = s
+        while True:
+            if u == t:
+                f = min(cap[e] for e in path)
+                cut = len(path)
+                for i, e in enumerate(path):
+                    cap[e] -= f
+                    cap[rev[e]] += f
+                    if cap[e] == 0 and i < cut:
+                        cut = i
+                total += f
+                del path[cut:]
+                u = to[path[-1]] if path else s
+                continue
+            i, end, want = it[u], head[u + 1], level[u] + 1
+            while i < end and not (cap[i] > 0 and level[to[i]] == want):
+                i += 1
+            it[u] = i
+            if i < end:
+                path.append(i)
+                u = to[i]
+            elif u == s:
+                return total
+            else:
+                level[u] = -1
+                path.pop()
+                u = to[path[-1]] if path else s
+
+    def min_cut(self, s: int, t: int) -> Tuple[float, bytearray]:
+        """``(value, side)``: ``side[v]`` is 1 for vertices on ``s``'s side."""
+        self.cap[:] = self.base
+        flow = 0
+        while True:
+            level = self._levels(s)
+            if level[t] < 0:
+                return flow, bytearray(1 if x >= 0 else 0 for x in level)
+            flow += self._blocking_flow(s, t, level)
+
+
+class GomoryHuTree(NamedTuple):
+    parent: List[int]     # parent[0] == -1; parent[i] < i otherwise
+    weight: List[float]   # min cut between i and parent[i]
+
+
+_RESIDUAL: Optional[ResidualGraph] = None
+
+
+def _init_worker(n: int, edges: Sequence[Edge]) -> None:
+    global _RESIDUAL
+    _RESIDUAL = ResidualGraph(n, edges)
+
+
+def _solve_pair(pair: Tuple[int, int]) -> Tuple[float, bytes]:
+    value, side = _RESIDUAL.min_cut(*pair)
+    return value, bytes(side)
+
+
+def gomory_hu(n: int, edges: Sequence[Edge], workers: Optional[int] = None,
+              batch: Optional[int] = None) -> GomoryHuTree:
+    """Gusfield's algorithm: n - 1 max-flows on the original graph."""
+    parent = [0] * n
+    weight = [0] * n
+    if n:
+        parent[0] = -1
+    edges = list(edges)
+
+    def apply(i: int, value, side) -> None:
+        weight[i] = value
+        p = parent[i]
+        for j in range(i + 1, n):
+            if side[j] and parent[j] == p:
+                parent[j] = i
+
+    if not workers or workers <= 1:
+        graph = ResidualGraph(n, edges)
+        for i in range(1, n):
+            apply(i, *graph.min_cut(i, parent[i]))
+        return GomoryHuTree(parent, weight)
+
+    batch = batch or 2 * workers
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(n, edges)) as pool:
+        i = 1
+        while i < n:
+            todo = list(range(i, min(n, i + batch)))
+            asked = [parent[j] for j in todo]
+            results = pool.map(_solve_pair, [(j, p) for j, p in zip(todo, asked)])
+            for j, p, (value, side) in zip(todo, asked, results):
+                if parent[j] != p:
+                    break  # re-parented by an earlier cut of this batch: redo
+                apply(j, value, side)
+                i = j + 1
+    return GomoryHuTree(parent, weight)
+
+
+class CutOracle:
+    """O(1) all-pairs min-cut values from a Gomory-Hu tree."""
+
+    def __init__(self, tree: GomoryHuTree) -> None:
+        n = len(tree.parent)
+        self.n = n
+        # Kruskal reconstruction tree: add tree edges heaviest first; each
+        # union creates an internal node carrying that edge's weight.
+        order = sorted(range(1, n), key=lambda i: -tree.weight[i])
+        dsu = list(range(n))
+        top = list(range(n))          # KRT node currently representing a DSU set
+        kparent = [-1] * (2 * n - 1 if n else 0)
+        self.node_weight = [0] * len(kparent)
+        nxt = n
+        for i in order:
+            a, b = i, tree.parent[i]
+            while dsu[a] != a:
+                dsu[a] = dsu[dsu[a]]
+                a = dsu[a]
+            while dsu[b] != b:
+                dsu[b] = dsu[dsu[b]]
+                b = dsu[b]
+            kparent[top[a]] = kparent[top[b]] = nxt
+            self.node_weight[nxt] = tree.weight[i]
+            dsu[a] = b
+            top[b] = nxt
+            nxt += 1
+        self.tree = tree
+        self._build_lca(kparent)
+
+    def _build_lca(self, kparent: List[int]) -> None:
+        size = len(kparent)
+        children: List[List[int]] = [[] for _ in range(size)]
+        roots = []
+        for x, p in enumerate(kparent):
+            (children[p] if p >= 0 else roots).append(x)
+        self.comp = [-1] * size   # which KRT root (tree component) a node is in
+        euler: List[int] = []
+        depth: List[int] = []
+        first = [0] * size
+        for r in roots:
+            stack = [(r, 0, 0)]
+            while stack:
+                x, d, k = stack.pop()
+                if k == 0:
+                    first[x] = len(euler)
+                    self.comp[x] = r
+                euler.append(x)
+                depth.append(d)
+                if k < len(children[x]):
+                    stack.append((x, d, k + 1))
+                    stack.append((children[x][k], d + 1, 0))
+        self.euler, self.first = euler, first
+        # Sparse table of positions with minimum depth.
+        table = [list(range(len(euler)))]
+        span = 1
+        while 2 * span <= len(euler):
+            prev = table[-1]
+            row = []
+            for i in range(len(euler) - 2 * span + 1):
+                a, b = prev[i], prev[i + span]
+                row.append(a if depth[a] <= depth[b] else b)
+            table.append(row)
+            span *= 2
+        self._table, self._depth = table, depth
+
+    def _lca(self, u: int, v: int) -> int:
+        a, b = self.first[u], self.first[v]
+        if a > b:
+            a, b = b, a
+        k = (b - a + 1).bit_length() - 1
+        row = self._table[k]
+        x, y = row[a], row[b - (1 << k) + 1]
+        return self.euler[x if self._depth[x] <= self._depth[y] else y]
+
+    def min_cut(self, u: int, v: int) -> float:
+        """Minimum u-v cut value; ``inf`` for u == v, 0 across components."""
+        if u == v:
+            return float("inf")
+        if self.comp[u] != self.comp[v]:
+            return 0
+        return self.node_weight[self._lca(u, v)]
+
+    def min_cut_by_path(self, u: int, v: int) -> float:
+        """Same answer by walking the Gomory-Hu tree path: O(path length)."""
+        if u == v:
+            return float("inf")
+        parent, weight = self.tree.parent, self.tree.weight
+        best = float("inf")
+        # parent[i] < i, so stepping the larger endpoint up meets at the LCA.
+        while u != v:
+            if u < v:
+                u, v = v, u
+            best = min(best, weight[u])
+            u = parent[u]
+        return best
+
+    def k_edge_classes(self, k: float) -> List[int]:
+        """Label per vertex; equal labels iff edge-connectivity >= k."""
+        parent, weight = self.tree.parent, self.tree.weight
+        label = list(range(self.n))
+        for i in range(1, self.n):  # parent[i] < i: parents are labelled first
+            if weight[i] >= k:
+                label[i] = label[parent[i]]
+        return label
+
+
+def random_graph(n: int, m: int, seed: int = 0) -> List[Edge]:
+    rng = random.Random(seed)
+    edges = [(i, rng.randrange(i), rng.randint(1, 10)) for i in range(1, n)]
+    while len(edges) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((u, v, rng.randint(1, 10)))
+    return edges
+
+
+def benchmark(n: int = 400, m: int = 2000, sample: int = 30) -> None:
+    edges = random_graph(n, m)
+    print(f"n={n} m={m}")
+    t0 = time.perf_counter()
+    graph = ResidualGraph(n, edges)
+    rng = random.Random(1)
+    for _ in range(sample):
+        graph.min_cut(*rng.sample(range(n), 2))
+    per_flow = (time.perf_counter() - t0) / sample
+    print(f"  all-pairs by max-flow (extrapolated) {per_flow * n * (n - 1) / 2:8.2f} s")
+    t0 = time.perf_counter()
+    tree = gomory_hu(n, edges)
+    print(f"  Gusfield tree ({n - 1} flows)          {time.perf_counter() - t0:8.2f} s")
+    t0 = time.perf_counter()
+    par = gomory_hu(n, edges, workers=4)
+    print(f"  Gusfield tree, 4 workers             {time.perf_counter() - t0:8.2f} s")
+    assert par == tree
+    t0 = time.perf_counter()
+    oracle = CutOracle(tree)
+    build = time.perf_counter() - t0
+    pairs = [rng.sample(range(n), 2) for _ in range(100_000)]
+    t0 = time.perf_counter()
+    for u, v in pairs:
+        oracle.min_cut(u, v)
+    print(f"  oracle build {build * 1e3:.1f} ms, 100k queries {time.perf_counter() - t0:.2f} s")
+
+
+def demo():
+    edges = [(0, 1, 1), (0, 2, 7), (1, 2, 1), (1, 3, 3), (1, 4, 2), (2, 4, 4), (3, 4, 1),
+             (3, 5, 6), (4, 5, 2)]
+    tree = gomory_hu(6, edges)
+    print("tree parent:", tree.parent, "weight:", tree.weight)
+    oracle = CutOracle(tree)
+    print("min_cut(0, 5):", oracle.min_cut(0, 5), "by path:", oracle.min_cut_by_path(0, 5))
+    print("3-edge-connected classes:", oracle.k_edge_classes(3))
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
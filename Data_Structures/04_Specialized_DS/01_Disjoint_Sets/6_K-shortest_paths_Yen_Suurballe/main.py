@@ -1,20 +1,387 @@
 """
 Topic: 06_Data Structures — Graph & Connectivity
-Subtopic: Shortest Paths: Dijkstra, Bellman-Ford, A*, Floyd-Warshall, 0-1 BFS, Johnson’s, SPFA, DAG shortest path (topo order)
-Description: pathlib for path ops.
+Subtopic: K-shortest paths (Yen, Suurballe)
+Description: Yen's loopless k-shortest paths with shortest-path-tree reuse,
+plus Suurballe's edge-disjoint pair.
 
-TODO:
-- Read the README.md in this folder.
-- Run this file to see examples, then extend experiments.
+Yen normally runs a full Dijkstra for every spur node. Here one reverse
+Dijkstra from the target builds a shortest-path tree (SPT) that is reused by
+every spur search in two ways:
+
+* ``dist_to_t`` is an exact-on-the-original-graph, consistent A* heuristic, and
+  removing edges/nodes only makes it a looser lower bound;
+* as soon as the spur search settles a vertex whose SPT path to ``t`` avoids
+  every blocked node and edge, the rest of the spur path is read off the tree.
+
+Candidates sit in a lazily consumed heap (``iter_k_shortest`` is a generator),
+each path remembers its deviation index so only new spur nodes are expanded
+(Lawler), and duplicates are rejected by hashing the vertex tuple.
+
+Run ``python main.py`` for the demo or ``python main.py --bench`` for timings.
 """
 from __future__ import annotations
-from typing import *
-import sys, os, math, json, re, pathlib, itertools, collections, functools, logging, datetime
-# Optional third-party (uncomment if installed)
-# import numpy as np
-# import pandas as pd
-from pathlib import Path
+
+import heapq
+import itertools
+import random
+import sys
+import time
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+INF = float("inf")
+
+Path = Tuple[int, ...]
+
+
+class Digraph:
+    """Weighted digraph in CSR form with its reverse kept alongside."""
+
+    def __init__(self, n: int, edges: Iterable[Tuple[int, int, float]]) -> None:
+        self.n = n
+        edge_list = list(edges)
+        self.off, self.to, self.w = self._csr(n, ((u, v, w) for u, v, w in edge_list))
+        self.roff, self.rto, self.rw = self._csr(n, ((v, u, w) for u, v, w in edge_list))
+
+    @staticmethod
+    def _csr(n: int, edges: Iterable[Tuple[int, int, float]]):
+        edges = list(edges)
+        off = array("q", bytes(8 * (n + 1)))
+        for u, _, w in edges:
+            if w < 0:
+                raise ValueError("edge weights must be non-negative")
+            off[u + 1] += 1
+        for u in range(n):
+            off[u + 1] += off[u]
+        fill = off[:-1]
+        to = array("q", bytes(8 * len(edges)))
+        wt = [0.0] * len(edges)
+        for u, v, w in edges:
+            p = fill[u]
+            to[p] = v
+            wt[p] = w
+            fill[u] = p + 1
+        return off, to, wt
+
+    def dijkstra(self, source: int, reverse: bool = False) -> Tuple[List[float], List[int]]:
+        """Distances and predecessor links (successor links when ``reverse``)."""
+        off, to, wt = (self.roff, self.rto, self.rw) if reverse else (self.off, self.to, self.w)
+        dist = [INF] * self.n
+        link = [-1] * self.n
+        dist[source] = 0
+        pq = [(0, source)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            for i in range(off[u], off[u + 1]):
+                v = to[i]
+                nd = d + wt[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    link[v] = u
+                    heapq.heappush(pq, (nd, v))
+        return dist, link
+
+
+class _SpurSearch:
+    """A* spur searches that share the reverse SPT of one target."""
+
+    def __init__(self, g: Digraph, t: int) -> None:
+        self.g = g
+        self.t = t
+        self.dist_t, self.nxt = g.dijkstra(t, reverse=True)
+        n = g.n
+        self._epoch = 0
+        self._blocked = [0] * n
+        self._seen = [0] * n
+        self._g = [INF] * n
+        self._parent = [-1] * n
+        self._clean_at = [0] * n
+        self._clean = [False] * n
+        self.settled = 0
+
+    def _tree_clean(self, u: int, ep: int) -> bool:
+        """Does the SPT path ``u -> t`` avoid every blocked vertex?"""
+        blocked, clean_at, clean, nxt, t = self._blocked, self._clean_at, self._clean, self.nxt, self.t
+        walk = []
+        v = u
+        ok = True
+        while True:
+            if clean_at[v] == ep:
+                ok = clean[v]
+                break
+            if blocked[v] == ep:
+                ok = False
+                break
+            walk.append(v)
+            if v == t:
+                break
+            v = nxt[v]
+        for x in walk:
+            clean_at[x] = ep
+            clean[x] = ok
+        return ok
+
+    def run(self, spur: int, blocked_nodes: Sequence[int], banned_next: Set[int]
+            ) -> Optional[Tuple[float, List[int], List[float]]]:
+        """Cheapest loopless spur path, as (cost, vertices, cumulative costs)."""
+        g, t, dist_t, nxt = self.g, self.t, self.dist_t, self.nxt
+        if dist_t[spur] == INF:
+            return None
+        self._epoch += 1
+        ep = self._epoch
+        blocked, seen, gval, parent = self._blocked, self._seen, self._g, self._parent
+        for v in blocked_nodes:
+            blocked[v] = ep
+        off, to, wt = g.off, g.to, g.w
+        seen[spur] = ep
+        gval[spur] = 0
+        parent[spur] = -1
+        pq = [(dist_t[spur], spur)]
+        while pq:
+            f, u = heapq.heappop(pq)
+            gu = gval[u]
+            if f > gu + dist_t[u]:
+                continue
+            self.settled += 1
+            if u == t:
+                return self._assemble(spur, u, ep)
+            if u != spur:
+                if self._tree_clean(u, ep):
+                    return self._assemble(spur, u, ep)
+            elif nxt[u] not in banned_next and self._tree_clean(nxt[u], ep):
+                # The spur is blocked for re-entry, so its own tree path is
+                # tested from the successor onwards.
+                return self._assemble(spur, u, ep)
+            for i in range(off[u], off[u + 1]):
+                v = to[i]
+                if blocked[v] == ep or (u == spur and v in banned_next):
+                    continue
+                hv = dist_t[v]
+                if hv == INF:
+                    continue
+                nd = gu + wt[i]
+                if seen[v] != ep or nd < gval[v]:
+                    seen[v] = ep
+                    gval[v] = nd
+                    parent[v] = u
+                    heapq.heappush(pq, (nd + hv, v))
+        return None
+
+    def _assemble(self, spur: int, u: int, ep: int) -> Tuple[float, List[int], List[float]]:
+        head = []
+        v = u
+        while v != -1:
+            head.append(v)
+            v = self._parent[v]
+        head.reverse()
+        gval, dist_t, nxt = self._g, self.dist_t, self.nxt
+        cum = [gval[v] for v in head]
+        base = gval[u] + dist_t[u]
+        v = u
+        while v != self.t:
+            v = nxt[v]
+            head.append(v)
+            cum.append(base - dist_t[v])
+        return base, head, cum
+
+
+def iter_k_shortest(g: Digraph, s: int, t: int) -> Iterator[Tuple[float, List[int]]]:
+    """Yield loopless ``s -> t`` paths in non-decreasing cost order."""
+    spur = _SpurSearch(g, t)
+    if spur.dist_t[s] == INF:
+        return
+    first = spur.run(s, (), set())
+    if first is None:
+        return
+    tie = itertools.count()
+    cost, path, cum = first
+    candidates = [(cost, next(tie), tuple(path), tuple(cum), 0)]
+    seen_paths = {candidates[0][2]}
+    accepted: List[Path] = []
+    while candidates:
+        cost, _, path, cum, dev = heapq.heappop(candidates)
+        accepted.append(path)
+        yield cost, list(path)
+        # Lawler: spur nodes before the deviation index were expanded by the parent.
+        for i in range(dev, len(path) - 1):
+            root = path[: i + 1]
+            banned = {p[i + 1] for p in accepted if len(p) > i + 1 and p[: i + 1] == root}
+            found = spur.run(path[i], root, banned)
+            if found is None:
+                continue
+            spur_cost, spur_path, spur_cum = found
+            new_path = root[:-1] + tuple(spur_path)
+            if new_path in seen_paths:
+                continue
+            seen_paths.add(new_path)
+            root_cost = cum[i]
+            new_cum = cum[:i] + tuple(root_cost + c for c in spur_cum)
+            heapq.heappush(candidates, (root_cost + spur_cost, next(tie), new_path, new_cum, i))
+
+
+def yen_k_shortest(g: Digraph, s: int, t: int, k: int) -> List[Tuple[float, List[int]]]:
+    """The ``k`` cheapest loopless paths (fewer if the graph has fewer)."""
+    return list(itertools.islice(iter_k_shortest(g, s, t), k))
+
+
+def suurballe(g: Digraph, s: int, t: int) -> Optional[Tuple[float, List[int], List[int]]]:
+    """Two edge-disjoint ``s -> t`` paths of minimum total cost.
+
+    Runs two Dijkstra passes on the reduced-cost residual graph (a two-unit
+    min-cost flow), then cancels opposite arcs and splits the flow into paths.
+    """
+    n = g.n
+    # Residual arcs: forward arc 2e, reverse arc 2e + 1.
+    tail, head, cost, cap = [], [], [], []
+    for u in range(n):
+        for i in range(g.off[u], g.off[u + 1]):
+            v, w = g.to[i], g.w[i]
+            tail += (u, v); head += (v, u); cost += (w, -w); cap += (1, 0)
+    out: List[List[int]] = [[] for _ in range(n)]
+    for e, u in enumerate(tail):
+        out[u].append(e)
+    pot, _ = g.dijkstra(s)
+    if pot[t] == INF:
+        return None
+    total = 0
+    for _ in range(2):
+        dist = [INF] * n
+        via = [-1] * n
+        dist[s] = 0
+        pq = [(0.0, s)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            for e in out[u]:
+                if cap[e]:
+                    v = head[e]
+                    if pot[v] == INF:
+                        continue
+                    nd = d + cost[e] + pot[u] - pot[v]
+                    if nd < dist[v] - 1e-12:
+                        dist[v] = nd
+                        via[v] = e
+                        heapq.heappush(pq, (nd, v))
+        if dist[t] == INF:
+            return None
+        v = t
+        while v != s:
+            e = via[v]
+            cap[e] -= 1
+            cap[e ^ 1] += 1
+            total += cost[e]
+            v = tail[e]
+        for v in range(n):
+            if dist[v] < INF:
+                pot[v] += dist[v]
+    used: List[List[int]] = [[] for _ in range(n)]
+    for e in range(0, len(tail), 2):
+        if cap[e] == 0:
+            used[tail[e]].append(head[e])
+    paths = []
+    for _ in range(2):
+        p = [s]
+        while p[-1] != t:
+            p.append(used[p[-1]].pop())
+        paths.append(p)
+    return total, paths[0], paths[1]
+
+
+def _yen_naive(g: Digraph, s: int, t: int, k: int) -> List[Tuple[float, List[int]]]:
+    """Textbook Yen: a fresh Dijkstra per spur node (benchmark baseline)."""
+
+    def dijkstra(src, blocked, banned):
+        dist = {src: 0}
+        par = {src: -1}
+        pq = [(0, src)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            if u == t:
+                break
+            for i in range(g.off[u], g.off[u + 1]):
+                v = g.to[i]
+                if v in blocked or (u, v) in banned:
+                    continue
+                nd = d + g.w[i]
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    par[v] = u
+                    heapq.heappush(pq, (nd, v))
+        if t not in dist:
+            return None
+        p = [t]
+        while p[-1] != src:
+            p.append(par[p[-1]])
+        return dist[t], p[::-1]
+
+    def cost_of(p):
+        c = 0
+        for a, b in zip(p, p[1:]):
+            c += min(g.w[i] for i in range(g.off[a], g.off[a + 1]) if g.to[i] == b)
+        return c
+
+    best = dijkstra(s, set(), set())
+    if best is None:
+        return []
+    A = [best]
+    B: List[Tuple[float, List[int]]] = []
+    while len(A) < k:
+        prev = A[-1][1]
+        for i in range(len(prev) - 1):
+            root = prev[: i + 1]
+            banned = {(p[i], p[i + 1]) for _, p in A if p[: i + 1] == root}
+            spur = dijkstra(prev[i], set(root[:-1]), banned)
+            if spur is None:
+                continue
+            cand = root[:-1] + spur[1]
+            entry = (cost_of(cand), cand)
+            if entry not in B and all(cand != p for _, p in A):
+                B.append(entry)
+        if not B:
+            break
+        B.sort()
+        A.append(B.pop(0))
+    return A
+
+
+def random_graph(n: int, m: int, seed: int = 0) -> Digraph:
+    rng = random.Random(seed)
+    edges = [(i, i + 1, rng.randint(1, 20)) for i in range(n - 1)]
+    edges += [(rng.randrange(n), rng.randrange(n), rng.randint(1, 20)) for _ in range(m - n + 1)]
+    return Digraph(n, [(u, v, w) for u, v, w in edges if u != v])
+
+
+def benchmark(n: int = 3000, m: int = 15000, k: int = 50) -> None:
+    g = random_graph(n, m)
+    s, t = 0, n - 1
+    t0 = time.perf_counter()
+    fast = yen_k_shortest(g, s, t, k)
+    t_fast = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    slow = _yen_naive(g, s, t, k)
+    t_slow = time.perf_counter() - t0
+    assert [c for c, _ in fast] == [c for c, _ in slow]
+    print(f"n={n} m={m} k={k}")
+    print(f"  naive Yen            {1000 * t_slow:8.1f} ms")
+    print(f"  SPT-reuse Yen        {1000 * t_fast:8.1f} ms  x{t_slow / t_fast:.1f}")
+
+
 def demo():
-    p=Path("."); print([str(x) for x in p.iterdir()][:3])
+    edges = [(0, 1, 3), (0, 2, 2), (1, 3, 4), (2, 1, 1), (2, 3, 2), (2, 4, 3),
+             (3, 4, 2), (3, 5, 1), (4, 5, 2)]
+    g = Digraph(6, edges)
+    for cost, path in yen_k_shortest(g, 0, 5, 4):
+        print("yen:", cost, path)
+    print("suurballe:", suurballe(g, 0, 5))
+
+
 if __name__ == "__main__":
-    demo()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()
@@ -1,5 +1,504 @@
-def solve():
-    # Implement here
-    pass
-if __name__=="__main__":
-    print("Stub for this sub-topic.")
+"""
+Topic: 06_Data Structures — Graph & Connectivity
+Subtopic: Planarity testing (Hopcroft-Tarjan / left-right criterion)
+Description: Linear-time left-right (LR) planarity test with a combinatorial
+embedding for planar graphs and a Kuratowski subgraph otherwise.
+
+This follows Brandes' presentation of de Fraysseix-Rosenstiehl's LR
+criterion, with all three depth-first passes driven by explicit stacks:
+
+1. orientation: DFS orients every edge, computing ``lowpt``, ``lowpt2`` and a
+   nesting depth per edge;
+2. testing: out-edges are visited by nesting depth while a stack of conflict
+   pairs (left/right intervals of return edges) is merged and trimmed; an
+   unresolvable conflict means the graph is not planar;
+3. embedding: the left/right side of every back edge (resolved through the
+   ``ref`` chains) fixes a clockwise order of neighbours around each vertex.
+
+Edges live in flat per-edge lists indexed by edge id and the adjacency is a
+CSR array, so the whole test is O(n + m). Graphs with more than ``3n - 6``
+edges are rejected before any search.
+
+The Kuratowski witness is found by deleting edges while the rest stays
+non-planar, in halving blocks. What remains is a subdivision of K5 or K3,3,
+but it takes O(k log m) planarity tests for a witness of ``k`` edges, i.e.
+O(k m log m) time: seconds for a few thousand vertices, minutes at 10**4. It
+is therefore opt-in (``planarity(..., witness=True)``); by default a
+non-planar graph costs one linear-time test and yields ``None``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Embedding(NamedTuple):
+    rotation: List[List[int]]   # neighbours of each vertex in clockwise order
+
+
+class KuratowskiWitness(NamedTuple):
+    kind: str                     # "K5" or "K3,3"
+    edges: List[Tuple[int, int]]  # a subdivision of ``kind`` in the input graph
+
+
+class _LR:
+    """State for one run of the LR algorithm on a simple undirected graph."""
+
+    def __init__(self, n: int, edges: Sequence[Tuple[int, int]]) -> None:
+        self.n = n
+        self.m = m = len(edges)
+        self.ends = edges
+        head = [0] * (n + 1)
+        for u, v in edges:
+            head[u + 1] += 1
+            head[v + 1] += 1
+        for x in range(n):
+            head[x + 1] += head[x]
+        fill = head[:-1]
+        adj = [0] * (2 * m)
+        eid = [0] * (2 * m)
+        for e, (u, v) in enumerate(edges):
+            adj[fill[u]], eid[fill[u]] = v, e
+            fill[u] += 1
+            adj[fill[v]], eid[fill[v]] = u, e
+            fill[v] += 1
+        self.head, self.adj, self.eid = head, adj, eid
+        self.src = [0] * m
+        self.dst = [0] * m
+        self.height = [-1] * n
+        self.parent_edge = [-1] * n
+        self.lowpt = [0] * m
+        self.lowpt2 = [0] * m
+        self.nesting = [0] * m
+        self.out: List[List[int]] = [[] for _ in range(n)]
+        self.roots: List[int] = []
+        self.ref = [-1] * m
+        self.side = [1] * m
+        self.lowpt_edge = [-1] * m
+        self.stack_bottom: List[Optional[list]] = [None] * m
+
+    # ------------------------------------------------------------ phase 1
+    def orient(self) -> None:
+        head, adj, eid = self.head, self.adj, self.eid
+        src, dst, height, parent_edge = self.src, self.dst, self.height, self.parent_edge
+        lowpt, lowpt2, nesting, out = self.lowpt, self.lowpt2, self.nesting, self.out
+        oriented = bytearray(self.m)
+        it = head[:-1]
+
+        def finish(e: int) -> None:
+            v = src[e]
+            nd = 2 * lowpt[e]
+            if lowpt2[e] < height[v]:
+                nd += 1  # chordal edge
+            nesting[e] = nd
+            pe = parent_edge[v]
+            if pe >= 0:
+                if lowpt[e] < lowpt[pe]:
+                    lowpt2[pe] = min(lowpt[pe], lowpt2[e])
+                    lowpt[pe] = lowpt[e]
+                elif lowpt[e] > lowpt[pe]:
+                    lowpt2[pe] = min(lowpt2[pe], lowpt[e])
+                else:
+                    lowpt2[pe] = min(lowpt2[pe], lowpt2[e])
+
+        for root in range(self.n):
+            if height[root] >= 0:
+                continue
+            height[root] = 0
+            self.roots.append(root)
+            stack = [root]
+            while stack:
+                v = stack[-1]
+                k = it[v]
+                if k < head[v + 1]:
+                    it[v] = k + 1
+                    e = eid[k]
+                    if oriented[e]:
+                        continue
+                    oriented[e] = 1
+                    w = adj[k]
+                    src[e], dst[e] = v, w
+                    out[v].append(e)
+                    lowpt[e] = lowpt2[e] = height[v]
+                    if height[w] < 0:
+                        parent_edge[w] = e
+                        height[w] = height[v] + 1
+                        stack.append(w)  # ``e`` is finished when ``w`` is
+                        continue
+                    lowpt[e] = height[w]
+                    finish(e)
+                else:
+                    stack.pop()
+                    if parent_edge[v] >= 0:
+                        finish(parent_edge[v])
+        for lst in out:
+            lst.sort(key=nesting.__getitem__)
+
+    # ------------------------------------------------------------ phase 2
+    # A conflict pair is a list [left.low, left.high, right.low, right.high]
+    # of edge ids, -1 for "none"; an interval is empty iff its high is -1.
+    def _conflicting(self, low: int, high: int, b: int) -> bool:
+        return high >= 0 and self.lowpt[high] > self.lowpt[b]
+
+    def _lowest(self, p: list) -> int:
+        lowpt = self.lowpt
+        if p[1] < 0:
+            return lowpt[p[2]]
+        if p[3] < 0:
+            return lowpt[p[0]]
+        return min(lowpt[p[0]], lowpt[p[2]])
+
+    def _add_constraints(self, S: list, ei: int, e: int) -> bool:
+        lowpt, ref = self.lowpt, self.ref
+        P = [-1, -1, -1, -1]
+        bottom = self.stack_bottom[ei]
+        # Merge the return edges of ``ei`` into P.right.
+        while True:
+            Q = S.pop()
+            if Q[1] >= 0:
+                Q[0], Q[1], Q[2], Q[3] = Q[2], Q[3], Q[0], Q[1]
+            if Q[1] >= 0:
+                return False
+            if lowpt[Q[2]] > lowpt[e]:
+                if P[3] < 0:
+                    P[3] = Q[3]
+                else:
+                    ref[P[2]] = Q[3]
+                P[2] = Q[2]
+            else:
+                ref[Q[2]] = self.lowpt_edge[e]
+            if (S[-1] if S else None) is bottom:
+                break
+        # Merge conflicting return edges of earlier siblings into P.left.
+        while S and (self._conflicting(S[-1][0], S[-1][1], ei)
+                     or self._conflicting(S[-1][2], S[-1][3], ei)):
+            Q = S.pop()
+            if self._conflicting(Q[2], Q[3], ei):
+                Q[0], Q[1], Q[2], Q[3] = Q[2], Q[3], Q[0], Q[1]
+            if self._conflicting(Q[2], Q[3], ei):
+                return False
+            ref[P[2]] = Q[3]
+            if Q[2] >= 0:
+                P[2] = Q[2]
+            if P[1] < 0:
+                P[1] = Q[1]
+            else:
+                ref[P[0]] = Q[1]
+            P[0] = Q[0]
+        if P[1] >= 0 or P[3] >= 0:
+            S.append(P)
+        return True
+
+    def _trim_back_edges(self, S: list, u: int) -> None:
+        height, dst, ref, side = self.height, self.dst, self.ref, self.side
+        hu = height[u]
+        while S and self._lowest(S[-1]) == hu:
+            P = S.pop()
+            if P[0] >= 0:
+                side[P[0]] = -1
+        if not S:
+            return
+        P = S[-1]
+        while P[1] >= 0 and dst[P[1]] == u:
+            P[1] = ref[P[1]]
+        if P[1] < 0 and P[0] >= 0:
+            ref[P[0]] = P[2]
+            side[P[0]] = -1
+            P[0] = -1
+        while P[3] >= 0 and dst[P[3]] == u:
+            P[3] = ref[P[3]]
+        if P[3] < 0 and P[2] >= 0:
+            ref[P[2]] = P[0]
+            side[P[2]] = -1
+            P[2] = -1
+
+    def test(self) -> bool:
+        height, parent_edge, lowpt, dst, src = self.height, self.parent_edge, self.lowpt, self.dst, self.src
+        out, ref, lowpt_edge, stack_bottom = self.out, self.ref, self.lowpt_edge, self.stack_bottom
+        S: list = []
+        idx = [0] * self.n
+        descended = bytearray(self.m)
+        for root in self.roots:
+            stack = [root]
+            while stack:
+                v = stack[-1]
+                i = idx[v]
+                adjs = out[v]
+                if i < len(adjs):
+                    ei = adjs[i]
+                    if not descended[ei]:
+                        stack_bottom[ei] = S[-1] if S else None
+                        w = dst[ei]
+                        if ei == parent_edge[w]:
+                            descended[ei] = 1
+                            stack.append(w)
+                            continue
+                        lowpt_edge[ei] = ei
+                        S.append([-1, -1, ei, ei])
+                    if lowpt[ei] < height[v]:
+                        e = parent_edge[v]
+                        if i == 0:
+                            lowpt_edge[e] = lowpt_edge[ei]
+                        elif not self._add_constraints(S, ei, e):
+                            return False
+                    idx[v] = i + 1
+                    continue
+                stack.pop()
+                e = parent_edge[v]
+                if e < 0:
+                    continue
+                u = src[e]
+                self._trim_back_edges(S, u)
+                if lowpt[e] < height[u] and S:
+                    hl, hr = S[-1][1], S[-1][3]
+                    if hl >= 0 and (hr < 0 or lowpt[hl] > lowpt[hr]):
+                        ref[e] = hl
+                    else:
+                        ref[e] = hr
+        return True
+
+    # ------------------------------------------------------------ phase 3
+    def _sign(self, e: int) -> int:
+        ref, side = self.ref, self.side
+        chain = []
+        while ref[e] >= 0:
+            chain.append(e)
+            e = ref[e]
+        s = side[e]
+        for x in reversed(chain):
+            s = side[x] = side[x] * s
+            ref[x] = -1
+        return s
+
+    def embed(self) -> Embedding:
+        n, m = self.n, self.m
+        src, dst, parent_edge, out, nesting = self.src, self.dst, self.parent_edge, self.out, self.nesting
+        for e in range(m):
+            nesting[e] *= self._sign(e)
+        for lst in out:
+            lst.sort(key=nesting.__getitem__)
+        # Half-edge 2e sits at src[e] and points to dst[e]; 2e + 1 is its twin.
+        cw = [0] * (2 * m)
+        ccw = [0] * (2 * m)
+        first = [-1] * n
+
+        def insert_cw(v: int, h: int, ref_h: int) -> None:
+            """Put ``h`` clockwise right after ``ref_h`` around ``v``."""
+            if ref_h < 0:
+                cw[h] = ccw[h] = h
+                first[v] = h
+                return
+            nxt = cw[ref_h]
+            cw[ref_h] = h
+            cw[h] = nxt
+            ccw[nxt] = h
+            ccw[h] = ref_h
+
+        def insert_ccw(v: int, h: int, ref_h: int) -> None:
+            if ref_h < 0:
+                insert_cw(v, h, -1)
+                return
+            insert_cw(v, h, ccw[ref_h])
+            if first[v] == ref_h:
+                first[v] = h
+
+        for v in range(n):
+            prev = -1
+            for e in out[v]:
+                insert_cw(v, 2 * e, prev)
+                prev = 2 * e
+        left_ref = [-1] * n
+        right_ref = [-1] * n
+        idx = [0] * n
+        for root in self.roots:
+            stack = [root]
+            while stack:
+                v = stack[-1]
+                i = idx[v]
+                if i == len(out[v]):
+                    stack.pop()
+                    continue
+                idx[v] = i + 1
+                e = out[v][i]
+                w = dst[e]
+                if e == parent_edge[w]:
+                    insert_ccw(w, 2 * e + 1, first[w])
+                    left_ref[v] = right_ref[v] = 2 * e
+                    stack.append(w)
+                elif self.side[e] == 1:
+                    insert_cw(w, 2 * e + 1, right_ref[w])
+                else:
+                    insert_ccw(w, 2 * e + 1, left_ref[w])
+                    left_ref[w] = 2 * e + 1
+        rotation: List[List[int]] = [[] for _ in range(n)]
+        for v in range(n):
+            h = first[v]
+            if h < 0:
+                continue
+            start = h
+            while True:
+                e = h >> 1
+                rotation[v].append(dst[e] if h & 1 == 0 else src[e])
+                h = cw[h]
+                if h == start:
+                    break
+        return Embedding(rotation)
+
+
+def _simple_edges(edges: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Drop self-loops and parallel copies; neither affects planarity."""
+    seen = set()
+    out = []
+    for u, v in edges:
+        if u == v:
+            continue
+        key = (u, v) if u < v else (v, u)
+        if key not in seen:
+            seen.add(key)
+            out.append(key)
+    return out
+
+
+def is_planar(n: int, edges: Sequence[Tuple[int, int]]) -> bool:
+    """LR test only (phases 1-2), without building an embedding."""
+    edges = _simple_edges(edges)
+    if n >= 3 and len(edges) > 3 * n - 6:
+        return False
+    lr = _LR(n, edges)
+    lr.orient()
+    return lr.test()
+
+
+def _kuratowski(n: int, edges: List[Tuple[int, int]]) -> KuratowskiWitness:
+    keep = list(edges)
+    block = max(1, len(keep) // 2)
+    while True:
+        i = 0
+        while i < len(keep):
+            trial = keep[:i] + keep[i + block:]
+            if not is_planar(n, trial):
+                keep = trial
+            else:
+                i += block
+        if block == 1:
+            break
+        block = max(1, block // 2)
+    deg = {}
+    for u, v in keep:
+        deg[u] = deg.get(u, 0) + 1
+        deg[v] = deg.get(v, 0) + 1
+    branch = sum(1 for d in deg.values() if d > 2)
+    return KuratowskiWitness("K5" if branch == 5 else "K3,3", keep)
+
+
+def planarity(n: int, edges: Sequence[Tuple[int, int]], witness: bool = False):
+    """An ``Embedding`` if the graph is planar, else ``None``.
+
+    With ``witness`` a non-planar graph yields a ``KuratowskiWitness``
+    instead, at O(k m log m) cost (see the module docstring).
+    """
+    simple = _simple_edges(edges)
+    if n >= 3 and len(simple) > 3 * n - 6:
+        return _kuratowski(n, simple) if witness else None
+    lr = _LR(n, simple)
+    lr.orient()
+    if not lr.test():
+        return _kuratowski(n, simple) if witness else None
+    return lr.embed()
+
+
+def count_faces(rotation: List[List[int]]) -> int:
+    """Faces traced by the rotation system (V - E + F = 1 + components if planar)."""
+    pos = [{w: i for i, w in enumerate(nbrs)} for nbrs in rotation]
+    seen = set()
+    faces = 0
+    for u, nbrs in enumerate(rotation):
+        for v in nbrs:
+            if (u, v) in seen:
+                continue
+            faces += 1
+            a, b = u, v
+            while (a, b) not in seen:
+                seen.add((a, b))
+                around = rotation[b]
+                a, b = b, around[(pos[b][a] + 1) % len(around)]
+    return faces
+
+
+def triangulated_grid(side: int, seed: int = 0) -> Tuple[int, List[Tuple[int, int]]]:
+    """``side x side`` grid with one random diagonal per cell (planar)."""
+    rng = random.Random(seed)
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            v = r * side + c
+            if c + 1 < side:
+                edges.append((v, v + 1))
+            if r + 1 < side:
+                edges.append((v, v + side))
+            if r + 1 < side and c + 1 < side:
+                edges.append((v, v + side + 1) if rng.random() < 0.5 else (v + 1, v + side))
+    rng.shuffle(edges)
+    return side * side, edges
+
+
+def benchmark(sides: Sequence[int] = (100, 316, 1000), witness_sides: Sequence[int] = (20, 30, 45)) -> None:
+    print("planar (triangulated grid):")
+    for side in sides:
+        n, edges = triangulated_grid(side)
+        t0 = time.perf_counter()
+        ok = is_planar(n, edges)
+        test = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        emb = planarity(n, edges)
+        full = time.perf_counter() - t0
+        assert ok and isinstance(emb, Embedding)
+        print(f"  n={n:>9} m={len(edges):>9}: test {test:7.2f} s, with embedding {full:7.2f} s "
+              f"({full / n * 1e6:.1f} us/vertex)")
+    print("non-planar (triangulated grid + 3 long edges):")
+    for side in sorted(set(sides) | set(witness_sides)):
+        n, edges = _nonplanar_grid(side)
+        t0 = time.perf_counter()
+        ok = is_planar(n, edges)
+        test = time.perf_counter() - t0
+        line = f"  n={n:>9} m={len(edges):>9}: test {test:7.2f} s"
+        assert not ok
+        if side in witness_sides:
+            t0 = time.perf_counter()
+            w = planarity(n, edges, witness=True)
+            line += f", Kuratowski witness {time.perf_counter() - t0:7.2f} s ({w.kind}, {len(w.edges)} edges)"
+        print(line)
+
+
+def _nonplanar_grid(side: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """Triangulated grid plus three edges between far-apart interior vertices."""
+    n, edges = triangulated_grid(side)
+    rng = random.Random(side)
+    inner = [r * side + c for r in range(1, side - 1) for c in range(1, side - 1)]
+    while True:
+        extra = [tuple(rng.sample(inner, 2)) for _ in range(3)]
+        if not is_planar(n, edges + extra):
+            return n, edges + extra
+
+
+def demo():
+    cube = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4),
+            (0, 4), (1, 5), (2, 6), (3, 7)]
+    emb = planarity(8, cube)
+    print("cube rotation:", emb.rotation)
+    print("cube faces:", count_faces(emb.rotation))
+    k5 = [(u, v) for u in range(5) for v in range(u + 1, 5)]
+    print("K5 planar?", planarity(5, k5) is not None, "witness:", planarity(5, k5, witness=True).kind)
+    petersen = [(i, (i + 1) % 5) for i in range(5)] + [(i, i + 5) for i in range(5)] + \
+               [(5 + i, 5 + (i + 2) % 5) for i in range(5)]
+    w = planarity(10, petersen, witness=True)
+    print("Petersen:", w.kind, "witness with", len(w.edges), "edges")
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        demo()